@@ -0,0 +1,101 @@
+"""
+Micro-benchmark: single-pass search-card extraction vs. the BeautifulSoup
+select()/select_one() loop it replaced.
+
+Run from backend/:
+    python -m benchmarks.bench_card_parser [--pages 25] [--repeat 5]
+"""
+import argparse
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from platforms.linkedin.parsers.card_parser import extract_search_cards
+
+FIXTURE = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures" / "search_page.html"
+
+
+def legacy_extract(html: str) -> list:
+    """The per-<li> CSS query loop previously inlined in linkedin_bulk_scraper_test."""
+    soup = BeautifulSoup(html, "html.parser")
+    cards = []
+    for job_li_element in soup.select("li"):
+        link_element = job_li_element.select_one('a.base-card__full-link')
+        if not link_element:
+            link_element = job_li_element.select_one('a[data-tracking-control-name="public_jobs_jserp-result_search-card"]')
+        job_url = link_element["href"] if link_element else None
+
+        job_id = None
+        if job_url:
+            match = re.search(r'-(\d+)\?', job_url)
+            if not match:
+                match = re.search(r'-(\d+)$', job_url.split('?')[0])
+            if match:
+                job_id = match.group(1)
+
+        title_element = job_li_element.select_one("h3.base-search-card__title")
+        company_element = job_li_element.select_one("h4.base-search-card__subtitle > a")
+        if not company_element:
+            company_element = job_li_element.select_one("h4.base-search-card__subtitle")
+        location_element = job_li_element.select_one("span.job-search-card__location")
+        time_element = job_li_element.select_one("time.job-search-card__listdate")
+        actively_hiring_element = job_li_element.select_one("span.job-posting-benefits__text")
+
+        cards.append({
+            "company": company_element.text.strip() if company_element else None,
+            "title": title_element.text.strip() if title_element else None,
+            "location": location_element.text.strip() if location_element else None,
+            "date_posted": time_element.text.strip() if time_element else None,
+            "publication_date": time_element["datetime"] if time_element and time_element.has_attr("datetime") else None,
+            "job_id": job_id,
+            "job_url": job_url,
+            "actively_hiring": actively_hiring_element.text.strip() if actively_hiring_element else None,
+        })
+    return cards
+
+
+def best_of(fn, html, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn(html)
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--pages", type=int, default=25, help="Result pages parsed per run")
+    arg_parser.add_argument("--repeat", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    page = FIXTURE.read_text()
+
+    # Both implementations must agree before timing means anything
+    new_cards = extract_search_cards(page)
+    for old, new in zip(legacy_extract(page), new_cards):
+        for key, value in old.items():
+            assert new[key] == value, f"{key}: {new[key]!r} != {value!r}"
+
+    def run_legacy(html):
+        for _ in range(args.pages):
+            legacy_extract(html)
+
+    def run_new(html):
+        for _ in range(args.pages):
+            extract_search_cards(html)
+
+    legacy = best_of(run_legacy, page, args.repeat)
+    new = best_of(run_new, page, args.repeat)
+    cards = len(new_cards) * args.pages
+
+    print(f"{args.pages} pages, {cards} cards (best of {args.repeat})")
+    print(f"  BeautifulSoup select : {legacy * 1000:8.1f} ms  ({legacy / cards * 1e6:6.1f} µs/card)")
+    print(f"  single-pass tokenizer: {new * 1000:8.1f} ms  ({new / cards * 1e6:6.1f} µs/card)")
+    print(f"  speedup              : {legacy / new:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Re-scraping a search with change detection (only_changes) vs. re-sending every job.
+
+A first scrape streams --jobs jobs; the re-scrape streams the same jobs with
+--changed of them edited (salary or a description line). Reports the frames
+and bytes sent to the client for the re-scrape and the per-job check time.
+
+Run from backend/:
+    python -m benchmarks.bench_change_detection [--jobs 5000] [--changed 0.05]
+"""
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+
+from shared.types.job_record import dumps_frame
+from shared.utils.change_detection import ChangeTracker, only_changes
+
+WORDS = ("build operate services scale customers collaborate product design roadmap review mentoring "
+         "incident response delivery benefits health dental vision equity learning budget python "
+         "kubernetes terraform postgres kafka react typescript analytics reliability security").split()
+
+
+def make_jobs(count: int) -> list:
+    rng = random.Random(40)
+    jobs = []
+    for i in range(count):
+        lines = [" ".join(rng.choices(WORDS, k=14)) for _ in range(25)]
+        jobs.append({
+            "job_id": str(4_300_000_000 + i),
+            "title": f"Engineer {i % 97}",
+            "company": f"Company {i % 211}",
+            "location": "Seattle, WA",
+            "salary": f"${rng.randrange(90, 200)}K/yr",
+            "applicants": f"{rng.randrange(1, 200)} applicants",
+            "description": "\n".join(lines),
+        })
+    return jobs
+
+
+def rescrape(jobs: list, changed: float) -> list:
+    rng = random.Random(1040)
+    jobs = [dict(job, applicants=f"{rng.randrange(1, 200)} applicants") for job in jobs]  # Always moves
+    for job in rng.sample(jobs, int(len(jobs) * changed)):
+        if rng.random() < 0.5:
+            job["salary"] = f"${rng.randrange(90, 200)}K/yr"
+        else:
+            job["description"] += "\n" + " ".join(rng.choices(WORDS, k=14))
+    return jobs
+
+
+async def frames(jobs: list):
+    for job in jobs:
+        yield {"status": "job", "data": job}
+    yield {"status": "complete", "message": "done"}
+
+
+async def sent(stream) -> tuple:
+    count = size = 0
+    async for frame in stream:
+        count += 1
+        size += len(dumps_frame(frame))
+    return count, size
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=5000)
+    arg_parser.add_argument("--changed", type=float, default=0.05, help="Share of jobs edited between scrapes")
+    args = arg_parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    tracker = ChangeTracker(Path(tempfile.mkdtemp()) / "jobs.db")
+    start = time.perf_counter()
+    asyncio.run(sent(only_changes(frames(jobs), tracker)))
+    first = time.perf_counter() - start
+
+    again = rescrape(jobs, args.changed)
+    full_frames, full_bytes = asyncio.run(sent(frames(again)))
+    start = time.perf_counter()
+    delta_frames, delta_bytes = asyncio.run(sent(only_changes(frames(again), tracker)))
+    check = time.perf_counter() - start
+
+    print(f"{args.jobs} jobs, {args.changed:.0%} changed between scrapes")
+    print(f"  first scrape (all new)        {first / args.jobs * 1e6:7.0f} µs/job")
+    print(f"  re-scrape check               {check / args.jobs * 1e6:7.0f} µs/job")
+    print(f"  re-send everything            {full_frames:6d} frames {full_bytes / 1024:9.0f} KiB")
+    print(f"  changes only                  {delta_frames:6d} frames {delta_bytes / 1024:9.0f} KiB "
+          f"({full_bytes / max(1, delta_bytes):.0f}x less)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""
+Waiting time for outbound requests: FetchScheduler vs. one FIFO rate budget.
+
+One heavy client queues a --heavy-pages bulk scrape at once, several light
+clients each scrape a few pages one request at a time, and an interactive
+single-URL request arrives every few seconds. With a plain FIFO bucket
+everyone queues behind the heavy scrape; the scheduler serves interactive
+requests first and splits bulk capacity evenly between clients. Time is
+simulated at --rate requests per second.
+
+Run from backend/:
+    python -m benchmarks.bench_fetch_scheduler [--rate 50] [--heavy-pages 400]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+
+from shared.utils.fetch_scheduler import FetchScheduler, fetch_context
+from shared.utils.rate_limiter import RateBudget
+
+
+async def workload(acquire, args) -> dict:
+    waits = {"heavy": [], "light": [], "interactive": []}
+
+    async def request(kind: str, priority: str, client: str):
+        with fetch_context(priority, client):
+            start = time.monotonic()
+            await acquire()
+            waits[kind].append(time.monotonic() - start)
+
+    async def light(client: str):
+        for _ in range(args.light_pages):
+            await request("light", "bulk", client)
+
+    async def interactive():
+        for i in range(args.interactive):
+            await asyncio.sleep(args.interactive_every)
+            await request("interactive", "interactive", f"user-{i}")
+
+    heavy = [request("heavy", "bulk", "heavy") for _ in range(args.heavy_pages)]
+    lights = [light(f"light-{i}") for i in range(args.light_clients)]
+    await asyncio.gather(*heavy, *lights, interactive())
+    return waits
+
+
+def report(name: str, waits: dict):
+    print(name)
+    for kind, values in waits.items():
+        values = sorted(values)
+        p95 = statistics.quantiles(values, n=100, method="inclusive")[94] if len(values) > 1 else values[0]
+        print(f"  {kind:12s} {len(values):4d} requests  p50 {statistics.median(values):6.2f} s  "
+              f"p95 {p95:6.2f} s  max {values[-1]:6.2f} s")
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--rate", type=float, default=50, help="Requests per second")
+    arg_parser.add_argument("--heavy-pages", type=int, default=400)
+    arg_parser.add_argument("--light-clients", type=int, default=4)
+    arg_parser.add_argument("--light-pages", type=int, default=10)
+    arg_parser.add_argument("--interactive", type=int, default=5)
+    arg_parser.add_argument("--interactive-every", type=float, default=1.0)
+    args = arg_parser.parse_args()
+
+    fifo = RateBudget(args.rate, burst=1)
+    report("FIFO rate budget", asyncio.run(workload(fifo.acquire, args)))
+
+    scheduler = FetchScheduler(RateBudget(args.rate, burst=1))
+    report("FetchScheduler (priority classes + per-client fair share)", asyncio.run(workload(scheduler.acquire, args)))
+    classes = scheduler.snapshot()["classes"]
+    for priority, stats in classes.items():
+        print(f"  class {priority:12s} granted {stats['granted']:4d}  max queued {stats['max_queued']:4d}  "
+              f"wait p95 {stats['wait_seconds']['p95']} s")
+
+
+if __name__ == "__main__":
+    main()
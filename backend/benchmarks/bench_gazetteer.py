@@ -0,0 +1,88 @@
+"""
+Startup and match-time benchmark for the bundled location gazetteer.
+
+Startup: loading and compiling us_gazetteer.json on first use.
+Match time: parse_linkedin_job's "City, ST" check per location string, against
+the state-code alternation it replaced (pattern rebuilt from STATE_CODES on
+every call), plus full normalization with and without the result cache.
+
+Run from backend/:
+    python -m benchmarks.bench_gazetteer [--runs 20000]
+"""
+import argparse
+import re
+import time
+
+from shared.utils import gazetteer
+
+SAMPLES = [
+    "Austin, TX",
+    "Austin, Texas, United States",
+    "Greater Seattle Area",
+    "San Francisco Bay Area",
+    "New York City Metropolitan Area",
+    "Remote",
+    "United States",
+    "Redmond, Washington, United States",
+    "Dallas-Fort Worth Metroplex",
+    "London, England, United Kingdom",
+    "Smallville, KS",
+    "Toronto, Ontario, Canada",
+]
+
+
+def legacy_is_location(text: str, state_codes: str) -> bool:
+    return re.search(rf'[^<>]+,\s*(?:{state_codes})$', text) is not None
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=20000, help="Passes over the sample locations")
+    args = arg_parser.parse_args()
+
+    gazetteer.get_gazetteer.cache_clear()
+    start = time.perf_counter()
+    compiled = gazetteer.get_gazetteer()
+    startup = time.perf_counter() - start
+    print(f"startup: load + compile {len(compiled.states)} states, "
+          f"{len(compiled._places)} place names in {startup * 1000:.2f} ms")
+
+    state_codes = "|".join(compiled.states)
+
+    def legacy():
+        for text in SAMPLES:
+            legacy_is_location(text, state_codes)
+
+    def city_state():
+        for text in SAMPLES:
+            compiled.is_city_state(text)
+
+    def normalize_uncached():
+        for text in SAMPLES:
+            compiled.normalize(text)
+
+    def normalize_cached():
+        for text in SAMPLES:
+            gazetteer.normalize_location(text)
+
+    per_string = len(SAMPLES)
+    print(f"match time: {per_string} sample locations x {args.runs} runs, per location")
+    for label, fn in (
+        ("state-code alternation (old parser)", legacy),
+        ("is_city_state", city_state),
+        ("normalize (uncached)", normalize_uncached),
+        ("normalize_location (cached)", normalize_cached),
+    ):
+        seconds = timed(fn, args.runs) / per_string
+        print(f"  {label:<38} {seconds * 1e6:7.2f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Throughput benchmark for the shared description converter on large descriptions.
+
+Compares html_to_text against the chained re.sub cleanup formerly inlined in
+parse_linkedin_job, element_to_text against get_text(separator="\\n"), and a
+capped conversion against converting everything and slicing.
+
+Run from backend/:
+    python -m benchmarks.bench_html_text [--copies 40] [--runs 20]
+"""
+import argparse
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from shared.utils.html_text import element_to_text, html_to_text
+
+FIXTURE = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures" / "job_posting.html"
+
+
+def legacy_regex_cleanup(formatted: str) -> str:
+    """The re.sub chain and line-by-line header pass previously in parse_linkedin_job."""
+    formatted = re.sub(r'<\s*(strong|b)[^>]*>([^<]+)</\s*\1\s*>\s*([:!])',
+                       lambda m: f"{m.group(2).strip()}{m.group(3)}", formatted, flags=re.IGNORECASE)
+    formatted = re.sub(r'<\s*(strong|b)[^>]*>([^<]+)</\s*\1\s*>',
+                       lambda m: f"{m.group(2).strip()}", formatted, flags=re.IGNORECASE)
+    formatted = re.sub(r'<li[^>]*>(.*?)</li>', r'BULLETPOINT\1', formatted, flags=re.DOTALL)
+    formatted = formatted.replace('<ul>', '').replace('</ul>', '')
+    formatted = re.sub(r'(<br\s*/?>\s*){2,}', '\n\n', formatted, flags=re.IGNORECASE)
+    formatted = re.sub(r'<br\s*/?>', '\n', formatted, flags=re.IGNORECASE)
+    formatted = re.sub(r'<p[^>]*>(.*?)</p>', r'\1\n\n', formatted, flags=re.DOTALL)
+    formatted = re.sub(r'<[^>]+>', '', formatted)
+    lines = []
+    for line in formatted.splitlines():
+        stripped = line.strip()
+        if not stripped:
+            lines.append('')
+            continue
+        if len(stripped) < 100 and not stripped.endswith('.') and stripped.count('.') <= 1:
+            if lines and lines[-1]:
+                lines.append('')
+            lines.append(stripped)
+            lines.append('')
+        else:
+            lines.append(stripped)
+    formatted = "\n".join(lines).replace('BULLETPOINT', '\n• ')
+    formatted = re.sub(r'\n{3,}', '\n\n', formatted)
+    formatted = re.sub(r'[ \t]+', ' ', formatted)
+    return formatted.strip()
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--copies", type=int, default=40, help="Fixture descriptions concatenated into one document")
+    arg_parser.add_argument("--runs", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    soup = BeautifulSoup(FIXTURE.read_text(), "html.parser")
+    markup = soup.select_one("div.show-more-less-html__markup")
+    html = f'<div class="show-more-less-html__markup">{"".join(str(c) for c in markup.contents) * args.copies}</div>'
+    big_soup = BeautifulSoup(html, "html.parser")
+    element = big_soup.div
+    megabytes = len(html) / 1e6
+
+    print(f"description: {len(html) / 1024:.0f} KiB ({args.copies} copies), {args.runs} runs")
+    rows = [
+        ("re.sub chain (old parse_linkedin_job)", lambda: legacy_regex_cleanup(html)),
+        ("html_to_text", lambda: html_to_text(html)),
+        ("get_text(separator='\\n') on tree", lambda: element.get_text(separator="\n", strip=True)),
+        ("element_to_text on tree", lambda: element_to_text(element)),
+        ("get_text()[:5000] on tree", lambda: element.get_text(separator="\n", strip=True)[:5000]),
+        ("element_to_text(max_chars=5000)", lambda: element_to_text(element, max_chars=5000)),
+        ("html_to_text(max_chars=5000)", lambda: html_to_text(html, max_chars=5000)),
+    ]
+    for label, fn in rows:
+        seconds = timed(fn, args.runs)
+        print(f"  {label:<40} {seconds * 1000:8.2f} ms  {megabytes / seconds:7.1f} MB/s")
+
+
+if __name__ == "__main__":
+    main()
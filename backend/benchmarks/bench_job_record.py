@@ -0,0 +1,101 @@
+"""
+Memory per 10k jobs: JobRecord vs. the per-job dicts previously passed around.
+
+"dicts" rebuilds what the old code held: one dict per job with its own copies
+of every string (each card is parsed from its own page), its own normalized
+location dict and, on the description path, description_html next to the text.
+
+Run from backend/:
+    python -m benchmarks.bench_job_record [--jobs 10000]
+"""
+import argparse
+import gc
+import json
+import time
+import tracemalloc
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from platforms.linkedin.parsers.card_parser import extract_search_cards
+from shared.types.job_record import dumps_frame
+
+FIXTURES = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures"
+
+
+def fresh(value):
+    """A private copy, as a separately parsed page would produce."""
+    if isinstance(value, str):
+        return value.encode().decode()
+    if isinstance(value, dict):
+        return {k: fresh(v) for k, v in value.items()}
+    return value
+
+
+def measure(build):
+    gc.collect()
+    tracemalloc.start()
+    data = build()
+    gc.collect()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return current, data
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=10000)
+    args = arg_parser.parse_args()
+
+    page = (FIXTURES / "search_page.html").read_text()
+    posting = BeautifulSoup((FIXTURES / "job_posting.html").read_text(), "html.parser")
+    markup = posting.select_one("div.show-more-less-html__markup")
+    description_html = str(markup)
+    description = markup.get_text("\n", strip=True)
+    pages = -(-args.jobs // 10)
+
+    def records(with_description):
+        out = []
+        for i in range(pages):
+            for card in extract_search_cards(page):
+                card["job_id"] = f"{card['job_id']}{i}"
+                if with_description:
+                    card["description"] = fresh(description)
+                out.append(card)
+        return out[:args.jobs]
+
+    def dicts(with_description):
+        out = []
+        for card in records(False):
+            job = {key: fresh(value) for key, value in card.items()}
+            if with_description:
+                job["description"] = fresh(description)
+                job["description_html"] = fresh(description_html)
+            out.append(job)
+        return out
+
+    print(f"{args.jobs} jobs, retained memory (tracemalloc)")
+    for label, with_description in (("search cards", False), ("cards + descriptions", True)):
+        old, old_jobs = measure(lambda: dicts(with_description))
+        new, new_jobs = measure(lambda: records(with_description))
+        print(f"  {label:<22} dicts {old / 1e6:7.2f} MB | JobRecord {new / 1e6:7.2f} MB | "
+              f"{(1 - new / old) * 100:4.1f}% less")
+        del old_jobs, new_jobs
+
+    jobs = records(True)
+    frames = [{"status": "job", "data": job} for job in jobs]
+    start = time.perf_counter()
+    for frame in frames:
+        json.dumps({"status": "job", "data": frame["data"].to_dict()})
+    rebuild = time.perf_counter() - start
+    [dumps_frame(frame) for frame in frames]  # fill the caches
+    start = time.perf_counter()
+    for frame in frames:
+        dumps_frame(frame)
+    cached = time.perf_counter() - start
+    print(f"  frame serialization: json.dumps(dict) {rebuild * 1000:.1f} ms | "
+          f"dumps_frame with cached record JSON {cached * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Full-text search latency over 100k persisted jobs (JobStore.search, SQLite FTS5).
+
+Targets at 100k documents: p95 under 50 ms for selective queries and under
+250 ms for queries matching a large share of the corpus (bm25 ranks every
+match). Also reports indexing throughput and the latency of a substring scan
+over the stored JSON, which is what finding a job took before the index.
+
+Run from backend/:
+    python -m benchmarks.bench_job_search [--jobs 100000] [--runs 20]
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from shared.utils.job_store import JobStore
+
+CITIES = [("Seattle", "WA"), ("San Francisco", "CA"), ("New York", "NY"), ("Austin", "TX"),
+          ("Boston", "MA"), ("Chicago", "IL"), ("Denver", "CO"), ("Portland", "OR")]
+TITLES = ["Software Engineer", "Senior Software Engineer", "Data Scientist", "Site Reliability Engineer",
+          "Product Manager", "Platform Engineer", "Backend Developer", "Machine Learning Engineer",
+          "DevOps Engineer", "Frontend Developer", "Security Engineer", "Data Engineer"]
+SKILLS = ["kubernetes", "terraform", "python", "golang", "rust", "react", "typescript", "postgres",
+          "kafka", "spark", "aws", "gcp", "azure", "docker", "graphql", "pytorch", "airflow", "redis"]
+FILLER = ("we are looking for a teammate to build and operate services that scale with our customers "
+          "you will collaborate with product design and operations on roadmap planning code review "
+          "mentoring incident response and continuous delivery benefits include health dental vision "
+          "equity learning budget flexible hours and parental leave").split()
+EMPLOYMENT_TYPES = ["Remote", "Hybrid", "On-Site"]
+
+QUERIES = {
+    "selective": [
+        ("kubernetes hybrid seattle", {}),
+        ("title:\"site reliability\" terraform", {"state": "WA"}),
+        ("rust company:\"company 42\"", {}),
+        ("pytorch airflow", {"employment_type": "Remote", "salary_annual_max__gte": 180000}),
+    ],
+    "broad": [
+        ("engineer", {}),
+        ("python", {}),
+        ("engineer remote", {"posted_at__gte": "2026-06-01"}),
+    ],
+}
+
+
+def make_jobs(count: int) -> list:
+    rng = random.Random(36)
+    jobs = []
+    for i in range(count):
+        city, state = rng.choice(CITIES)
+        skills = rng.sample(SKILLS, 4)
+        words = rng.choices(FILLER, k=90) + skills * 2
+        rng.shuffle(words)
+        low = rng.randrange(80, 220) * 1000.0 if rng.random() < 0.6 else None
+        jobs.append({
+            "job_id": str(4_100_000_000 + i),
+            "title": rng.choice(TITLES),
+            "company": f"Company {rng.randrange(3000)}",
+            "location": f"{city}, {state}",
+            "work_type": "Full Time",
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "description": " ".join(words),
+            "posted_at": f"2026-{rng.randrange(1, 11):02d}-{rng.randrange(1, 29):02d}T12:00:00+00:00",
+            "salary_annual_min": low,
+            "salary_annual_max": low * 1.3 if low else None,
+        })
+    return jobs
+
+
+def latencies(fn, runs: int) -> list:
+    out = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        fn()
+        out.append((time.perf_counter() - start) * 1000)
+    return out
+
+
+def percentile(values: list, q: float) -> float:
+    return statistics.quantiles(values, n=100)[int(q) - 1] if len(values) > 1 else values[0]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=100_000)
+    arg_parser.add_argument("--runs", type=int, default=20)
+    args = arg_parser.parse_args()
+
+    store = JobStore(Path(tempfile.mkdtemp()) / "jobs.db")
+    jobs = make_jobs(args.jobs)
+    start = time.perf_counter()
+    for offset in range(0, len(jobs), 1000):
+        store.save_jobs(jobs[offset:offset + 1000])
+    indexed = time.perf_counter() - start
+    print(f"{args.jobs} jobs indexed in {indexed:.1f} s ({args.jobs / indexed:,.0f} jobs/s, batches of 1000)")
+
+    # Incremental: one job at a time, as the scrape sockets persist them
+    single = latencies(lambda: store.save_job(dict(jobs[random.randrange(len(jobs))], salary="$1")), args.runs)
+    print(f"  single-job upsert incl. index   p50 {percentile(single, 50):6.2f} ms  p95 {percentile(single, 95):6.2f} ms")
+
+    print(f"search, {args.runs} runs each (limit 20)")
+    for group, queries in QUERIES.items():
+        for text, filters in queries:
+            hits = store.search(text, filters)
+            samples = latencies(lambda: store.search(text, filters), args.runs)
+            label = text + (f" {filters}" if filters else "")
+            print(f"  [{group:<9}] {label[:70]:<70} {len(hits):3d} hits  "
+                  f"p50 {percentile(samples, 50):6.2f} ms  p95 {percentile(samples, 95):6.2f} ms")
+
+    conn = store._connect()
+    scan = latencies(lambda: conn.execute(
+        "SELECT job_key FROM jobs WHERE data LIKE '%kubernetes%' AND data LIKE '%Seattle%'"
+    ).fetchall(), max(3, args.runs // 4))
+    print(f"  [baseline ] LIKE scan over stored JSON (all matches, unranked)  p50 {percentile(scan, 50):6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
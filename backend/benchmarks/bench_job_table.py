@@ -0,0 +1,113 @@
+"""
+Dashboard queries over 100k jobs: columnar JobTable vs. lists of dicts.
+
+Covers counts by company / work type / employment type, salary percentiles,
+a filtered top-k, plus building the table and (with --store) loading it from a
+temporary job store.
+
+Run from backend/:
+    python -m benchmarks.bench_job_table [--jobs 100000] [--runs 5] [--store]
+"""
+import argparse
+import heapq
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from shared.utils.job_store import JobStore
+from shared.utils.job_table import JobTable
+
+COMPANIES = [f"Company {i}" for i in range(2000)]
+STATES = ["WA", "CA", "NY", "TX", "MA", "IL", "CO", None]
+WORK_TYPES = ["Full Time", "Part Time", "Contract", "Internship", None]
+EMPLOYMENT_TYPES = ["Remote", "Hybrid", "On-Site", None]
+
+
+def make_jobs(count: int) -> list:
+    rng = random.Random(34)
+    jobs = []
+    for i in range(count):
+        has_salary = rng.random() < 0.6
+        low = rng.randrange(60, 250) * 1000.0 if has_salary else None
+        jobs.append({
+            "job_id": str(4_000_000_000 + i),
+            "company": rng.choice(COMPANIES),
+            "title": f"Engineer {rng.randrange(500)}",
+            "state": rng.choice(STATES),
+            "work_type": rng.choice(WORK_TYPES),
+            "employment_type": rng.choice(EMPLOYMENT_TYPES),
+            "salary_annual_min": low,
+            "salary_annual_max": low * 1.3 if has_salary else None,
+            "posted_at": f"2026-{rng.randrange(1, 11):02d}-{rng.randrange(1, 29):02d}T12:00:00+00:00",
+        })
+    return jobs
+
+
+def dict_queries(jobs):
+    groups = {key: Counter(job[key] for job in jobs) for key in ("company", "work_type", "employment_type")}
+    salaries = [job["salary_annual_max"] for job in jobs if job["salary_annual_max"] is not None]
+    quartiles = statistics.quantiles(salaries, n=4)
+    matches = [job for job in jobs if job["state"] in ("WA", "CA") and (job["salary_annual_max"] or 0) >= 150_000]
+    top = heapq.nlargest(20, matches, key=lambda job: job["posted_at"])
+    return groups, quartiles, top
+
+
+def table_queries(table):
+    groups = {key: table.count_by(key) for key in ("company", "work_type", "employment_type")}
+    quartiles = table.percentiles("salary_annual_max", [25, 50, 75])
+    matches = table.filter({"state": ["WA", "CA"], "salary_annual_max__gte": 150_000})
+    top = matches.top_k("posted_at", 20)
+    return groups, quartiles, top
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        result = fn()
+    return (time.perf_counter() - start) / runs, result
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=100_000)
+    arg_parser.add_argument("--runs", type=int, default=5)
+    arg_parser.add_argument("--store", action="store_true", help="Also time a load from a temporary job store")
+    args = arg_parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    build, table = timed(lambda: JobTable.from_records(jobs), 1)
+
+    old, (old_groups, _, old_top) = timed(lambda: dict_queries(jobs), args.runs)
+    new, (new_groups, _, new_top) = timed(lambda: table_queries(table), args.runs)
+
+    # Same answers first
+    assert dict(new_groups["work_type"]) == dict(old_groups["work_type"]), "group-by mismatch"
+    assert len(new_top) == len(old_top), "top-k size mismatch"
+
+    print(f"{args.jobs} jobs, {args.runs} runs")
+    print(f"  JobTable.from_records          {build * 1000:8.1f} ms (once per store change)")
+    print(f"  list of dicts: 3 group-bys + quartiles + filtered top-20  {old * 1000:8.1f} ms")
+    print(f"  JobTable:      3 group-bys + quartiles + filtered top-20  {new * 1000:8.1f} ms  ({old / new:.1f}x)")
+
+    for label, fn in (
+        ("count_by company", lambda: table.count_by("company")),
+        ("percentiles salary_annual_max", lambda: table.percentiles("salary_annual_max", [10, 50, 90])),
+        ("filter state+salary", lambda: table.filter({"state": ["WA", "CA"], "salary_annual_max__gte": 150_000})),
+        ("top_k posted_at 20", lambda: table.top_k("posted_at", 20)),
+        ("filter title contains", lambda: table.filter({"title__contains": "engineer 4"})),
+    ):
+        seconds, _ = timed(fn, args.runs)
+        print(f"    {label:<32} {seconds * 1000:7.2f} ms")
+
+    if args.store:
+        store = JobStore(Path(tempfile.mkdtemp()) / "jobs.db")
+        save, _ = timed(lambda: store.save_jobs(jobs), 1)
+        load, loaded = timed(lambda: JobTable.from_columns(store.columns()), 1)
+        print(f"  job store: save {save:.2f} s, load into JobTable {load * 1000:.1f} ms ({len(loaded)} rows)")
+
+
+if __name__ == "__main__":
+    main()
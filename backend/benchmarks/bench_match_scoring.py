@@ -0,0 +1,113 @@
+"""
+Resume-to-job scoring over 50k jobs: MatchIndex (cached hashed TF-IDF,
+one sparse matrix-vector product) vs. scoring each job on its own.
+
+"per job" is what scoring one job at a time amounts to: tokenize the
+description, build its TF-IDF dict and take the cosine with the resume.
+
+Run from backend/:
+    python -m benchmarks.bench_match_scoring [--jobs 50000] [--runs 20]
+"""
+import argparse
+import math
+import random
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from shared.utils.match_scoring import STOP_WORDS, WORD, MatchIndex
+
+SKILLS = ["kubernetes", "terraform", "python", "golang", "rust", "react", "typescript", "postgres",
+          "kafka", "spark", "aws", "gcp", "azure", "docker", "graphql", "pytorch", "airflow", "redis",
+          "java", "swift", "kotlin", "figma", "tableau", "salesforce", "excel", "sql", "linux", "scala"]
+FILLER = ("we are looking for a teammate to build and operate services that scale with our customers "
+          "you will collaborate with product design and operations on roadmap planning code review "
+          "mentoring incident response and continuous delivery benefits include health dental vision "
+          "equity learning budget flexible hours and parental leave analytics reporting dashboards "
+          "infrastructure reliability latency throughput security compliance testing automation").split()
+TITLES = ["Software Engineer", "Data Scientist", "Site Reliability Engineer", "Product Designer",
+          "Data Engineer", "Mobile Developer", "Business Analyst", "Platform Engineer"]
+
+
+def make_jobs(count: int) -> list:
+    rng = random.Random(38)
+    jobs = []
+    for i in range(count):
+        words = rng.choices(FILLER, k=250) + rng.sample(SKILLS, 6) * 3
+        rng.shuffle(words)
+        jobs.append({"job_id": str(4_200_000_000 + i), "title": rng.choice(TITLES), "description": " ".join(words)})
+    return jobs
+
+
+def make_resumes(count: int) -> list:
+    rng = random.Random(1038)
+    return [" ".join(rng.choices(FILLER, k=300) + rng.sample(SKILLS, 8) * 2) for _ in range(count)]
+
+
+def per_job_scores(jobs, resume, df, n):
+    def vector(text):
+        counts = Counter(t for t in WORD.findall(text.casefold()) if len(t) > 1 and t not in STOP_WORDS)
+        v = {t: (1 + math.log(c)) * (math.log((1 + n) / (1 + df.get(t, 0))) + 1) for t, c in counts.items()}
+        norm = math.sqrt(sum(x * x for x in v.values())) or 1
+        return {t: x / norm for t, x in v.items()}
+    query = vector(resume)
+    scores = []
+    for job in jobs:
+        doc = vector(job["description"] + (" " + job["title"]) * 2)
+        scores.append(sum(w * doc.get(t, 0) for t, w in query.items()))
+    return scores
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else values[0]
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=50_000)
+    arg_parser.add_argument("--runs", type=int, default=20)
+    arg_parser.add_argument("--baseline-jobs", type=int, default=2000, help="Jobs scored by the per-job baseline")
+    args = arg_parser.parse_args()
+
+    jobs = make_jobs(args.jobs)
+    resumes = make_resumes(args.runs)
+    path = Path(tempfile.mkdtemp()) / "jobs.db"
+    index = MatchIndex(path)
+
+    start = time.perf_counter()
+    for offset in range(0, len(jobs), 500):  # As descriptions stream in
+        index.add_jobs(jobs[offset:offset + 500])
+    vectorize = time.perf_counter() - start
+    start = time.perf_counter()
+    index.rank(resumes[0], 20)  # Builds the matrix
+    build = time.perf_counter() - start
+
+    samples = []
+    for resume in resumes:
+        start = time.perf_counter()
+        index.rank(resume, 20)
+        samples.append((time.perf_counter() - start) * 1000)
+
+    reloaded = MatchIndex(path)
+    start = time.perf_counter()
+    reloaded.rank(resumes[0], 20)
+    reload = time.perf_counter() - start
+
+    sample = jobs[:args.baseline_jobs]
+    df = Counter(t for job in sample for t in set(WORD.findall(job["description"].casefold())))
+    start = time.perf_counter()
+    per_job_scores(sample, resumes[0], df, len(sample))
+    baseline = (time.perf_counter() - start) / len(sample) * args.jobs * 1000
+
+    print(f"{args.jobs} jobs")
+    print(f"  vectorize + cache (streaming)   {vectorize:6.2f} s ({vectorize / args.jobs * 1e6:.0f} µs/job, once per job)")
+    print(f"  build TF-IDF matrix             {build * 1000:6.1f} ms (after new jobs arrive)")
+    print(f"  reload from job_vectors + build {reload * 1000:6.1f} ms (after a restart)")
+    print(f"  rank a resume, top 20           p50 {percentile(samples, 50):6.2f} ms  p95 {percentile(samples, 95):6.2f} ms")
+    print(f"  per-job scoring (extrapolated)  {baseline:8.0f} ms  ({baseline / statistics.median(samples):.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
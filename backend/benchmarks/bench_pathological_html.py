@@ -0,0 +1,89 @@
+"""
+Regression corpus of pathological HTML for parse_linkedin_job and html_to_text.
+
+Each input targets a pattern that used to backtrack (or scan unboundedly) in
+the parser: runs of near-matches for the title/posted/salary/applicant scans,
+unclosed <li>/<p> in the description, deep nesting and unterminated markup.
+Every case is parsed with the default time budget and must finish within
+--max-seconds; the script exits non-zero otherwise.
+
+Run from backend/:
+    python -m benchmarks.bench_pathological_html [--size 200000] [--max-seconds 2.5]
+"""
+import argparse
+import random
+import sys
+import time
+
+from platforms.linkedin.parsers.parser import parse_linkedin_job
+from shared.utils.html_text import html_to_text
+
+# Anchors that get the parser past steps 1-2 so every later scan runs
+PREFIX = (
+    '<div data-view-name="image"><svg></svg><img class="logo" src="https://example.com/logo.png"></div>'
+    '<a href="https://www.linkedin.com/company/acme/">Acme</a>'
+    '<h1>Senior Data Engineer<span class="t"></span></h1>'
+)
+
+
+def corpus(size: int) -> dict:
+    rng = random.Random(31)
+    soup_alphabet = '<>/="\' \n$agoAbout the job<li><p>'
+    return {
+        "title: long text, no span": PREFIX[:-50] + ">" + "a" * size,
+        "title: many '>' no '<'": PREFIX[:-50] + ">" * size,
+        "posted: 'ago' run": PREFIX + ">" + "ago " * (size // 4),
+        "posted: digit run": PREFIX + ">Reposted " + "1" * size + " ago</span><span class=\"",
+        "salary: '>$' repeated": PREFIX + ">$" * (size // 2),
+        "salary: '$' then no '<'": PREFIX + "> $" + " " * size,
+        "applicants: digit run": PREFIX + "<p>" + "1" * size + " people clicked</p>",
+        "applicants: phrase repeated": PREFIX + "<p>" + "Over 9 people clicked apply " * (size // 28) + "</p>",
+        "location: comma run": PREFIX + ">" + "," * size + "</span><span class=\"",
+        "slug: no terminator": '<a href="https://www.linkedin.com/company/' + "a" * size,
+        "image: no src": '<div data-view-name="image"><svg' + "<img class=" * (size // 11),
+        "employment: whitespace runs": PREFIX + "<p>work" + " " * size + "from home</p>",
+        "description: unclosed <li>": PREFIX + "About the job" + "<li>x" * (size // 5),
+        "description: unclosed <p>": PREFIX + "About the job" + "<p>" * (size // 3),
+        "description: deep nesting": PREFIX + "About the job" + "<div><span>" * (size // 11),
+        "description: unclosed <svg>": PREFIX + "About the job" + "<svg>" * (size // 5) + "text",
+        "description: bare '<' run": PREFIX + "About the job" + "<" * size,
+        "description: unclosed comment": PREFIX + "About the job<!--" + "-" * size,
+        "description: unterminated doctype": PREFIX + "About the job<!DOCTYPE" + "<" * size,
+        "description: unterminated tag run": PREFIX + "About the job" + "<img class=" * (size // 11),
+        "description: huge attribute": PREFIX + 'About the job<p title="' + "x" * size + '">text</p>',
+        "description: <br> run": PREFIX + "About the job" + "<br>" * (size // 4),
+        "random soup": "".join(rng.choice(soup_alphabet) for _ in range(size)),
+    }
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--size", type=int, default=200_000, help="Approximate characters per input")
+    arg_parser.add_argument("--max-seconds", type=float, default=2.5, help="Fail any input slower than this")
+    args = arg_parser.parse_args()
+
+    failures = []
+    print(f"{'case':<36} {'chars':>9} {'parse':>9} {'html_to_text':>13}  incomplete")
+    for label, html in corpus(args.size).items():
+        start = time.perf_counter()
+        data = parse_linkedin_job(html)
+        parse_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        html_to_text(html, deadline=start + args.max_seconds)
+        text_seconds = time.perf_counter() - start
+
+        slowest = max(parse_seconds, text_seconds)
+        flag = "yes" if data.get("parse_incomplete") else ""
+        print(f"{label:<36} {len(html):>9} {parse_seconds * 1000:7.1f}ms {text_seconds * 1000:11.1f}ms  {flag}")
+        if slowest > args.max_seconds:
+            failures.append(label)
+
+    if failures:
+        print(f"❌ {len(failures)} input(s) exceeded {args.max_seconds}s: {', '.join(failures)}")
+        sys.exit(1)
+    print(f"✅ all inputs parsed within {args.max_seconds}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark: single-walk SelectorPass vs. the sequential select_one()/find_all()
+scans previously used by bulk_parser and description_fetcher, on the guest-API
+jobPosting fixture.
+
+Run from backend/:
+    python -m benchmarks.bench_selector_pass [--runs 200]
+"""
+import argparse
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from platforms.linkedin.parsers.bulk_parser import BULK_SELECTORS, parse_linkedin_bulk
+from platforms.linkedin.scrapers.description_fetcher import DESCRIPTION_SELECTORS
+
+FIXTURE = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures" / "job_posting.html"
+
+
+def legacy_bulk_scans(soup) -> dict:
+    """The select_one chains and three full-tree string scans from bulk_parser."""
+    result = {}
+    for key, selectors in (
+        ("title", ["h1", "h2.top-card-layout__title", ".topcard__title", "h2"]),
+        ("company", ["a.topcard__org-name-link", ".topcard__flavor", "h4", "span.topcard__flavor--black-link"]),
+    ):
+        for selector in selectors:
+            elem = soup.select_one(selector)
+            if elem:
+                result[key] = elem.get_text(strip=True)
+                break
+    for selector in ["span.topcard__flavor--bullet", ".job-details-jobs-unified-top-card__bullet", "span.topcard__flavor"]:
+        elem = soup.select_one(selector)
+        if elem:
+            text = elem.get_text(strip=True)
+            if any(char in text for char in [',', 'Remote', 'Hybrid']):
+                result['location'] = text
+                break
+    for selector in ["div.description__text", "div.show-more-less-html__markup", "section.description",
+                     "div.description", "article.job-description"]:
+        elem = soup.select_one(selector)
+        if elem:
+            result['description'] = elem.get_text(separator="\n", strip=True)
+            break
+    for pattern in soup.find_all(string=lambda text: text and '$' in text):
+        text = pattern.strip()
+        if len(text) < 100 and '-' in text:
+            result['salary'] = text
+            break
+    for pattern in soup.find_all(string=lambda text: text and 'applicant' in text.lower()):
+        text = pattern.strip()
+        if len(text) < 50:
+            result['applicants'] = text
+            break
+    for pattern in soup.find_all(string=lambda text: text and 'ago' in text.lower()):
+        text = pattern.strip()
+        if len(text) < 50 and any(word in text.lower() for word in ['day', 'week', 'month', 'hour']):
+            result['posted'] = text
+            break
+    return result
+
+
+def legacy_fetcher_scans(soup) -> dict:
+    """The select_one chain from description_fetcher."""
+    result = {}
+    for key, selector in (
+        ("title", "h1, h2.top-card-layout__title, .topcard__title"),
+        ("company", "a.topcard__org-name-link, .topcard__flavor, h4"),
+        ("location", "span.topcard__flavor--bullet, .job-details-jobs-unified-top-card__bullet"),
+    ):
+        elem = soup.select_one(selector)
+        if elem:
+            result[key] = elem.get_text(strip=True)
+    for selector in ["div.description__text", "div.show-more-less-html__markup", "section.description",
+                     "div.description", "article.job-description"]:
+        elem = soup.select_one(selector)
+        if elem:
+            result['description'] = elem.get_text(separator="\n", strip=True)
+            break
+    return result
+
+
+def single_walk(selector_pass, soup) -> dict:
+    fields, texts = selector_pass.run(soup)
+    result = {}
+    for key in ("title", "company", "location"):
+        if key in fields:
+            result[key] = fields[key].element.get_text(strip=True)
+    if "description" in fields:
+        result["description"] = fields["description"].element.get_text(separator="\n", strip=True)
+    result.update(texts)
+    return result
+
+
+def timed(fn, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        fn()
+    return (time.perf_counter() - start) / runs
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    html = FIXTURE.read_text()
+    soup = BeautifulSoup(html, "html.parser")
+
+    # Same answers first
+    assert single_walk(BULK_SELECTORS, soup) == legacy_bulk_scans(soup), "bulk_parser mismatch"
+    assert single_walk(DESCRIPTION_SELECTORS, soup) == legacy_fetcher_scans(soup), "description_fetcher mismatch"
+
+    print(f"{FIXTURE.name}: {len(html)} bytes, {args.runs} runs, per-document averages")
+    for label, legacy, selector_pass in (
+        ("bulk_parser", legacy_bulk_scans, BULK_SELECTORS),
+        ("description_fetcher", legacy_fetcher_scans, DESCRIPTION_SELECTORS),
+    ):
+        old = timed(lambda: legacy(soup), args.runs)
+        new = timed(lambda: single_walk(selector_pass, soup), args.runs)
+        print(f"  {label:<20} sequential scans {old * 1000:7.2f} ms | single walk {new * 1000:7.2f} ms | {old / new:4.1f}x")
+
+    parse = timed(lambda: BeautifulSoup(html, "html.parser"), args.runs)
+    end_to_end = timed(lambda: parse_linkedin_bulk(html), args.runs)
+    print(f"  html.parser tree build {parse * 1000:7.2f} ms | parse_linkedin_bulk end-to-end {end_to_end * 1000:7.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
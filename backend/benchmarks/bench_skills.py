@@ -0,0 +1,103 @@
+"""
+Skill tagging over many descriptions: one regex per synonym vs. the
+Aho-Corasick automaton of shared.utils.skills, inline and in a process pool.
+
+Run from backend/:
+    python -m benchmarks.bench_skills [--jobs 5000] [--workers N] [--naive-jobs 200]
+
+The regex baseline is slow enough that it is timed on the first --naive-jobs
+descriptions only and compared per job.
+"""
+import argparse
+import json
+import random
+import re
+import time
+from pathlib import Path
+
+from bs4 import BeautifulSoup
+
+from shared.utils.skills import SKILLS_FILE, extract_skills_batch, get_skill_automaton
+
+FIXTURES = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures"
+
+
+def make_descriptions(count: int, skill_names: list) -> list:
+    posting = BeautifulSoup((FIXTURES / "job_posting.html").read_text(), "html.parser")
+    base = posting.select_one("div.show-more-less-html__markup").get_text("\n", strip=True).split()
+    rng = random.Random(37)
+    out = []
+    for _ in range(count):
+        words = rng.sample(base, min(len(base), 400)) + rng.sample(skill_names, 12)
+        rng.shuffle(words)
+        out.append(" ".join(words))
+    return out
+
+
+def naive_tagger(data: dict):
+    """What a straightforward implementation does: one regex per synonym, per description."""
+    patterns = []
+    for kind in ("hard", "soft"):
+        for name, synonyms in data[kind].items():
+            if isinstance(synonyms, dict):
+                for synonym in synonyms.get("case_sensitive", ()):
+                    patterns.append((kind, name, re.compile(r"(?<!\w)" + re.escape(synonym) + r"(?!\w)")))
+                synonyms = synonyms.get("aliases", ())
+            else:
+                synonyms = {name, *synonyms}
+            for synonym in synonyms:
+                patterns.append((kind, name, re.compile(r"(?<!\w)" + re.escape(synonym) + r"(?!\w)", re.I)))
+
+    def tag(text):
+        found = {"hard_skills": set(), "soft_skills": set()}
+        for kind, name, pattern in patterns:
+            if pattern.search(text):
+                found[f"{kind}_skills"].add(name)
+        return found
+    return tag, len(patterns)
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--jobs", type=int, default=5000)
+    arg_parser.add_argument("--workers", type=int, default=None)
+    arg_parser.add_argument("--naive-jobs", type=int, default=200)
+    args = arg_parser.parse_args()
+
+    data = json.loads(SKILLS_FILE.read_text())
+    start = time.perf_counter()
+    automaton = get_skill_automaton()
+    build = time.perf_counter() - start
+    descriptions = make_descriptions(args.jobs, list(data["hard"]) + list(data["soft"]))
+    chars = sum(map(len, descriptions))
+
+    tag, pattern_count = naive_tagger(data)
+    sample = descriptions[:args.naive_jobs]
+    start = time.perf_counter()
+    naive = [tag(text) for text in sample]
+    naive_per_job = (time.perf_counter() - start) / len(sample)
+
+    start = time.perf_counter()
+    inline = [automaton.extract(text) for text in descriptions]
+    inline_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pooled = extract_skills_batch(descriptions, args.workers)
+    pool_seconds = time.perf_counter() - start
+
+    assert pooled == inline, "pool results differ from inline results"
+    agree = sum(set(a["hard_skills"]) == b["hard_skills"] for a, b in zip(inline, naive))
+
+    print(f"{args.jobs} descriptions, {chars / 1e6:.1f}M chars, {pattern_count} synonyms "
+          f"(automaton built in {build * 1000:.1f} ms, {len(automaton._goto)} states)")
+    naive_seconds = naive_per_job * args.jobs
+    print(f"  regex per synonym     {naive_seconds:7.2f} s  ({naive_per_job * 1000:.2f} ms/job, "
+          f"extrapolated from {len(sample)})")
+    print(f"  automaton, inline     {inline_seconds:7.2f} s  ({inline_seconds / args.jobs * 1000:.2f} ms/job, "
+          f"{naive_seconds / inline_seconds:.0f}x)")
+    print(f"  automaton, pool       {pool_seconds:7.2f} s  ({naive_seconds / pool_seconds:.0f}x)")
+    print(f"  hard-skill sets identical to the regex tagger: {agree}/{len(sample)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+"""
+Startup cost of the API: import time of main and time to the first request.
+
+Each measurement runs in a fresh interpreter. "lazy" is main as it is;
+"eager" first imports every platform module main used to import at the top
+(Playwright's url_scraper too, when installed), which is what each worker
+paid before. Time to first request adds the app's startup events and one
+request, GET / (health) or POST /parse with the bundled job posting. Jobs
+parsed here go to a temporary job store.
+
+Run from backend/:
+    python -m benchmarks.bench_startup [--runs 5]
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).parent.parent
+
+EAGER_MODULES = (
+    "platforms.linkedin.parsers.parser",
+    "platforms.linkedin.utils.formatter",
+    "platforms.linkedin.scrapers.url_scraper",
+    "platforms.linkedin.scrapers.linkedin_bulk_scraper",
+    "platforms.linkedin.scrapers.linkedin_bulk_scraper_test",
+    "platforms.linkedin.scrapers.bulk_with_descriptions",
+    "platforms.linkedin.scrapers.matrix_scraper",
+    "platforms.linkedin.scrapers.queue_tasks",
+    "platforms.linkedin.scrapers.saved_search_scheduler",
+    "platforms.linkedin.parsers.selector_stats",
+    "platforms.linkedin.utils.session_manager",
+    "shared.utils.change_detection",
+    "shared.utils.fetch_scheduler",
+    "shared.utils.job_store",
+    "shared.utils.job_table",
+    "shared.utils.match_scoring",
+    "shared.utils.skills",
+    "shared.utils.work_queue",
+)
+
+# Runs in the child interpreter; prints one JSON line. The request goes
+# straight through the ASGI interface, as uvicorn would send it.
+CHILD = """
+import asyncio, importlib, json, os, sys, tempfile, time
+start = time.perf_counter()
+if {eager}:
+    for name in {modules!r}:
+        try:
+            importlib.import_module(name)
+        except ImportError:  # Playwright not installed
+            pass
+import main
+imported = time.perf_counter()
+
+async def first_request():
+    await main.app.router.startup()
+    import shared.utils.job_store as job_store_module
+    job_store_module.job_store.path = job_store_module.Path(tempfile.mkdtemp()) / "jobs.db"
+    if {request!r} == "parse":
+        html = open("platforms/linkedin/fixtures/job_posting.html", encoding="utf-8").read()
+        method, path, body = "POST", "/parse", json.dumps({{"html_content": html, "parser_type": "linkedin"}}).encode()
+    else:
+        method, path, body = "GET", "/", b""
+    scope = {{
+        "type": "http", "asgi": {{"version": "3.0"}}, "http_version": "1.1", "method": method,
+        "scheme": "http", "path": path, "raw_path": path.encode(), "query_string": b"", "root_path": "",
+        "headers": [(b"host", b"bench"), (b"content-type", b"application/json")],
+        "client": ("127.0.0.1", 1), "server": ("bench", 80),
+    }}
+    messages = []
+
+    async def receive():
+        return {{"type": "http.request", "body": body, "more_body": False}}
+
+    async def send(message):
+        messages.append(message)
+
+    await main.app(scope, receive, send)
+    status = messages[0]["status"]
+    if status != 200:
+        raise SystemExit(f"{{path}} answered {{status}}")
+    await main.app.router.shutdown()
+
+asyncio.run(first_request())
+done = time.perf_counter()
+print(json.dumps({{"import": imported - start, "first_request": done - start, "modules": len(sys.modules)}}))
+"""
+
+
+def measure(eager: bool, request: str) -> dict:
+    code = CHILD.format(eager=eager, modules=EAGER_MODULES, request=request)
+    env = {**os.environ, "SAVED_SEARCH_SCHEDULER": "0"}  # Its start is deferred anyway; keep runs independent
+    output = subprocess.run(
+        [sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True, check=True, env=env
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--runs", type=int, default=5)
+    args = arg_parser.parse_args()
+
+    print(f"median of {args.runs} fresh interpreters")
+    for request in ("health", "parse"):
+        for eager in (True, False):
+            runs = [measure(eager, request) for _ in range(args.runs)]
+            label = f"{'eager' if eager else 'lazy':5s} {request:6s}"
+            print(f"  {label}  import main {statistics.median(r['import'] for r in runs) * 1000:7.0f} ms  "
+                  f"first request {statistics.median(r['first_request'] for r in runs) * 1000:7.0f} ms  "
+                  f"{statistics.median(r['modules'] for r in runs):5.0f} modules")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Throughput of the SQLite work queue with 1..N worker processes.
+
+A run of --pages page tasks, each producing --cards description tasks, is
+drained by worker processes running `work_queue.consume`. Tasks wait
+--latency seconds instead of fetching, standing in for LinkedIn response
+time, so the numbers show how the queue scales with workers when requests,
+not the rate budget, are the bottleneck. (With the real budget, throughput
+stops growing once the workers together spend it.) Also reports the queue's
+own cost per task: claim + complete with no work.
+
+Run from backend/:
+    python -m benchmarks.bench_work_queue [--workers 1 2 4 8] [--latency 0.05]
+"""
+import argparse
+import asyncio
+import multiprocessing
+import tempfile
+import time
+from pathlib import Path
+
+from shared.utils.work_queue import WorkQueue, consume
+
+
+def drain(path: str, run_id: str, latency: float, cards: int, concurrency: int):
+    queue = WorkQueue(Path(path))
+
+    async def page(payload):
+        await asyncio.sleep(latency)
+        page_no = payload["page"]
+        return [], [("description", {"job": f"{page_no}-{i}"}, f"{page_no}-{i}") for i in range(cards)]
+
+    async def description(payload):
+        await asyncio.sleep(latency)
+        return [{"status": "job", "data": payload}], []
+
+    async def run():
+        stop = asyncio.Event()
+
+        async def stop_when_drained():
+            while True:
+                await asyncio.sleep(0.05)
+                if not queue.run_status(run_id)["open"]:
+                    stop.set()
+                    return
+
+        watcher = asyncio.create_task(stop_when_drained())
+        await consume(queue, {"search_page": page, "description": description}, concurrency, stop=stop)
+        watcher.cancel()
+
+    asyncio.run(run())
+
+
+def measure(workers: int, args) -> float:
+    path = Path(tempfile.mkdtemp()) / "work_queue.db"
+    queue = WorkQueue(path)
+    run_id = queue.create_run([("search_page", {"page": p}, f"page:{p}") for p in range(args.pages)])
+
+    start = time.perf_counter()
+    worker_args = (str(path), run_id, args.latency, args.cards, args.concurrency)
+    processes = [multiprocessing.Process(target=drain, args=worker_args) for _ in range(workers)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+    elapsed = time.perf_counter() - start
+    done = queue.run_status(run_id).get("done", 0)
+    return done / elapsed
+
+
+def overhead(count: int = 2000) -> float:
+    queue = WorkQueue(Path(tempfile.mkdtemp()) / "work_queue.db")
+    queue.create_run([("noop", {}, str(i)) for i in range(count)])
+    start = time.perf_counter()
+    for _ in range(count):
+        task = queue.claim("bench")
+        queue.complete(task, "bench", [{"status": "progress"}])
+    return (time.perf_counter() - start) / count
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    arg_parser.add_argument("--pages", type=int, default=20)
+    arg_parser.add_argument("--cards", type=int, default=10, help="Description tasks per page")
+    arg_parser.add_argument("--latency", type=float, default=0.05, help="Seconds per simulated request")
+    arg_parser.add_argument("--concurrency", type=int, default=1, help="Slots per worker process")
+    args = arg_parser.parse_args()
+
+    tasks = args.pages * (1 + args.cards)
+    print(f"{tasks} tasks, {args.latency * 1000:.0f} ms each, {args.concurrency} slot(s) per worker")
+    baseline = None
+    for workers in args.workers:
+        rate = measure(workers, args)
+        baseline = baseline or rate
+        print(f"  {workers:2d} workers  {rate:7.1f} tasks/s  ({rate / baseline:.1f}x)")
+    print(f"  queue overhead per task (claim + complete): {overhead() * 1e6:.0f} µs")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+"""
+Load harness: many concurrent clients against a running API whose scrapers
+point at the stand-in boards, reporting throughput, latency percentiles and
+error rates per endpoint.
+
+Scenarios (--scenario, default all):
+- parse: POST /parse with the recorded LinkedIn job page;
+- bulk-scrape: /ws/bulk-scrape, search pages plus every job page;
+- bulk-with-descriptions: /ws/bulk-with-descriptions, search pages plus the
+  guest-API description of every card.
+Each of --clients clients runs --runs requests (scrapes) one after another.
+Scrapes search a keyword unique to the client, run and iteration, so the
+parsed-result cache and repost detection see new jobs every time.
+
+Latency is per request for /parse; for scrapes it is the whole scrape and,
+separately, the time to the first job frame. Errors are HTTP errors,
+connection failures and "error" frames. With --standin, the stand-in's fault
+settings are applied first (--errors, --latency-ms, --jitter-ms, --max-rps,
+--retry-after) and the upstream answers it sent (200/429/999) are reported.
+
+Setup, from backend/. STORAGE_DIR keeps the scraped fake jobs, the parsed
+cache and the stand-in's budget and breaker out of the production stores:
+    python -m standin --port 8010
+    STORAGE_DIR=/tmp/standin-storage LINKEDIN_BASE_URL=http://127.0.0.1:8010/linkedin \\
+        LINKEDIN_REQUESTS_PER_MINUTE=600 uvicorn main:app --port 8000
+    python -m benchmarks.load_harness [--clients 8] [--runs 3] [--errors 429:0.05,999:0.02]
+Note that /ws/bulk-scrape waits 2-4 s after every job page by design.
+"""
+import argparse
+import asyncio
+import json
+import statistics
+import time
+import uuid
+from pathlib import Path
+
+import httpx
+import websockets  # type: ignore
+
+FIXTURE = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures" / "job_posting.html"
+SCENARIOS = ("parse", "bulk-scrape", "bulk-with-descriptions")
+
+
+class Results:
+    def __init__(self, scenario: str):
+        self.scenario = scenario
+        self.latencies = []  # Seconds per request or scrape
+        self.first_job = []  # Seconds to the first job frame of a scrape
+        self.requests = 0
+        self.errors = 0
+        self.error_frames = 0
+        self.jobs = 0
+        self.error_samples = []
+        self.elapsed = 0.0
+
+    def fail(self, message: str):
+        self.errors += 1
+        if len(self.error_samples) < 3:
+            self.error_samples.append(message)
+
+    def report(self) -> str:
+        def percentiles(values) -> str:
+            if not values:
+                return "n/a"
+            values = sorted(values)
+            quantiles = statistics.quantiles(values, n=100, method="inclusive") if len(values) > 1 else values * 99
+            return (f"p50 {quantiles[49] * 1000:.0f} ms  p95 {quantiles[94] * 1000:.0f} ms  "
+                    f"p99 {quantiles[98] * 1000:.0f} ms  max {values[-1] * 1000:.0f} ms")
+
+        lines = [
+            f"{self.scenario}: {self.requests} requests in {self.elapsed:.1f} s "
+            f"({self.requests / self.elapsed:.2f}/s), error rate {self.errors / max(1, self.requests):.1%}",
+            f"  latency        {percentiles(self.latencies)}",
+        ]
+        if self.scenario != "parse":
+            lines.append(f"  first job      {percentiles(self.first_job)}")
+            lines.append(f"  jobs           {self.jobs} ({self.jobs / self.elapsed:.2f}/s), "
+                         f"{self.error_frames} error frames")
+        lines.extend(f"  error          {sample}" for sample in self.error_samples)
+        return "\n".join(lines)
+
+
+async def parse_client(client: httpx.AsyncClient, results: Results, runs: int, html: str):
+    for _ in range(runs):
+        start = time.perf_counter()
+        results.requests += 1
+        try:
+            response = await client.post("/parse", json={"html_content": html, "parser_type": "linkedin"})
+        except httpx.HTTPError as e:
+            results.fail(f"{type(e).__name__}: {e}")
+            continue
+        results.latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            results.fail(f"HTTP {response.status_code}: {response.text[:200]}")
+
+
+async def scrape_client(ws_url: str, results: Results, runs: int, payload: dict, keyword: str):
+    for run in range(runs):
+        start = time.perf_counter()
+        first_job = None
+        results.requests += 1
+        try:
+            async with websockets.connect(ws_url, max_size=None, open_timeout=30) as socket:
+                await socket.send(json.dumps({**payload, "keyword": f"{keyword} {run}"}))
+                async for raw in socket:  # Ends when the server closes the connection
+                    frame = json.loads(raw)
+                    status = frame.get("status")
+                    if status == "job":
+                        results.jobs += 1
+                        if first_job is None:
+                            first_job = time.perf_counter() - start
+                    elif status == "error":
+                        results.error_frames += 1
+                        results.fail(frame.get("message", "error frame"))
+                    elif status == "complete":
+                        break
+        except (OSError, asyncio.TimeoutError, websockets.WebSocketException) as e:
+            results.fail(f"{type(e).__name__}: {e}")
+            continue
+        results.latencies.append(time.perf_counter() - start)
+        if first_job is not None:
+            results.first_job.append(first_job)
+
+
+async def run_scenario(scenario: str, args, tag: str) -> Results:
+    results = Results(scenario)
+    start = time.perf_counter()
+    if scenario == "parse":
+        html = FIXTURE.read_text(encoding="utf-8")
+        limits = httpx.Limits(max_connections=args.clients)
+        async with httpx.AsyncClient(base_url=args.api, timeout=60, limits=limits) as client:
+            await asyncio.gather(*(parse_client(client, results, args.runs, html) for _ in range(args.clients)))
+    else:
+        ws_url = args.api.replace("http", "ws", 1) + f"/ws/{scenario}"
+        payload = {"location": args.location, "pages": args.pages}
+        if scenario == "bulk-with-descriptions":
+            payload.update(delay=args.delay, queued=False)
+        await asyncio.gather(*(
+            scrape_client(ws_url, results, args.runs, payload, f"{args.keyword} {tag}-{client}")
+            for client in range(args.clients)
+        ))
+    results.elapsed = time.perf_counter() - start
+    return results
+
+
+async def standin_faults(args):
+    """Apply the fault flags to the stand-in and reset its counters."""
+    changes = {key: value for key, value in {
+        "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms,
+        "max_rps": args.max_rps, "retry_after": args.retry_after,
+    }.items() if value is not None}
+    if args.errors is not None:
+        changes["errors"] = dict(item.split(":") for item in args.errors.split(",") if item)
+    async with httpx.AsyncClient(base_url=args.standin, timeout=10) as client:
+        if changes:
+            (await client.put("/control", json=changes)).raise_for_status()
+        await client.delete("/stats")
+        return (await client.get("/control")).json()
+
+
+async def standin_stats(args) -> dict:
+    async with httpx.AsyncClient(base_url=args.standin, timeout=10) as client:
+        return (await client.get("/stats")).json()["boards"]
+
+
+async def main_async(args):
+    if args.standin:
+        settings = await standin_faults(args)
+        settings.pop("status", None)
+        print(f"stand-in {args.standin}: {settings}")
+    tag = uuid.uuid4().hex[:6]
+    scenarios = SCENARIOS if args.scenario == "all" else (args.scenario,)
+    print(f"{args.clients} clients x {args.runs} runs against {args.api}\n")
+    for scenario in scenarios:
+        results = await run_scenario(scenario, args, tag)
+        print(results.report())
+        if args.standin and scenario != "parse":
+            print(f"  upstream       {await standin_stats(args)}")
+            async with httpx.AsyncClient(base_url=args.standin, timeout=10) as client:
+                await client.delete("/stats")
+        print()
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    arg_parser.add_argument("--api", default="http://127.0.0.1:8000")
+    arg_parser.add_argument("--standin", default="http://127.0.0.1:8010", help="Empty to skip fault settings and stats")
+    arg_parser.add_argument("--scenario", choices=SCENARIOS + ("all",), default="all")
+    arg_parser.add_argument("--clients", type=int, default=8)
+    arg_parser.add_argument("--runs", type=int, default=3, help="Requests or scrapes per client")
+    arg_parser.add_argument("--keyword", default="Software Engineer")
+    arg_parser.add_argument("--location", default="Seattle")
+    arg_parser.add_argument("--pages", type=int, default=1, help="Search pages per scrape")
+    arg_parser.add_argument("--delay", type=float, default=0, help="bulk-with-descriptions delay between fetches")
+    arg_parser.add_argument("--errors", help='Stand-in error rates, e.g. "429:0.05,999:0.02" ("" for none)')
+    arg_parser.add_argument("--latency-ms", type=float)
+    arg_parser.add_argument("--jitter-ms", type=float)
+    arg_parser.add_argument("--max-rps", type=float, help="Stand-in rate limit per board (0: none)")
+    arg_parser.add_argument("--retry-after", type=float, help="Retry-After of 429s (0: until the limit has room)")
+    args = arg_parser.parse_args()
+    args.api = args.api.rstrip("/")
+    asyncio.run(main_async(args))
+
+
+if __name__ == "__main__":
+    main()
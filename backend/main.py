@@ -1,6 +1,11 @@
 import os
+import sys
 import json
+import asyncio
+import importlib
 import logging
+import sqlite3
+import time
 from pathlib import Path
 from dotenv import load_dotenv  # type: ignore
 from fastapi import FastAPI, HTTPException, Request, WebSocket  # type: ignore
@@ -11,16 +16,11 @@ from pydantic import BaseModel  # type: ignore
 env_path = Path(__file__).parent.parent / ".env"
 load_dotenv(dotenv_path=env_path)
 
-# Import parsers and scrapers
-from platforms.linkedin.parsers.parser import parse_linkedin_job
-from platforms.linkedin.utils.formatter import format_job_post
-from platforms.linkedin.scrapers.url_scraper import fetch_job_html
-
-# Import LinkedIn bulk router and scraper
+# LinkedIn bulk router (its scraper is imported on first request). Parsers,
+# scrapers, Playwright and the stores are imported inside the endpoints that
+# use them, so a worker only serving /parse never loads the scrapers.
 from platforms.linkedin.utils import linkedin_bulk
-from platforms.linkedin.scrapers.linkedin_bulk_scraper import scrape_linkedin_jobs
-from platforms.linkedin.scrapers.linkedin_bulk_scraper_test import scrape_linkedin_jobs_test
-from platforms.linkedin.scrapers.bulk_with_descriptions import scrape_jobs_with_descriptions
+from shared.utils.storage import STORAGE_DIR
 
 # -------------------------------------------------
 # App Setup
@@ -48,11 +48,46 @@ class ParseRequest(BaseModel):
     html_content: str
     parser_type: str = "linkedin"
 
-# Parser Registry
+class JobQuery(BaseModel):
+    filters: dict = {}
+    group_by: list = []
+    percentiles: dict = {}
+    top: dict = None
+    limit: int = 50
+    full_records: bool = False
+
+class MatchRequest(BaseModel):
+    resume: str
+    limit: int = 20
+    job_keys: list = None
+
+class SkillsRequest(BaseModel):
+    descriptions: list = []
+    job_keys: list = []
+
+class SavedSearchRequest(BaseModel):
+    keyword: str
+    location: str
+    interval_minutes: float = 60
+    pages: int = 1
+    fetch_descriptions: bool = False
+
+# Parser Registry: "module:function", imported on first use
 PARSERS = {
-    "linkedin": parse_linkedin_job,
+    "linkedin": "platforms.linkedin.parsers.parser:parse_linkedin_job",
+    "indeed": "platforms.indeed.parsers.parser:parse_indeed_job",
 }
 
+# Bulk scrapes run on the work queue (worker.py) unless a request says otherwise
+SCRAPE_VIA_QUEUE = os.getenv("SCRAPE_VIA_QUEUE", "0") == "1"
+
+# Saved searches poll in the API process unless disabled. The scheduler is
+# only imported by a worker that finds a saved search at startup or creates
+# one; workers started before the first search was saved take part (as lease
+# standbys) from their next restart.
+SAVED_SEARCH_SCHEDULER = os.getenv("SAVED_SEARCH_SCHEDULER", "1") != "0"
+JOBS_DB = STORAGE_DIR / "jobs.db"  # Same file as shared.utils.job_store.JOBS_DB
+
 # -------------------------------------------------
 # Healthcheck
 # -------------------------------------------------
@@ -60,6 +95,367 @@ PARSERS = {
 async def health():
     return {"status": "ok", "message": "LinkedIn parser backend running."}
 
+@app.on_event("startup")
+async def start_saved_search_scheduler():
+    if SAVED_SEARCH_SCHEDULER:
+        # Checked and imported off the event loop, so startup and first requests don't wait
+        asyncio.create_task(_start_saved_search_scheduler())
+
+def _has_saved_searches() -> bool:
+    """Plain sqlite3 read, so a worker without saved searches never loads the scrapers."""
+    if not JOBS_DB.exists():
+        return False
+    try:
+        conn = sqlite3.connect(f"file:{JOBS_DB}?mode=ro", uri=True)
+        try:
+            return conn.execute("SELECT 1 FROM saved_searches LIMIT 1").fetchone() is not None
+        finally:
+            conn.close()
+    except sqlite3.Error:  # No saved_searches table yet
+        return False
+
+async def _start_saved_search_scheduler():
+    if not await asyncio.to_thread(_has_saved_searches):
+        return
+    module = await asyncio.to_thread(importlib.import_module, "platforms.linkedin.scrapers.saved_search_scheduler")
+    module.scheduler.start()
+
+@app.on_event("shutdown")
+async def stop_session_janitor():
+    module = loaded("platforms.linkedin.utils.session_manager")
+    if module:
+        await module.session_manager.stop_janitor()
+
+@app.on_event("shutdown")
+async def save_selector_stats():
+    module = loaded("platforms.linkedin.parsers.selector_stats")
+    if module:
+        module.selector_stats.save()
+
+@app.on_event("shutdown")
+async def stop_saved_search_scheduler():
+    module = loaded("platforms.linkedin.scrapers.saved_search_scheduler")
+    if module:
+        await module.scheduler.stop()
+
+
+def loaded(module_name: str):
+    """The module if something already imported it; shutdown hooks never import."""
+    return sys.modules.get(module_name)
+
+
+def get_parser(parser_type: str):
+    """Parser function registered under `parser_type` in PARSERS, imported on first use."""
+    module_name, _, function_name = PARSERS[parser_type].partition(":")
+    return getattr(importlib.import_module(module_name), function_name)
+
+# -------------------------------------------------
+# Diagnostics
+# -------------------------------------------------
+@app.get("/diagnostics/selectors")
+async def selector_diagnostics():
+    """
+    Hit rates and current order of every adaptive selector chain.
+    A rising avg_misses_before_hit or unresolved_rate means LinkedIn markup drifted.
+    """
+    from platforms.linkedin.parsers.selector_stats import selector_stats
+    return {"status": "ok", "chains": selector_stats.snapshot()}
+
+@app.get("/diagnostics/fetch-scheduler")
+async def fetch_scheduler_diagnostics():
+    """
+    Outbound LinkedIn request scheduling: the shared rate budget, and per
+    priority class (interactive, bulk, background) the queue depth, waiting
+    clients and wait-time percentiles.
+    """
+    from shared.utils.fetch_scheduler import fetch_scheduler
+    return {"status": "ok", **fetch_scheduler.snapshot()}
+
+@app.get("/diagnostics/sessions")
+async def session_diagnostics():
+    """
+    LinkedIn identities of the session pool: health (closed, open = cooling
+    down, half_open = probing), requests in flight and per-minute throughput.
+    Request counts are this worker process's; health is shared.
+    """
+    from platforms.linkedin.utils.session_manager import session_manager
+    return {"status": "ok", **session_manager.snapshot()}
+
+@app.get("/diagnostics/work-queue")
+async def work_queue_diagnostics():
+    """Queued scrape tasks per kind and status, runs per status, and the workers holding leases."""
+    from shared.utils.work_queue import work_queue
+    try:
+        return {"status": "ok", **work_queue.snapshot()}
+    except (sqlite3.Error, OSError) as e:
+        raise HTTPException(status_code=503, detail=f"Work queue unavailable: {e}")
+
+@app.get("/diagnostics/platforms")
+async def platform_diagnostics():
+    """Every platform plugin with its own rate budget, circuit breaker and request queues."""
+    from platforms.base import PLATFORMS, get_platform
+    return {"status": "ok", "platforms": [get_platform(name).snapshot() for name in PLATFORMS]}
+
+# -------------------------------------------------
+# Persisted Results
+# -------------------------------------------------
+_job_table_cache = {"version": None, "table": None}
+_match_sync = {"version": None}
+
+
+def persist_job(result: dict):
+    """Upsert the job of a "job" frame into the job store; never breaks the stream."""
+    if result.get("status") != "job":
+        return
+    persist_record(result.get("data") or {})
+
+
+def connection_id(websocket: WebSocket) -> str:
+    """Client identity for fair scheduling of outbound requests: one per connection."""
+    client = websocket.client
+    return f"{client.host}:{client.port}" if client else f"ws-{id(websocket)}"
+
+
+def persist_record(job: dict):
+    """Upsert one job (and its search index entry); storage errors are only logged."""
+    from shared.utils.job_store import job_store
+    try:
+        job_store.save_job(job)
+    except (sqlite3.Error, OSError) as e:
+        logger.warning(f"⚠️ Could not persist job: {e}")
+
+
+def current_job_table():
+    """Columnar view (JobTable) of the job store, rebuilt only after the store changed."""
+    from shared.utils.job_store import job_store
+    from shared.utils.job_table import JobTable
+    version = job_store.version()
+    if _job_table_cache["version"] != version:
+        _job_table_cache["table"] = JobTable.from_columns(job_store.columns())
+        _job_table_cache["version"] = version
+    return _job_table_cache["table"]
+
+
+@app.post("/jobs/query")
+async def query_jobs(query: JobQuery):
+    """
+    Filter, aggregate and rank persisted scrape results.
+
+    Example:
+      {
+        "filters": {"state": ["WA", "CA"], "salary_annual_max__gte": 150000},
+        "group_by": ["company", "work_type", "employment_type"],
+        "percentiles": {"salary_annual_max": [25, 50, 75, 90]},
+        "top": {"by": "posted_at", "k": 20},
+        "full_records": false
+      }
+    """
+    from shared.utils.job_store import job_store
+    from shared.utils.job_table import run_query
+    try:
+        result = run_query(
+            current_job_table(),
+            filters=query.filters,
+            group_by=query.group_by,
+            percentiles=query.percentiles,
+            top=query.top,
+            limit=max(0, min(query.limit, 1000)),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    rows = result.pop("rows")
+    if query.full_records:
+        result["jobs"] = job_store.get_jobs(rows.keys.tolist())
+    else:
+        result["jobs"] = rows.to_records()
+    return {"status": "ok", **result}
+
+
+@app.get("/jobs/search")
+async def search_jobs(
+    q: str,
+    company: str = None,
+    state: str = None,
+    work_type: str = None,
+    employment_type: str = None,
+    platform: str = None,
+    posted_after: str = None,
+    min_salary: float = None,
+    limit: int = 20,
+    offset: int = 0,
+    full_records: bool = False,
+):
+    """
+    Ranked full-text search over persisted jobs (title, company, location, description).
+
+    Example: /jobs/search?q=kubernetes hybrid seattle&posted_after=2026-10-12
+    Query syntax: "exact phrase", title:/company:/location:/description: field
+    terms, prefix*, -excluded. state and employment_type accept comma-separated
+    values; min_salary compares against the annualized maximum.
+    """
+    from shared.utils.job_store import job_store
+    filters = {}
+    for name, value in (("company", company), ("state", state), ("work_type", work_type),
+                        ("employment_type", employment_type), ("platform", platform)):
+        if value:
+            values = [v.strip() for v in value.split(",") if v.strip()]
+            filters[name] = values if len(values) > 1 else values[0]
+    if posted_after:
+        filters["posted_at__gte"] = posted_after
+    if min_salary is not None:
+        filters["salary_annual_max__gte"] = min_salary
+
+    started = time.perf_counter()
+    try:
+        hits = job_store.search(q, filters, limit=max(0, min(limit, 200)), offset=max(0, offset))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if full_records:
+        for hit, record in zip(hits, job_store.get_jobs([hit["job_key"] for hit in hits])):
+            hit["job"] = record
+    return {
+        "status": "ok",
+        "query": q,
+        "filters": filters,
+        "count": len(hits),
+        "took_ms": round((time.perf_counter() - started) * 1000, 2),
+        "jobs": hits,
+    }
+
+@app.post("/jobs/match")
+async def match_jobs(request: MatchRequest):
+    """
+    Rank persisted jobs against a resume (hashed TF-IDF cosine similarity, no model calls).
+
+    Accepts JSON body:
+      {"resume": "...", "limit": 20, "job_keys": null}
+
+    Each hit carries the score, the job's basics, and which of its hard
+    skills the resume mentions or misses.
+    """
+    from shared.utils.job_store import job_store
+    from shared.utils.match_scoring import match_index
+    from shared.utils.skills import extract_skills
+    if not request.resume.strip():
+        raise HTTPException(status_code=400, detail="Empty resume")
+    version = job_store.version()
+    if _match_sync["version"] != version:
+        # Jobs persisted by other pipelines get vectors once, then stay cached
+        match_index.sync(job_store)
+        _match_sync["version"] = version
+
+    started = time.perf_counter()
+    ranked = match_index.rank(request.resume, max(0, min(request.limit, 500)), request.job_keys)
+    took_ms = round((time.perf_counter() - started) * 1000, 2)
+
+    resume_skills = set(extract_skills(request.resume)["hard_skills"])
+    jobs = job_store.get_jobs([key for key, _ in ranked])
+    results = []
+    for (key, score), job in zip(ranked, jobs):
+        job = job or {}
+        job_skills = job.get("hard_skills") or []
+        results.append({
+            "job_key": key,
+            "score": round(score, 4),
+            "title": job.get("title"),
+            "company": job.get("company") or job.get("company_name"),
+            "location": job.get("location"),
+            "url": job.get("url") or job.get("job_url"),
+            "posted_at": job.get("posted_at"),
+            "skills_matched": [s for s in job_skills if s in resume_skills],
+            "skills_missing": [s for s in job_skills if s not in resume_skills],
+        })
+    return {"status": "ok", "scored": len(match_index), "took_ms": took_ms, "jobs": results}
+
+
+@app.post("/jobs/skills")
+async def tag_skills(request: SkillsRequest):
+    """
+    Hard/soft skills for a batch of descriptions and/or persisted jobs.
+
+    Accepts JSON body:
+      {"descriptions": ["...", ...], "job_keys": ["4012345678", ...]}
+
+    Each result has the skill lists plus "jobscan", the fields
+    format_jobscan_result reads. Large batches run in a process pool.
+    """
+    from shared.utils.job_store import job_store
+    from shared.utils.skills import extract_skills_batch, jobscan_input
+    texts = [text or "" for text in request.descriptions]
+    stored = job_store.get_jobs(request.job_keys)
+    texts += [(job or {}).get("description") or "" for job in stored]
+    results = await asyncio.get_running_loop().run_in_executor(None, extract_skills_batch, texts)
+
+    for result, key in zip(results[len(request.descriptions):], request.job_keys):
+        result["job_key"] = key
+    for result in results:
+        result["jobscan"] = jobscan_input(result)
+    return {"status": "ok", "results": results}
+
+# -------------------------------------------------
+# Saved Searches
+# -------------------------------------------------
+@app.post("/saved-searches")
+async def create_saved_search(request: SavedSearchRequest):
+    """
+    Poll a search every interval_minutes (+/- jitter) for postings newer than the last poll.
+
+    Accepts JSON body:
+      {"keyword": "Data Engineer", "location": "Seattle", "interval_minutes": 60,
+       "pages": 1, "fetch_descriptions": false}
+
+    New jobs are stored and pushed to /ws/saved-searches subscribers.
+    """
+    from platforms.linkedin.scrapers.saved_search_scheduler import saved_searches, scheduler
+    try:
+        search = saved_searches.create(
+            request.keyword, request.location, request.interval_minutes, request.pages, request.fetch_descriptions
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if SAVED_SEARCH_SCHEDULER:
+        scheduler.start()  # Not running yet when this is the first saved search
+    scheduler.wake()
+    return {"status": "ok", "search": saved_searches.snapshot(search)}
+
+@app.get("/saved-searches")
+async def list_saved_searches():
+    from platforms.linkedin.scrapers.saved_search_scheduler import saved_searches
+    return {"status": "ok", "searches": [saved_searches.snapshot(s) for s in saved_searches.all()]}
+
+@app.post("/saved-searches/{search_id}/run")
+async def run_saved_search(search_id: int):
+    """Poll a saved search as soon as the scheduler is free."""
+    from platforms.linkedin.scrapers.saved_search_scheduler import saved_searches, scheduler
+    if not saved_searches.run_now(search_id):
+        raise HTTPException(status_code=404, detail="Saved search not found")
+    scheduler.wake()
+    return {"status": "ok", "search_id": search_id}
+
+@app.delete("/saved-searches/{search_id}")
+async def delete_saved_search(search_id: int):
+    from platforms.linkedin.scrapers.saved_search_scheduler import saved_searches
+    if not saved_searches.delete(search_id):
+        raise HTTPException(status_code=404, detail="Saved search not found")
+    return {"status": "ok", "search_id": search_id}
+
+@app.websocket("/ws/saved-searches")
+async def saved_search_socket(websocket: WebSocket):
+    """Streams progress, job and complete frames (each with search_id) of every scheduled poll."""
+    from platforms.linkedin.scrapers.saved_search_scheduler import scheduler
+    from shared.types.job_record import dumps_frame
+    await websocket.accept()
+    logger.info("✅ Saved-search subscriber connected")
+    queue = scheduler.subscribe()
+    try:
+        while True:
+            await websocket.send_text(dumps_frame(await queue.get()))
+    except Exception as e:
+        logger.warning(f"⚠️ Saved-search WebSocket closed: {e}")
+    finally:
+        scheduler.unsubscribe(queue)
+
 # -------------------------------------------------
 # Job Parser Endpoint
 # -------------------------------------------------
@@ -72,6 +468,8 @@ async def parse_html(request: ParseRequest):
         "parser_type": "linkedin"
       }
     """
+    from platforms.linkedin.utils.formatter import format_job_post
+    from shared.utils.skills import jobscan_input
     try:
         parser_type = request.parser_type.lower()
         logger.info(f"🔍 Parsing HTML with parser: {parser_type}")
@@ -85,8 +483,11 @@ async def parse_html(request: ParseRequest):
             )
 
         # Parse the HTML
-        parser_fn = PARSERS[parser_type]
+        parser_fn = get_parser(parser_type)
         parsed_data = parser_fn(request.html_content)
+        if parsed_data.get("parse_incomplete"):
+            logger.warning("⏱️ Parse time budget exceeded, returning partial result")
+        persist_record(parsed_data)
 
         # Format the parsed data
         formatted_output = format_job_post(parsed_data)
@@ -95,7 +496,8 @@ async def parse_html(request: ParseRequest):
             "status": "success",
             "parser": parser_type,
             "data": formatted_output,
-            "metadata": parsed_data
+            "metadata": parsed_data.to_dict(),
+            "skills": jobscan_input(parsed_data)
         }
 
     except Exception as e:
@@ -107,6 +509,9 @@ async def parse_html(request: ParseRequest):
 # -------------------------------------------------
 @app.websocket("/ws/scrape-progress")
 async def scrape_progress_socket(websocket: WebSocket):
+    from platforms.linkedin.scrapers.url_scraper import fetch_job_html  # Playwright
+    from platforms.linkedin.utils.formatter import format_job_post
+    from shared.utils.fetch_scheduler import fetch_context
     await websocket.accept()
     logger.info("✅ WebSocket connected")
 
@@ -137,7 +542,8 @@ async def scrape_progress_socket(websocket: WebSocket):
                     }))
 
                     try:
-                        html_content = await fetch_job_html(url)
+                        with fetch_context("interactive", connection_id(websocket)):
+                            html_content = await fetch_job_html(url)
                         await websocket.send_text(json.dumps({
                             "type": "progress",
                             "message": f"✅ Page loaded, parsing with {parser_type}..."
@@ -163,8 +569,11 @@ async def scrape_progress_socket(websocket: WebSocket):
                     continue
 
                 # Parse HTML
-                parser_fn = PARSERS[parser_type]
+                parser_fn = get_parser(parser_type)
                 parsed_data = parser_fn(html_content)
+                if url:
+                    parsed_data["url"] = url
+                persist_record(parsed_data)
 
                 # Format output
                 formatted_output = format_job_post(parsed_data)
@@ -197,6 +606,11 @@ async def scrape_progress_socket(websocket: WebSocket):
 # -------------------------------------------------
 @app.websocket("/ws/bulk-scrape")
 async def bulk_scrape_socket(websocket: WebSocket):
+    from platforms.linkedin.scrapers.linkedin_bulk_scraper import scrape_linkedin_jobs
+    from shared.types.job_record import dumps_frame
+    from shared.utils.change_detection import only_changes
+    from shared.utils.coordination import parsed_cache
+    from shared.utils.fetch_scheduler import fetch_context
     await websocket.accept()
     logger.info("✅ Bulk scrape WebSocket connected")
 
@@ -210,6 +624,7 @@ async def bulk_scrape_socket(websocket: WebSocket):
                 keyword = data.get("keyword")
                 location = data.get("location")
                 pages = data.get("pages", 1)
+                changes_only = data.get("changes_only", False)  # Only new or changed jobs
 
                 # Validate inputs
                 if not keyword or not location:
@@ -226,15 +641,20 @@ async def bulk_scrape_socket(websocket: WebSocket):
                 }))
 
                 job_count = 0
-                async for result in scrape_linkedin_jobs(keyword, location, pages, fetch_full_description=True):
-                    await websocket.send_text(json.dumps(result))
-
-                    # Track job count
-                    if result.get("status") == "job":
-                        job_count += 1
-                        # Format the job data if description exists
-                        if result.get("data", {}).get("description"):
-                            logger.info(f"✅ Job {job_count}: {result['data'].get('title')} - {result['data'].get('company')}")
+                stream = scrape_linkedin_jobs(keyword, location, pages, fetch_full_description=True)
+                if changes_only:
+                    stream = only_changes(stream)
+                with fetch_context("bulk", connection_id(websocket)), parsed_cache.bypass(changes_only):
+                    async for result in stream:
+                        await websocket.send_text(dumps_frame(result))
+                        persist_job(result)
+
+                        # Track job count
+                        if result.get("status") == "job":
+                            job_count += 1
+                            # Format the job data if description exists
+                            if result.get("data", {}).get("description"):
+                                logger.info(f"✅ Job {job_count}: {result['data'].get('title')} - {result['data'].get('company')}")
 
                 # Send completion message
                 await websocket.send_text(json.dumps({
@@ -261,6 +681,11 @@ async def bulk_scrape_socket(websocket: WebSocket):
 # -------------------------------------------------
 @app.websocket("/ws/test-bulk-scraper")
 async def test_bulk_scraper_socket(websocket: WebSocket):
+    from platforms.linkedin.scrapers.linkedin_bulk_scraper_test import scrape_linkedin_jobs_test
+    from shared.types.job_record import dumps_frame
+    from shared.utils.change_detection import only_changes
+    from shared.utils.coordination import parsed_cache
+    from shared.utils.fetch_scheduler import fetch_context
     await websocket.accept()
     logger.info("✅ Test bulk scraper WebSocket connected")
 
@@ -273,11 +698,17 @@ async def test_bulk_scraper_socket(websocket: WebSocket):
             keyword = data.get("keyword", "Software Engineer")
             location = data.get("location", "Seattle")
             pages = data.get("pages", 1)
+            changes_only = data.get("changes_only", False)  # Only new or changed jobs
 
             logger.info(f"🔍 Starting test bulk scrape: {keyword} in {location} ({pages} pages)")
 
-            async for result in scrape_linkedin_jobs_test(keyword, location, pages):
-                await websocket.send_text(json.dumps(result))
+            stream = scrape_linkedin_jobs_test(keyword, location, pages)
+            if changes_only:
+                stream = only_changes(stream)
+            with fetch_context("bulk", connection_id(websocket)), parsed_cache.bypass(changes_only):
+                async for result in stream:
+                    await websocket.send_text(dumps_frame(result))
+                    persist_job(result)
 
         except json.JSONDecodeError:
             await websocket.send_text(json.dumps({
@@ -292,6 +723,13 @@ async def test_bulk_scraper_socket(websocket: WebSocket):
 # -------------------------------------------------
 @app.websocket("/ws/bulk-with-descriptions")
 async def bulk_with_descriptions_socket(websocket: WebSocket):
+    from platforms.linkedin.scrapers.bulk_with_descriptions import scrape_jobs_with_descriptions
+    from platforms.linkedin.scrapers.queue_tasks import scrape_via_queue
+    from shared.types.job_record import dumps_frame
+    from shared.utils.change_detection import only_changes
+    from shared.utils.coordination import parsed_cache
+    from shared.utils.fetch_scheduler import fetch_context
+    from shared.utils.job_filters import JobFilter
     await websocket.accept()
     logger.info("✅ Bulk with descriptions WebSocket connected")
 
@@ -305,28 +743,186 @@ async def bulk_with_descriptions_socket(websocket: WebSocket):
             location = data.get("location", "Seattle")
             pages = data.get("pages", 1)
             delay = data.get("delay", 2.0)  # Delay between description fetches
+            filters = data.get("filters")  # Optional pre-fetch card filters
+            changes_only = data.get("changes_only", False)  # Only new or changed jobs
+            # Run on the worker processes (worker.py) instead of in this connection
+            queued = data.get("queued", SCRAPE_VIA_QUEUE)
+        except json.JSONDecodeError:
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": "Invalid JSON received"
+            }))
+            return
 
-            logger.info(f"🔍 Starting chained scrape: {keyword} in {location} ({pages} pages)")
-
-            async for result in scrape_jobs_with_descriptions(keyword, location, pages, delay_between=delay):
-                await websocket.send_text(json.dumps(result))
+        # Validated before streaming, so errors during the scrape are not reported as bad filters
+        try:
+            JobFilter.from_dict(filters)
+        except ValueError as e:
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": f"Invalid filters: {e}"
+            }))
+            return
+
+        logger.info(f"🔍 Starting chained scrape: {keyword} in {location} ({pages} pages{', queued' if queued else ''})")
+
+        if queued:
+            stream = scrape_via_queue(keyword, location, pages, filters=filters, fresh=changes_only)
+        else:
+            stream = scrape_jobs_with_descriptions(keyword, location, pages, delay_between=delay, filters=filters)
+        if changes_only:
+            stream = only_changes(stream)
+        with fetch_context("bulk", connection_id(websocket)), parsed_cache.bypass(changes_only):
+            async for result in stream:
+                await websocket.send_text(dumps_frame(result))
+                if not queued:  # Workers save the jobs they finish
+                    persist_job(result)
 
                 # Log job completions
                 if result.get("status") == "job":
                     data = result.get("data", {})
                     logger.info(f"✅ Complete job: {data.get('title')} - {data.get('company')}")
+    except Exception as e:
+        logger.warning(f"⚠️ Bulk with descriptions WebSocket closed: {e}")
+
+# -------------------------------------------------
+# WebSocket Endpoint for Keyword x Location Matrix Scrapes
+# -------------------------------------------------
+@app.websocket("/ws/matrix-scrape")
+async def matrix_scrape_socket(websocket: WebSocket):
+    """
+    Accepts JSON payload:
+      {"keywords": ["Python Engineer", "Data Engineer", "SRE"], "locations": "Seattle, Austin",
+       "pages": 2, "concurrency": 4, "fetch_descriptions": true, "filters": {...}, "changes_only": false}
+
+    All combinations share one concurrency limit and the LinkedIn rate budget;
+    progress frames carry their "combination", job frames every combination
+    that found the job.
+    """
+    from platforms.linkedin.scrapers.matrix_scraper import scrape_matrix, validate_matrix
+    from shared.types.job_record import dumps_frame
+    from shared.utils.change_detection import only_changes
+    from shared.utils.coordination import parsed_cache
+    from shared.utils.fetch_scheduler import fetch_context
+    await websocket.accept()
+    logger.info("✅ Matrix scrape WebSocket connected")
+
+    try:
+        raw = await websocket.receive_text()
+        logger.info(f"📩 Received matrix scrape request: {raw}")
+
+        try:
+            data = json.loads(raw)
+            request = dict(
+                keywords=data.get("keywords"),
+                locations=data.get("locations"),
+                pages=data.get("pages", 1),
+                concurrency=data.get("concurrency", 4),
+                filters=data.get("filters"),
+            )
+            # Validated before streaming, so errors during the scrape are not reported as a bad request
+            validate_matrix(**request)
+        except json.JSONDecodeError:
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": "Invalid JSON received"
+            }))
+            return
+        except ValueError as e:
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": f"Invalid matrix scrape request: {e}"
+            }))
+            return
+
+        stream = scrape_matrix(fetch_descriptions=data.get("fetch_descriptions", True), **request)
+        changes_only = data.get("changes_only", False)
+        if changes_only:
+            stream = only_changes(stream)
+        try:
+            with fetch_context("bulk", connection_id(websocket)), parsed_cache.bypass(changes_only):
+                async for result in stream:
+                    await websocket.send_text(dumps_frame(result))
+                    persist_job(result)
+        except Exception as e:
+            logger.error(f"❌ Matrix scrape failed: {e}")
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": f"Matrix scrape failed: {e}"
+            }))
+    except Exception as e:
+        logger.warning(f"⚠️ Matrix scrape WebSocket closed: {e}")
+
+@app.websocket("/ws/search-all")
+async def search_all_socket(websocket: WebSocket):
+    """
+    Accepts JSON payload:
+      {"keyword": "Python Engineer", "location": "Seattle", "pages": 2,
+       "platforms": ["linkedin", "indeed"], "fetch_descriptions": true, "filters": {...}, "changes_only": false}
 
+    Every platform is searched at once, each within its own rate budget;
+    frames carry their "platform", and a posting listed on several platforms
+    is sent once.
+    """
+    from platforms.fan_out import search_all, validate_search
+    from shared.types.job_record import dumps_frame
+    from shared.utils.change_detection import only_changes
+    from shared.utils.coordination import parsed_cache
+    from shared.utils.fetch_scheduler import fetch_context
+    await websocket.accept()
+    logger.info("✅ Cross-platform search WebSocket connected")
+
+    try:
+        raw = await websocket.receive_text()
+        logger.info(f"📩 Received cross-platform search request: {raw}")
+
+        try:
+            data = json.loads(raw)
+            request = dict(pages=data.get("pages", 1), platforms=data.get("platforms"), filters=data.get("filters"))
+            # Validated before streaming, so errors during the search are not reported as a bad request
+            validate_search(**request)
         except json.JSONDecodeError:
             await websocket.send_text(json.dumps({
                 "status": "error",
                 "message": "Invalid JSON received"
             }))
+            return
+        except ValueError as e:
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": f"Invalid cross-platform search request: {e}"
+            }))
+            return
+
+        stream = search_all(
+            data.get("keyword", ""),
+            data.get("location", ""),
+            fetch_descriptions=data.get("fetch_descriptions", True),
+            **request,
+        )
+        changes_only = data.get("changes_only", False)
+        if changes_only:
+            stream = only_changes(stream)
+        try:
+            with fetch_context("bulk", connection_id(websocket)), parsed_cache.bypass(changes_only):
+                async for result in stream:
+                    await websocket.send_text(dumps_frame(result))
+                    persist_job(result)
+        except Exception as e:
+            logger.error(f"❌ Cross-platform search failed: {e}")
+            await websocket.send_text(json.dumps({
+                "status": "error",
+                "message": f"Cross-platform search failed: {e}"
+            }))
     except Exception as e:
-        logger.warning(f"⚠️ Bulk with descriptions WebSocket closed: {e}")
+        logger.warning(f"⚠️ Cross-platform search WebSocket closed: {e}")
 
 # -------------------------------------------------
 # Run locally
 # -------------------------------------------------
 if __name__ == "__main__":
     import uvicorn  # type: ignore
-    uvicorn.run("main:app", host="0.0.0.0", port=int(os.getenv("PORT", 8000)), reload=True)
+    # Workers share the LinkedIn rate budget, circuit breaker and parsed-result
+    # cache through storage/coordination.db; reload only works with one worker
+    workers = int(os.getenv("WEB_CONCURRENCY", 1))
+    uvicorn.run("main:app", host="0.0.0.0", port=int(os.getenv("PORT", 8000)), reload=workers == 1, workers=workers)
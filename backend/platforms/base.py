@@ -0,0 +1,142 @@
+"""
+Platform plugins: what the cross-platform scrapers need from one job board.
+
+A plugin turns a board's search results into cards, fetches a card's
+description and parses a full job page. Every board's scrapers request
+through their own FetchScheduler (rate budget and circuit breaker), so a
+slow or blocked board never holds the others back; a plugin names that
+scheduler in `fetch_scheduler` for its snapshot.
+
+Plugins are registered in PLATFORMS as "module:attribute" and imported on
+first use, like main.PARSERS.
+"""
+import importlib
+import sqlite3
+from abc import ABC, abstractmethod
+
+from shared.utils.match_scoring import match_index
+from shared.utils.near_duplicates import duplicate_index
+from shared.utils.skills import tag_job
+
+PLATFORMS = {
+    "linkedin": "platforms.linkedin.plugin:platform",
+    "indeed": "platforms.indeed.plugin:platform",
+}
+
+
+class Platform(ABC):
+    """
+    Base class of the platform plugins. Subclasses set `name`, `page_size` and
+    `fetch_scheduler` (the FetchScheduler their scrapers request through) and
+    implement `search_page`, `fetch_description` and `parse`.
+    """
+
+    name = None
+    page_size = 10
+    fetch_scheduler = None
+
+    @abstractmethod
+    async def search_page(self, keyword: str, location: str, page: int) -> list:
+        """
+        One page of search results.
+
+        Returns:
+            list[JobRecord]: Cards with at least job_id, title, company and location;
+                an empty list past the last page
+
+        Raises:
+            httpx.HTTPError: When the request fails or returns an error status
+        """
+
+    @abstractmethod
+    async def fetch_description(self, card) -> dict:
+        """
+        Description of one card.
+
+        Returns:
+            dict: "status" ("success" or "error"), "description", and optionally
+                "fields": job fields the card lacked (salary, work_type...)
+        """
+
+    @abstractmethod
+    def parse(self, html: str):
+        """Parse a full job page into a JobRecord."""
+
+    def snapshot(self) -> dict:
+        return {"name": self.name, "page_size": self.page_size, "fetch_scheduler": self.fetch_scheduler.snapshot()}
+
+
+def get_platform(name: str) -> Platform:
+    """
+    The plugin registered under `name`, imported on first use.
+
+    Raises:
+        ValueError: For an unknown platform
+    """
+    if name not in PLATFORMS:
+        raise ValueError(f"Unknown platform {name!r}, expected one of {sorted(PLATFORMS)}")
+    module_name, _, attribute = PLATFORMS[name].partition(":")
+    return getattr(importlib.import_module(module_name), attribute)
+
+
+async def finish_card(card, fetch_description) -> dict:
+    """
+    Fetch one card's description and finish the job (cluster, skills, match vector).
+
+    Reposts and near duplicates are still emitted, so every posting is stored,
+    but carry "collapsed_into" with the cluster they joined. A repost of a known
+    cluster (by title + company) skips the fetch and has no description.
+
+    Args:
+        card (JobRecord): Search card with a job_id
+        fetch_description: async fn(card) returning a `Platform.fetch_description` result
+
+    Returns:
+        dict: A "job" frame; "collapsed_into" is set when the job joined another cluster
+    """
+    job_id = card.get("job_id")
+    try:
+        repost_of = duplicate_index.card_cluster(card)
+        if repost_of:
+            duplicate_index.add_card(card, repost_of)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Duplicate index unavailable for {job_id}: {e}")
+        repost_of = None
+    if repost_of:
+        combined_data = card.copy(cluster_id=repost_of, description_status="skipped_repost")
+        return {
+            "status": "job",
+            "data": combined_data,
+            "message": f"🔁 Repost of {repost_of}: {card.get('title')} at {card.get('company')} (fetch skipped)",
+            "collapsed_into": repost_of,
+        }
+
+    description_result = await fetch_description(card)
+    combined_data = card.copy(
+        description=description_result.get("description"),
+        description_status=description_result.get("status"),
+    )
+    for field, value in (description_result.get("fields") or {}).items():
+        if value is not None and combined_data.get(field) is None:
+            combined_data[field] = value
+    try:
+        cluster = duplicate_index.add(combined_data)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Duplicate index unavailable for {job_id}: {e}")
+        cluster = job_id
+    combined_data["cluster_id"] = cluster
+    tag_job(combined_data)  # hard_skills / soft_skills
+
+    # Vectorize now so resume matching never waits on tokenization
+    try:
+        match_index.add_job(combined_data)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Could not cache match vector for {job_id}: {e}")
+    if cluster != job_id:
+        return {
+            "status": "job",
+            "data": combined_data,
+            "message": f"🔁 Duplicate of {cluster}: {combined_data.get('title')} at {combined_data.get('company')}",
+            "collapsed_into": cluster,
+        }
+    return {"status": "job", "data": combined_data}
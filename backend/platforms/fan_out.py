@@ -0,0 +1,193 @@
+"""
+Cross-platform search: one keyword/location searched on every platform plugin
+(see platforms.base) at once, merged into one deduplicated stream.
+
+Each platform runs as its own task, paging through results and fetching
+descriptions as its cards arrive, paced by its own fetch scheduler, so a
+slow or rate-limited board delays only its own jobs. The same posting
+listed on several boards (same title, company and location) is kept from
+the board that listed it first; later listings are reported as merged and
+their descriptions are never fetched.
+"""
+import asyncio
+
+from platforms.base import PLATFORMS, finish_card, get_platform
+from shared.utils.job_filters import JobFilter
+from shared.utils.near_duplicates import card_key
+
+MAX_PAGES = 10
+DESCRIPTION_CONCURRENCY = 2  # Description fetches in flight per platform
+
+
+class _PlatformRun:
+    def __init__(self, plugin):
+        self.plugin = plugin
+        self.pages_fetched = 0
+        self.cards = 0
+        self.new_jobs = 0  # Cards no earlier platform listed
+        self.merged = 0  # Cards another platform listed first
+        self.skipped_fetches = 0
+        self.collapsed = 0
+        self.error = None
+
+    def summary(self) -> dict:
+        return {"pages_fetched": self.pages_fetched, "cards": self.cards, "new_jobs": self.new_jobs,
+                "merged": self.merged, "skipped_fetches": self.skipped_fetches,
+                "duplicates_collapsed": self.collapsed, "error": self.error}
+
+
+def validate_search(pages: int = 1, platforms=None, filters: dict = None) -> tuple:
+    """
+    Check a cross-platform search request before anything is fetched.
+
+    Returns:
+        tuple: ({name: plugin}, pages, JobFilter)
+
+    Raises:
+        ValueError: On an unknown platform, a non-list of platforms,
+            non-numeric pages or invalid filters
+    """
+    if platforms is not None and (
+        not isinstance(platforms, (list, tuple)) or not all(isinstance(name, str) for name in platforms)
+    ):
+        raise ValueError("platforms must be a list of platform names")
+    plugins = {name: get_platform(name) for name in dict.fromkeys(platforms or PLATFORMS)}
+    try:
+        pages = max(1, min(int(pages), MAX_PAGES))
+    except TypeError as e:  # e.g. a list for pages
+        raise ValueError(f"Invalid pages: {e}")
+    return plugins, pages, JobFilter.from_dict(filters)
+
+
+async def search_all(keyword: str, location: str, pages: int = 1, platforms=None,
+                     fetch_descriptions: bool = True, filters: dict = None):
+    """
+    Search every platform concurrently and yield one merged stream.
+
+    Args:
+        keyword (str): Job search keyword
+        location (str): Job location
+        pages (int): Pages per platform (an empty page ends a platform early)
+        platforms (list[str]): Platform names (default: every one in PLATFORMS)
+        fetch_descriptions (bool): Fetch each unique job's description
+        filters (dict): Optional pre-fetch card filters, see `JobFilter.from_dict`
+
+    Yields:
+        dict: Frames tagged with "platform": progress (including "🔀" merges
+            of cross-platform duplicates), job and error frames; a final
+            complete frame with per-platform totals
+
+    Raises:
+        ValueError: On the first iteration, see `validate_search`
+    """
+    plugins, pages, job_filter = validate_search(pages, platforms, filters)
+    names = list(plugins)
+    runs = {name: _PlatformRun(plugin) for name, plugin in plugins.items()}
+    listed_by = {}  # listing key -> platform that listed it first
+    frames = asyncio.Queue()
+    emitted = 0
+
+    def put(run: _PlatformRun, frame: dict):
+        frames.put_nowait({**frame, "platform": run.plugin.name})
+
+    async def describe(run: _PlatformRun, card, slots: asyncio.Semaphore):
+        async with slots:
+            frame = await finish_card(card, run.plugin.fetch_description)
+        if frame.get("collapsed_into"):
+            run.collapsed += 1
+        put(run, frame)
+
+    def accept(run: _PlatformRun, card) -> bool:
+        """Claim a card for `run` unless it is filtered out or another platform listed it first."""
+        key = card_key(card)
+        first = listed_by.setdefault(key, run.plugin.name) if key else run.plugin.name
+        if first != run.plugin.name:
+            run.merged += 1
+            put(run, {"status": "progress", "merged_into": first,
+                      "message": f"🔀 Also on {first}: {card.get('title')} at {card.get('company')}"})
+            return False
+        reject_reason = job_filter.check(card)
+        if reject_reason:
+            run.skipped_fetches += 1
+            return False
+        run.new_jobs += 1
+        return True
+
+    async def run_platform(run: _PlatformRun):
+        seen = set()  # job IDs, as pages of one board can overlap
+        slots = asyncio.Semaphore(DESCRIPTION_CONCURRENCY)
+        descriptions = []
+        try:
+            try:
+                await search_pages(run, seen, slots, descriptions)
+            except Exception as e:  # One board failing never ends the others
+                run.error = str(e)
+                put(run, {"status": "error", "message": f"{run.plugin.name} search failed: {e}"})
+            # Cards claimed before a page failed are still described: no other platform emits them
+            for result in await asyncio.gather(*descriptions, return_exceptions=True):
+                if isinstance(result, Exception):
+                    put(run, {"status": "error", "message": f"{run.plugin.name} description failed: {result}"})
+        finally:
+            for task in descriptions:  # Only pending when the consumer went away
+                task.cancel()
+
+    async def search_pages(run: _PlatformRun, seen: set, slots: asyncio.Semaphore, descriptions: list):
+        """Page through `run`'s results, queueing a description task per accepted card."""
+        for page in range(pages):
+            cards = await run.plugin.search_page(keyword, location, page)
+            run.pages_fetched += 1
+            new = 0
+            for card in cards:
+                job_id = card.get("job_id")
+                if not card.get("title") or not job_id or job_id in seen:
+                    continue
+                seen.add(job_id)
+                run.cards += 1
+                if card.get("platform") is None:
+                    card["platform"] = run.plugin.name
+                if not accept(run, card):
+                    continue
+                new += 1
+                if fetch_descriptions:
+                    descriptions.append(asyncio.ensure_future(describe(run, card, slots)))
+                else:
+                    put(run, {"status": "job", "data": card})
+            put(run, {"status": "progress", "page": page + 1, "pages": pages,
+                      "message": f"{run.plugin.name}: page {page + 1}/{pages}, {len(cards)} cards, {new} new"})
+            if not cards:
+                break
+
+    async def run_all():
+        try:
+            await asyncio.gather(*(run_platform(run) for run in runs.values()))
+        finally:
+            frames.put_nowait(None)
+
+    yield {
+        "status": "progress",
+        "message": f"🔍 Searching '{keyword}' in '{location}' on {', '.join(names)}",
+    }
+    pool = asyncio.ensure_future(run_all())
+    try:
+        while True:
+            frame = await frames.get()
+            if frame is None:
+                break
+            if frame["status"] == "job":
+                emitted += 1
+                frame["progress"] = str(emitted)
+            yield frame
+        await pool
+    finally:
+        if not pool.done():
+            pool.cancel()
+
+    merged = sum(run.merged for run in runs.values())
+    yield {
+        "status": "complete",
+        "message": f"✅ Cross-platform search complete! {emitted} jobs from {len(names)} platforms."
+        + (f" Merged {merged} listings found on more than one platform." if merged else ""),
+        "platforms": {name: run.summary() for name, run in runs.items()},
+        "unique_jobs": emitted,
+        "cross_platform_duplicates": merged,
+    }
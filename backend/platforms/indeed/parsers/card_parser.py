@@ -0,0 +1,66 @@
+"""
+Extractor for the job cards of an Indeed search results page (/jobs?q=...).
+"""
+from bs4 import BeautifulSoup, SoupStrainer  # type: ignore
+
+from platforms.indeed.parsers.parser import VIEW_JOB_URL, split_location, work_type
+from shared.types.job_record import JobRecord
+from shared.utils.gazetteer import normalize_location
+from shared.utils.normalize import normalize_jobs
+
+CARD_LIST = SoupStrainer(id="mosaic-provider-jobcards")
+POSTED_PREFIXES = ("Posted", "Employer", "Active")
+
+
+def _text(element):
+    return (element.get_text(" ", strip=True) or None) if element is not None else None
+
+
+def _build_card(card) -> JobRecord:
+    link = card.select_one("a.jcs-JobTitle[data-jk]")
+    job_id = link["data-jk"] if link is not None else None
+    location, employment_type = split_location(_text(card.select_one("[data-testid='text-location']")))
+    salary = _text(card.select_one(".salary-snippet-container [data-testid='attribute_snippet_testid']"))
+    attributes = " ".join(
+        element.get_text(" ", strip=True) for element in card.select("[data-testid='attribute_snippet_testid']")
+    )
+
+    date_posted = _text(card.select_one("[data-testid='myJobsStateDate']"))
+    for prefix in POSTED_PREFIXES:
+        if date_posted and date_posted.startswith(prefix + " "):
+            date_posted = date_posted[len(prefix) + 1:]
+    return JobRecord(
+        platform="indeed",
+        company=_text(card.select_one("[data-testid='company-name']")),
+        title=_text(link.select_one("span[title]") or link) if link is not None else None,
+        location=location,
+        location_normalized=normalize_location(location),
+        date_posted=date_posted,
+        job_id=job_id,
+        job_url=VIEW_JOB_URL.format(job_id=job_id) if job_id else None,
+        salary=salary,
+        work_type=work_type(attributes),
+        employment_type=employment_type,
+    )
+
+
+def extract_search_cards(html) -> list:
+    """
+    Extract every job card of an Indeed search results page.
+
+    Args:
+        html (str | bytes): Response body of /jobs
+
+    Returns:
+        list[JobRecord]: One entry per card (div.job_seen_beacon), with
+            platform, company, title, location, location_normalized,
+            date_posted, job_id (the jk key), job_url, salary, work_type and
+            employment_type, plus the typed columns of shared.utils.normalize.
+            Fields that are missing on the card are None. Ads and other
+            mosaic zones between the cards are skipped.
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    soup = BeautifulSoup(html, "html.parser", parse_only=CARD_LIST)
+    cards = [_build_card(card) for card in soup.select("div.job_seen_beacon")]
+    return normalize_jobs(cards)
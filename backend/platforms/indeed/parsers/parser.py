@@ -0,0 +1,114 @@
+"""
+Parser for Indeed job pages (viewjob?jk=...).
+
+Produces the same fields as the LinkedIn parser where Indeed has them:
+work_type is the schedule ("Full Time") and employment_type where the work
+happens ("Remote", "Hybrid", "On-Site"), as in platforms.linkedin.parsers.parser.
+"""
+import re
+
+from bs4 import BeautifulSoup  # type: ignore
+
+from shared.types.job_record import JobRecord
+from shared.utils.gazetteer import normalize_location
+from shared.utils.html_text import element_to_text
+from shared.utils.normalize import normalize_job
+from shared.utils.skills import tag_job
+
+VIEW_JOB_URL = "https://www.indeed.com/viewjob?jk={job_id}"
+
+JOB_KEY = re.compile(r'[?&]jk=([0-9a-f]{16})\b')
+WORK_TYPE = re.compile(
+    r'\b(full[\s\-]?time|part[\s\-]?time|contract|temporary|internship|freelance|seasonal|permanent)\b',
+    re.IGNORECASE
+)
+# "Remote", "Remote in Seattle, WA", "Hybrid work in Redmond, WA", "On-site in Austin, TX"
+LOCATION_MODE = re.compile(r'^(remote|hybrid(?:\s+work)?|on[\s\-]?site)\b(?:\s+in\s+(.+))?$', re.IGNORECASE)
+ZIP_CODE = re.compile(r'\s+\d{5}(?:-\d{4})?$')
+
+TITLE_SELECTORS = ("h1[data-testid='jobsearch-JobInfoHeader-title'] > span", "h1.jobsearch-JobInfoHeader-title")
+COMPANY_SELECTORS = ("[data-testid='inlineHeader-companyName'] a", "[data-testid='inlineHeader-companyName']")
+LOCATION_SELECTORS = ("[data-testid='inlineHeader-companyLocation']", "[data-testid='job-location']")
+
+
+def work_type(text: str):
+    """Schedule named in `text` ("Full Time", "Contract"...), or None."""
+    match = WORK_TYPE.search(text or "")
+    return match.group(1).replace("-", " ").strip().title() if match else None
+
+
+def split_location(text: str) -> tuple:
+    """
+    Split Indeed's location line into (location, employment_type). ZIP codes
+    are dropped so locations read (and normalize) like LinkedIn's.
+
+    "Hybrid work in Redmond, WA 98052" -> ("Redmond, WA", "Hybrid"); "Remote" -> ("Remote", "Remote").
+    """
+    text = ZIP_CODE.sub("", " ".join((text or "").split()))
+    match = LOCATION_MODE.match(text)
+    if not match:
+        return text or None, None
+    mode = match.group(1).lower()
+    employment_type = "Remote" if mode.startswith("remote") else "Hybrid" if mode.startswith("hybrid") else "On-Site"
+    return match.group(2) or text, employment_type
+
+
+def _first_text(soup, selectors):
+    for selector in selectors:
+        element = soup.select_one(selector)
+        if element is not None:
+            text = element.get_text(" ", strip=True)
+            if text:
+                return text
+    return None
+
+
+def extract_fields(html) -> JobRecord:
+    """Fields of an Indeed job page, without normalization or skill tags."""
+    soup = BeautifulSoup(html, "html.parser")
+    data = JobRecord(platform="indeed")
+
+    canonical = soup.select_one("link[rel='canonical']")
+    match = JOB_KEY.search(canonical.get("href", "")) if canonical is not None else None
+    if match:
+        data["job_id"] = match.group(1)
+        data["job_url"] = VIEW_JOB_URL.format(job_id=match.group(1))
+
+    data["title"] = _first_text(soup, TITLE_SELECTORS)
+    data["company_name"] = _first_text(soup, COMPANY_SELECTORS)
+    location, employment_type = split_location(_first_text(soup, LOCATION_SELECTORS))
+    data["location"] = location
+    data["location_normalized"] = normalize_location(location)
+    data["employment_type"] = employment_type
+
+    # "$150,000 - $180,000 a year - Full-time": salary span, then the schedule
+    salary_and_type = soup.select_one("#salaryInfoAndJobType")
+    if salary_and_type is not None:
+        spans = [span.get_text(" ", strip=True).lstrip("- ").strip() for span in salary_and_type.find_all("span")]
+        data["salary"] = next((text for text in spans if any(c in text for c in "$€£₹")), None)
+        data["work_type"] = work_type(" ".join(spans))
+
+    posted = soup.find(string=re.compile(r'\b(?:Posted|Just posted|Today)\b'))
+    if posted:
+        data["posted"] = " ".join(posted.split()).removeprefix("Posted ")
+
+    description = soup.select_one("#jobDescriptionText")
+    if description is not None:
+        data["description"] = element_to_text(description)
+    return data
+
+
+def parse_indeed_job(html):
+    """
+    Parse an Indeed job page.
+
+    Returns:
+        JobRecord: platform "indeed", job_id (the jk key), job_url, title,
+            company_name, location(_normalized), employment_type, salary,
+            work_type, posted and description when present, plus the typed
+            columns of shared.utils.normalize and hard_skills/soft_skills
+            when a description was found.
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    return normalize_job(tag_job(extract_fields(html)))
@@ -0,0 +1,26 @@
+"""
+Indeed as a platform plugin (see platforms.base): search cards, job pages
+and the job-page parser, through Indeed's own fetch scheduler.
+"""
+from platforms.base import Platform
+from platforms.indeed.parsers.parser import parse_indeed_job
+from platforms.indeed.scrapers.search import PAGE_SIZE, fetch_job_description, fetch_search_page, indeed_scheduler
+
+
+class IndeedPlatform(Platform):
+    name = "indeed"
+    page_size = PAGE_SIZE
+    fetch_scheduler = indeed_scheduler  # What fetch_search_page and fetch_job_description request through
+
+    async def search_page(self, keyword: str, location: str, page: int) -> list:
+        return await fetch_search_page(keyword, location, page)
+
+    async def fetch_description(self, card) -> dict:
+        return await fetch_job_description(card["job_id"])
+
+    def parse(self, html: str):
+        return parse_indeed_job(html)
+
+
+# Singleton
+platform = IndeedPlatform()
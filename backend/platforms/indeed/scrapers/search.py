@@ -0,0 +1,121 @@
+"""
+Indeed search pages and job pages over plain HTTP.
+
+Requests go through Indeed's own FetchScheduler: a rate budget and circuit
+breaker in shared.utils.coordination named "indeed" (another name when
+INDEED_BASE_URL points elsewhere), separate from LinkedIn's, configured by INDEED_REQUESTS_PER_MINUTE (default 20) and
+INDEED_REQUEST_BURST (default 5). INDEED_BASE_URL points the scraper at
+another host, e.g. the stand-in server (python -m standin):
+    INDEED_BASE_URL=http://127.0.0.1:8010/indeed
+"""
+import os
+import sqlite3
+
+import httpx
+
+from platforms.indeed.parsers.card_parser import extract_search_cards
+from platforms.indeed.parsers.parser import parse_indeed_job
+from shared.utils.coordination import CircuitBreaker, SharedRateBudget, coordination, parsed_cache, upstream_name
+from shared.utils.fetch_scheduler import FetchScheduler
+
+DEFAULT_INDEED_BASE_URL = "https://www.indeed.com"
+INDEED_BASE_URL = os.getenv("INDEED_BASE_URL", DEFAULT_INDEED_BASE_URL).rstrip("/")
+INDEED_REQUESTS_PER_MINUTE = float(os.getenv("INDEED_REQUESTS_PER_MINUTE", 20))
+INDEED_REQUEST_BURST = float(os.getenv("INDEED_REQUEST_BURST", 5))
+PAGE_SIZE = 10
+HEADERS = {
+    "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "accept-language": "en-US,en;q=0.9",
+    "user-agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+}
+# Indeed answers a blocked client with 403 (bot check) rather than 999
+FAILURE_STATUSES = frozenset({403, 429})
+# Job-page fields a search card may lack
+DESCRIPTION_FIELDS = ("company_name", "salary", "work_type", "employment_type", "posted")
+
+INDEED_UPSTREAM = upstream_name("indeed", INDEED_BASE_URL, DEFAULT_INDEED_BASE_URL)
+
+# Singleton
+indeed_scheduler = FetchScheduler(
+    SharedRateBudget(coordination, INDEED_UPSTREAM, INDEED_REQUESTS_PER_MINUTE / 60, burst=INDEED_REQUEST_BURST),
+    CircuitBreaker(coordination, INDEED_UPSTREAM),
+    failure_statuses=FAILURE_STATUSES,
+)
+
+
+async def _get(path: str, params: dict) -> httpx.Response:
+    await indeed_scheduler.acquire()
+    try:
+        async with httpx.AsyncClient(timeout=15.0) as client:
+            response = await client.get(f"{INDEED_BASE_URL}{path}", headers=HEADERS, params=params, follow_redirects=True)
+    except httpx.HTTPError:
+        indeed_scheduler.record(None)
+        raise
+    indeed_scheduler.record(response.status_code)
+    response.raise_for_status()
+    return response
+
+
+async def fetch_search_page(keyword: str, location: str, page: int) -> list:
+    """
+    Fetch one page of Indeed search results and parse its cards.
+
+    Args:
+        keyword (str): Job search keyword
+        location (str): Job location
+        page (int): Zero-based page number
+
+    Returns:
+        list[JobRecord]: Cards of the page, see `extract_search_cards`
+
+    Raises:
+        httpx.HTTPError: When the request fails or returns an error status
+    """
+    response = await _get("/jobs", {"q": keyword, "l": location, "start": str(page * PAGE_SIZE)})
+    return extract_search_cards(response.text)
+
+
+async def fetch_job_description(job_id: str) -> dict:
+    """
+    Fetch and parse one Indeed job page.
+
+    Args:
+        job_id (str): Indeed job key (jk)
+
+    Returns:
+        dict: "status" ("success" or "error"), "description" and "fields"
+            (DESCRIPTION_FIELDS found on the page); successful results are
+            cached across worker processes (coordination.parsed_cache)
+    """
+    cache_key = f"indeed-description:{job_id}"
+    try:
+        cached = parsed_cache.get(cache_key)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Parsed-result cache unavailable: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
+    try:
+        response = await _get("/viewjob", {"jk": job_id})
+    except httpx.HTTPStatusError as e:
+        return {"job_id": job_id, "status": "error", "error": f"HTTP {e.response.status_code}", "description": None}
+    except httpx.HTTPError as e:
+        return {"job_id": job_id, "status": "error", "error": str(e), "description": None}
+
+    job = parse_indeed_job(response.text)
+    result = {
+        "job_id": job_id,
+        "status": "success",
+        "description": job.get("description") or "No description available",
+        "fields": {field: job.get(field) for field in DESCRIPTION_FIELDS if job.get(field) is not None},
+    }
+    try:
+        parsed_cache.set(cache_key, result)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Parsed-result cache unavailable: {e}")
+    return result
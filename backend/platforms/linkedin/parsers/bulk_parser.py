@@ -3,7 +3,69 @@ Simple BeautifulSoup-based parser for LinkedIn job API endpoints.
 No complex parsing logic - just extract what we can find.
 """
 from bs4 import BeautifulSoup
-import re
+from platforms.linkedin.parsers.selector_pass import SelectorPass, element_text
+from shared.types.job_record import JobRecord
+from shared.utils.html_text import element_to_text
+from shared.utils.normalize import normalize_job
+from shared.utils.skills import tag_job
+
+
+def _looks_like_location(element) -> bool:
+    # Check if it looks like a location (contains city/state info)
+    location_text = element.get_text(strip=True)
+    return any(char in location_text for char in [',', 'Remote', 'Hybrid'])
+
+
+def _looks_like_salary(text: str) -> bool:
+    return '$' in text and len(text) < 100 and '-' in text  # Likely a salary range
+
+
+def _looks_like_applicants(text: str) -> bool:
+    return 'applicant' in text.lower() and len(text) < 50
+
+
+def _looks_like_posted(text: str) -> bool:
+    lowered = text.lower()
+    return 'ago' in lowered and len(text) < 50 and any(word in lowered for word in ['day', 'week', 'month', 'hour'])
+
+
+# All selector chains and text scans, evaluated together in one walk of the tree
+BULK_SELECTORS = SelectorPass(
+    fields={
+        "title": [
+            "h1",
+            "h2.top-card-layout__title",
+            ".topcard__title",
+            "h2",
+        ],
+        "company": [
+            "a.topcard__org-name-link",
+            ".topcard__flavor",
+            "h4",
+            "span.topcard__flavor--black-link",
+        ],
+        "location": [
+            "span.topcard__flavor--bullet",
+            ".job-details-jobs-unified-top-card__bullet",
+            "span.topcard__flavor",
+        ],
+        "description": [
+            "div.description__text",
+            "div.show-more-less-html__markup",
+            "section.description",
+            "div.description",
+            "article.job-description",
+        ],
+        # If no description found with specific selectors, fall back to all text
+        "main_content": ["main", "body"],
+    },
+    accept={"location": _looks_like_location},
+    texts={
+        "salary": _looks_like_salary,
+        "applicants": _looks_like_applicants,
+        "posted": _looks_like_posted,
+    },
+)
 
 
 def parse_linkedin_bulk(html: str) -> dict:
@@ -19,94 +81,22 @@ def parse_linkedin_bulk(html: str) -> dict:
     soup = BeautifulSoup(html, "html.parser")
     result = {}
 
-    # Extract title - try multiple selectors
-    title_selectors = [
-        "h1",
-        "h2.top-card-layout__title",
-        ".topcard__title",
-        "h2",
-    ]
-    for selector in title_selectors:
-        title_elem = soup.select_one(selector)
-        if title_elem:
-            result['title'] = title_elem.get_text(strip=True)
-            break
-
-    # Extract company
-    company_selectors = [
-        "a.topcard__org-name-link",
-        ".topcard__flavor",
-        "h4",
-        "span.topcard__flavor--black-link",
-    ]
-    for selector in company_selectors:
-        company_elem = soup.select_one(selector)
-        if company_elem:
-            result['company'] = company_elem.get_text(strip=True)
-            break
-
-    # Extract location
-    location_selectors = [
-        "span.topcard__flavor--bullet",
-        ".job-details-jobs-unified-top-card__bullet",
-        "span.topcard__flavor",
-    ]
-    for selector in location_selectors:
-        location_elem = soup.select_one(selector)
-        if location_elem:
-            location_text = location_elem.get_text(strip=True)
-            # Check if it looks like a location (contains city/state info)
-            if any(char in location_text for char in [',', 'Remote', 'Hybrid']):
-                result['location'] = location_text
-                break
-
-    # Extract description - try multiple selectors
-    description = None
-    desc_selectors = [
-        "div.description__text",
-        "div.show-more-less-html__markup",
-        "section.description",
-        "div.description",
-        "article.job-description",
-    ]
-    for selector in desc_selectors:
-        desc_elem = soup.select_one(selector)
-        if desc_elem:
-            description = desc_elem.get_text(separator="\n", strip=True)
-            break
-
-    # If no description found with specific selectors, get all text
-    if not description:
+    fields, texts = BULK_SELECTORS.run(soup)
+
+    for key in ("title", "company", "location"):
+        if key in fields:
+            result[key] = element_text(fields[key], strip=True)
+
+    description = fields.get("description")
+    description = element_to_text(description.element) if description else None
+    if not description and "main_content" in fields:
         # Get all text but try to skip navigation/header stuff
-        main_content = soup.select_one("main") or soup.select_one("body")
-        if main_content:
-            description = main_content.get_text(separator="\n", strip=True)
+        description = element_to_text(fields["main_content"].element)
 
     if description and len(description) > 100:
         result['description'] = description
 
-    # Try to extract salary if present
-    salary_patterns = soup.find_all(string=lambda text: text and '$' in text)
-    for pattern in salary_patterns:
-        text = pattern.strip()
-        if len(text) < 100 and '-' in text:  # Likely a salary range
-            result['salary'] = text
-            break
-
-    # Try to extract applicants info
-    applicants_patterns = soup.find_all(string=lambda text: text and 'applicant' in text.lower())
-    for pattern in applicants_patterns:
-        text = pattern.strip()
-        if len(text) < 50:
-            result['applicants'] = text
-            break
-
-    # Try to extract posted date
-    posted_patterns = soup.find_all(string=lambda text: text and 'ago' in text.lower())
-    for pattern in posted_patterns:
-        text = pattern.strip()
-        if len(text) < 50 and any(word in text.lower() for word in ['day', 'week', 'month', 'hour']):
-            result['posted'] = text
-            break
-
-    return result
+    # Salary, applicants info and posted date come from the same walk
+    result.update(texts)
+
+    return normalize_job(tag_job(JobRecord(result)))
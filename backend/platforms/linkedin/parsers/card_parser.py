@@ -0,0 +1,186 @@
+"""
+Single-pass extractor for LinkedIn guest search result cards.
+Streams the response through html.parser's tokenizer and only keeps state
+inside <li> elements, so no document tree is built.
+"""
+import re
+from html.parser import HTMLParser
+
+from shared.types.job_record import JobRecord
+from shared.utils.gazetteer import normalize_location
+from shared.utils.normalize import normalize_jobs
+
+GUEST_API_JOB_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+# URL format: https://www.linkedin.com/jobs/view/...-4307024582?position=...
+JOB_ID_WITH_QUERY = re.compile(r'-(\d+)\?')
+JOB_ID_AT_END = re.compile(r'-(\d+)$')
+
+SEARCH_CARD_TRACKING = "public_jobs_jserp-result_search-card"
+
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+
+# (field, tag, class) - elements whose text is captured, first match wins
+TEXT_FIELDS = (
+    ("title", "h3", "base-search-card__title"),
+    ("company", "h4", "base-search-card__subtitle"),
+    ("location", "span", "job-search-card__location"),
+    ("date_posted", "time", "job-search-card__listdate"),
+    ("actively_hiring", "span", "job-posting-benefits__text"),
+)
+
+
+def extract_job_id(job_url: str):
+    """Extract the numeric job ID from a search-card job URL."""
+    if not job_url:
+        return None
+    match = JOB_ID_WITH_QUERY.search(job_url)
+    if not match:
+        # Try without query params (e.g., ending with just the ID)
+        match = JOB_ID_AT_END.search(job_url.split('?')[0])
+    return match.group(1) if match else None
+
+
+class _Capture:
+    __slots__ = ("field", "tag", "depth", "nesting", "chunks")
+
+    def __init__(self, field, tag, depth):
+        self.field = field
+        self.tag = tag
+        self.depth = depth
+        self.nesting = 1
+        self.chunks = []
+
+
+class _SearchCardTokenizer(HTMLParser):
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.cards = []
+        self._card = None
+        self._li_nesting = 0
+        self._depth = 0
+        self._captures = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == "li":
+            if self._card is None:
+                self._card = {}
+                self._depth = 0
+            self._li_nesting += 1
+            return
+        if self._card is None or tag in VOID_TAGS:
+            return
+
+        # Direct <a> child of the subtitle <h4> holds the cleanest company name
+        parent_is_subtitle = tag == "a" and any(
+            c.field == "company" and c.depth == self._depth for c in self._captures
+        )
+
+        self._depth += 1
+        for capture in self._captures:
+            if capture.tag == tag:
+                capture.nesting += 1
+
+        attributes = dict(attrs)
+        classes = (attributes.get("class") or "").split()
+        card = self._card
+
+        if tag == "a":
+            href = attributes.get("href")
+            if "base-card__full-link" in classes and "full_link" not in card:
+                card["full_link"] = href
+            if attributes.get("data-tracking-control-name") == SEARCH_CARD_TRACKING and "tracking_link" not in card:
+                card["tracking_link"] = href
+            if parent_is_subtitle and "company_link" not in card:
+                card["company_link"] = None
+                self._captures.append(_Capture("company_link", tag, self._depth))
+            return
+
+        if tag == "time" and "job-search-card__listdate" in classes and "publication_date" not in card:
+            card["publication_date"] = attributes.get("datetime")
+
+        for field, field_tag, field_class in TEXT_FIELDS:
+            if tag == field_tag and field_class in classes and field not in card:
+                card[field] = None  # reserve: first match wins
+                self._captures.append(_Capture(field, tag, self._depth))
+
+    def handle_endtag(self, tag):
+        if self._card is None:
+            return
+        if tag == "li":
+            self._li_nesting -= 1
+            if self._li_nesting == 0:
+                self._finish_card()
+            return
+        if tag in VOID_TAGS:
+            return
+
+        self._depth -= 1
+        for capture in list(self._captures):
+            if capture.tag == tag:
+                capture.nesting -= 1
+                if capture.nesting == 0:
+                    self._finish_capture(capture)
+
+    def handle_data(self, data):
+        for capture in self._captures:
+            capture.chunks.append(data)
+
+    def _finish_capture(self, capture):
+        self._captures.remove(capture)
+        self._card[capture.field] = "".join(capture.chunks).strip()
+
+    def _finish_card(self):
+        for capture in list(self._captures):
+            self._finish_capture(capture)
+        self.cards.append(_build_card(self._card))
+        self._card = None
+
+    def close(self):
+        super().close()
+        if self._card is not None:
+            self._li_nesting = 0
+            self._finish_card()
+
+
+def _build_card(raw: dict) -> JobRecord:
+    job_url = raw.get("full_link") or raw.get("tracking_link")
+    job_id = extract_job_id(job_url)
+    company = raw.get("company_link") or raw.get("company")
+    return JobRecord(
+        company=company or None,
+        title=raw.get("title") or None,
+        location=raw.get("location") or None,
+        location_normalized=normalize_location(raw.get("location")),
+        date_posted=raw.get("date_posted") or None,
+        publication_date=raw.get("publication_date"),
+        job_id=job_id,
+        job_url=job_url,
+        guest_api_url=GUEST_API_JOB_URL.format(job_id=job_id) if job_id else None,
+        actively_hiring=raw.get("actively_hiring") or None,
+    )
+
+
+def extract_search_cards(html) -> list:
+    """
+    Extract every job card from a guest search results page in one pass.
+
+    Args:
+        html (str | bytes): Response body of seeMoreJobPostings/search
+
+    Returns:
+        list[JobRecord]: One entry per <li>, with company, title, location,
+            location_normalized (see shared.utils.gazetteer), date_posted,
+            publication_date, job_id, job_url, guest_api_url and actively_hiring,
+            plus the typed columns of shared.utils.normalize (posted_at, salary_*).
+            Fields that are missing on the card are None.
+    """
+    if isinstance(html, bytes):
+        html = html.decode("utf-8", errors="replace")
+    tokenizer = _SearchCardTokenizer()
+    tokenizer.feed(html)
+    tokenizer.close()
+    return normalize_jobs(tokenizer.cards)
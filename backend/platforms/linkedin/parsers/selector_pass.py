@@ -0,0 +1,161 @@
+"""
+Single-walk selector matching over a BeautifulSoup tree.
+Evaluates every field's fallback selector chain and every text-node predicate
+in one traversal, instead of one select_one()/find_all() scan per selector.
+"""
+import re
+from bs4 import NavigableString, Tag  # type: ignore
+
+# tag.class1.class2[attr*='value'] - the subset of CSS our selector chains use
+SIMPLE_SELECTOR = re.compile(
+    r"""^(?P<tag>[a-zA-Z][\w-]*)?
+        (?P<classes>(?:\.[\w-]+)*)
+        (?:\[(?P<attr>[\w-]+)(?P<op>\*?=)['"]?(?P<value>[^'"\]]*)['"]?\])?$""",
+    re.VERBOSE,
+)
+
+
+class SimpleSelector:
+    """One compound selector: optional tag, classes and a single attribute test."""
+    __slots__ = ("source", "tag", "classes", "attr", "op", "value")
+
+    def __init__(self, source: str):
+        match = SIMPLE_SELECTOR.match(source.strip())
+        if not match or not source.strip():
+            raise ValueError(f"Unsupported selector: {source!r}")
+        self.source = source.strip()
+        self.tag = match.group("tag")
+        self.classes = tuple(c for c in match.group("classes").split(".") if c)
+        self.attr = match.group("attr")
+        self.op = match.group("op")
+        self.value = match.group("value")
+
+    def matches(self, node: Tag) -> bool:
+        if self.tag and node.name != self.tag:
+            return False
+        if self.classes:
+            node_classes = node.get("class") or ()
+            if not all(c in node_classes for c in self.classes):
+                return False
+        if self.attr:
+            actual = node.get(self.attr)
+            if actual is None:
+                return False
+            if isinstance(actual, list):
+                actual = " ".join(actual)
+            if self.op == "*=":
+                return self.value in actual
+            return actual == self.value
+        return True
+
+
+class FieldResult:
+    """Winning element of a field and the index of the selector group that produced it."""
+    __slots__ = ("element", "group")
+
+    def __init__(self, element, group):
+        self.element = element
+        self.group = group
+
+
+class SelectorPass:
+    """
+    Compiled set of field selector chains and text predicates.
+
+    Args:
+        fields (dict[str, list[str]]): Field name -> selectors in priority order.
+            A selector containing commas is one group matching any of its parts,
+            exactly like select_one("a, b").
+        accept (dict[str, callable]): Optional field -> predicate(element). As with
+            `select_one` in a loop, only the first match of each selector is tested;
+            if it is rejected, the next selector gets its turn.
+        texts (dict[str, callable]): Text name -> predicate(stripped_text), evaluated
+            against every text node. The first passing node in document order wins.
+
+    Semantics match running `select_one` per selector in order: a field resolves
+    to the first element (document order) of the highest-priority selector that
+    has an accepted match.
+    """
+
+    def __init__(self, fields: dict, accept: dict = None, texts: dict = None):
+        self.fields = {
+            name: [[SimpleSelector(part) for part in group.split(",")] for group in groups]
+            for name, groups in fields.items()
+        }
+        self.accept = accept or {}
+        self.texts = texts or {}
+
+        # Index selectors by tag so each element is only tested against relevant ones
+        self._by_tag = {}
+        self._any_tag = []
+        for name, groups in self.fields.items():
+            for index, group in enumerate(groups):
+                for selector in group:
+                    entry = (name, index, selector)
+                    if selector.tag:
+                        self._by_tag.setdefault(selector.tag, []).append(entry)
+                    else:
+                        self._any_tag.append(entry)
+
+    def run(self, soup) -> tuple:
+        """
+        Walk `soup` once.
+
+        Returns:
+            tuple[dict, dict]: (field -> FieldResult for resolved fields,
+                text name -> first matching stripped text)
+        """
+        # first[(field, group)] = first element matching that group, False if rejected
+        first = {}
+        best = {name: len(groups) for name, groups in self.fields.items()}
+        texts = {}
+        pending_texts = dict(self.texts)
+        unresolved = {name for name, groups in self.fields.items() if groups}
+        any_tag = self._any_tag
+
+        for node in soup.descendants:
+            if isinstance(node, Tag):
+                candidates = self._by_tag.get(node.name)
+                for entries in (candidates, any_tag):
+                    if not entries:
+                        continue
+                    for name, index, selector in entries:
+                        if index >= best[name] or (name, index) in first:
+                            continue
+                        if not selector.matches(node):
+                            continue
+                        accept = self.accept.get(name)
+                        if accept and not accept(node):
+                            first[(name, index)] = False
+                            continue
+                        first[(name, index)] = node
+                        best[name] = index
+                        if index == 0:
+                            unresolved.discard(name)
+
+            elif pending_texts and isinstance(node, NavigableString):
+                text = node.strip()
+                if not text:
+                    continue
+                for name, predicate in list(pending_texts.items()):
+                    if predicate(text):
+                        texts[name] = text
+                        del pending_texts[name]
+
+            # Everything resolved at top priority - nothing later can change the result
+            if not unresolved and not pending_texts:
+                break
+
+        results = {}
+        for name, groups in self.fields.items():
+            index = best[name]
+            if index < len(groups):
+                results[name] = FieldResult(first[(name, index)], index)
+        return results, texts
+
+
+def element_text(result, **kwargs):
+    """`get_text(**kwargs)` of a field result, or None if the field did not resolve."""
+    if result is None:
+        return None
+    return result.element.get_text(**kwargs)
@@ -0,0 +1,191 @@
+"""
+Hit statistics and adaptive ordering for sequential fallback selector chains.
+
+Only chains that run one select_one() per selector gain from reordering (a
+single-walk SelectorPass evaluates its groups together and keeps the declared
+priority). Every walk records each selector it tried, misses included, and
+which one produced the match. Selectors that keep missing sink below ones that
+hit, so pages stop paying for dead selectors after LinkedIn changes markup. A small share of documents explore: every selector is
+evaluated, so a demoted selector's hit rate can recover. Exploration only adds
+statistics; the match returned is always the one the current order picks.
+Stats are persisted to storage/selector_stats.json.
+"""
+import json
+import os
+import random
+import threading
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+STATS_FILE = PROJECT_ROOT / "storage" / "selector_stats.json"
+
+EXPLORATION_RATE = 0.02  # Share of documents that evaluate every selector
+SAVE_EVERY = 50          # Persist after this many recorded documents
+RERANK_EVERY = 20        # Recompute a chain's order after this many documents
+RATE_BUCKET = 0.1        # Hit rates within the same bucket keep their declared order
+
+
+class AdaptiveSelectorChain:
+    """
+    Fallback selector list whose order follows observed hit rates.
+
+    Selectors are ranked by smoothed hit rate, rounded to RATE_BUCKET, with the
+    declared order as tie-breaker. A specific selector that keeps working is
+    therefore never overtaken by a generic one that merely also matches.
+    """
+
+    def __init__(self, name: str, selectors: list, registry):
+        self.name = name
+        self.selectors = list(selectors)
+        self._registry = registry
+        self._ranks = None
+        self._since_rank = 0
+
+    def ordered(self) -> list:
+        """Selectors in the order they should be tried for the next document."""
+        ranks = self.ranks()
+        return [self.selectors[i] for i in sorted(range(len(ranks)), key=ranks.__getitem__)]
+
+    def ranks(self) -> list:
+        """Priority (0 = try first) of each declared selector for the next document."""
+        if self._ranks is None or self._since_rank >= RERANK_EVERY:
+            order = self.ranked()
+            position = {selector: i for i, selector in enumerate(order)}
+            self._ranks = [position[selector] for selector in self.selectors]
+            self._since_rank = 0
+        return self._ranks
+
+    def explore(self) -> bool:
+        """Whether the next document should evaluate every selector, for statistics only."""
+        return len(self.selectors) > 1 and random.random() < EXPLORATION_RATE
+
+    def ranked(self) -> list:
+        """Current order, recomputed from the stats."""
+        stats = self._registry.selector_stats(self.name)
+
+        def rank(item):
+            index, selector = item
+            hits, attempts = stats.get(selector, (0, 0))
+            rate = (hits + 1) / (attempts + 2)
+            return (-round(rate / RATE_BUCKET), index)
+
+        return [selector for _, selector in sorted(enumerate(self.selectors), key=rank)]
+
+    def record(self, tried: list, winner, hits: list = None):
+        """
+        Record one document.
+
+        Args:
+            tried (list[str]): Selectors that were evaluated, in priority order
+            winner (str | None): Selector whose match was used, if any
+            hits (list[str]): Selectors in `tried` that matched (default: the winner)
+        """
+        self._since_rank += 1
+        self._registry.record(self.name, tried, winner, hits)
+
+
+class SelectorStatsRegistry:
+    """Process-wide hit counters for all adaptive chains, persisted as JSON."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._stats = None  # chain -> {"selectors": {sel: [hits, attempts]}, ...}
+        self._chains = {}
+        self._unsaved = 0
+
+    def chain(self, name: str, selectors: list) -> AdaptiveSelectorChain:
+        chain = AdaptiveSelectorChain(name, selectors, self)
+        self._chains[name] = chain
+        return chain
+
+    def _load(self):
+        # Loaded lazily so importing a parser never touches the disk
+        if self._stats is None:
+            self._stats = {}
+            if self.path.exists():
+                try:
+                    with open(self.path, "r") as f:
+                        self._stats = json.load(f)
+                except (OSError, ValueError) as e:
+                    print(f"⚠️ Ignoring unreadable selector stats {self.path}: {e}")
+        return self._stats
+
+    def _chain_stats(self, name: str) -> dict:
+        return self._load().setdefault(name, {
+            "documents": 0,
+            "misses_before_hit": 0,
+            "unresolved": 0,
+            "selectors": {},
+        })
+
+    def selector_stats(self, name: str) -> dict:
+        with self._lock:
+            selectors = self._chain_stats(name)["selectors"]
+            return {selector: tuple(counts) for selector, counts in selectors.items()}
+
+    def record(self, name: str, tried: list, winner, hits: list = None):
+        hits = {winner} if hits is None else set(hits)
+        with self._lock:
+            chain = self._chain_stats(name)
+            chain["documents"] += 1
+            for selector in tried:
+                counts = chain["selectors"].setdefault(selector, [0, 0])
+                counts[1] += 1
+                if selector in hits:
+                    counts[0] += 1
+            if winner is None:
+                chain["unresolved"] += 1
+            else:
+                chain["misses_before_hit"] += tried.index(winner)
+
+            self._unsaved += 1
+            should_save = self._unsaved >= SAVE_EVERY
+        if should_save:
+            self.save()
+
+    def save(self):
+        """Write stats to disk atomically."""
+        with self._lock:
+            if self._stats is None or not self._unsaved:
+                return
+            payload = json.dumps(self._stats, indent=2, sort_keys=True)
+            self._unsaved = 0
+        try:
+            os.makedirs(self.path.parent, exist_ok=True)
+            tmp_path = self.path.with_suffix(".tmp")
+            with open(tmp_path, "w") as f:
+                f.write(payload)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            print(f"❌ Failed to save selector stats: {e}")
+
+    def snapshot(self) -> dict:
+        """Diagnostics view: per-chain miss rates and the current selector order."""
+        with self._lock:
+            stats = json.loads(json.dumps(self._load()))
+
+        report = {}
+        for name, chain in sorted(stats.items()):
+            documents = chain["documents"]
+            resolved = documents - chain["unresolved"]
+            report[name] = {
+                "documents": documents,
+                "unresolved_rate": round(chain["unresolved"] / documents, 4) if documents else None,
+                "avg_misses_before_hit": round(chain["misses_before_hit"] / resolved, 4) if resolved else None,
+                "selectors": {
+                    selector: {
+                        "hits": hits,
+                        "attempts": attempts,
+                        "hit_rate": round(hits / attempts, 4) if attempts else None,
+                    }
+                    for selector, (hits, attempts) in chain["selectors"].items()
+                },
+            }
+            if name in self._chains:
+                report[name]["order"] = self._chains[name].ranked()
+        return report
+
+
+# Singleton
+selector_stats = SelectorStatsRegistry(STATS_FILE)
@@ -0,0 +1,29 @@
+"""
+LinkedIn as a platform plugin (see platforms.base): guest search cards, guest
+API descriptions and the job-page parser, all through the LinkedIn
+fetch scheduler.
+"""
+from platforms.base import Platform
+from platforms.linkedin.parsers.parser import parse_linkedin_job
+from platforms.linkedin.scrapers.description_fetcher import fetch_job_description
+from platforms.linkedin.scrapers.linkedin_bulk_scraper_test import PAGE_SIZE, fetch_search_page
+from shared.utils.fetch_scheduler import fetch_scheduler
+
+
+class LinkedInPlatform(Platform):
+    name = "linkedin"
+    page_size = PAGE_SIZE
+    fetch_scheduler = fetch_scheduler
+
+    async def search_page(self, keyword: str, location: str, page: int) -> list:
+        return await fetch_search_page(keyword, location, page)
+
+    async def fetch_description(self, card) -> dict:
+        return await fetch_job_description(card["job_id"], delay=0)
+
+    def parse(self, html: str):
+        return parse_linkedin_job(html)
+
+
+# Singleton
+platform = LinkedInPlatform()
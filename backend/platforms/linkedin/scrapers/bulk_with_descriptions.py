@@ -4,19 +4,42 @@ Separates concerns: metadata scraping + description fetching.
 """
 from .linkedin_bulk_scraper_test import scrape_linkedin_jobs_test
 from .description_fetcher import fetch_job_description
+from platforms.base import finish_card
+from shared.utils.job_filters import JobFilter
 
 
-async def scrape_jobs_with_descriptions(keyword: str, location: str, pages: int = 1, delay_between: float = 2.0):
+async def describe_card(job_metadata, delay: float = 0) -> dict:
+    """
+    Fetch one card's description and finish the job, see `platforms.base.finish_card`.
+
+    Args:
+        job_metadata (JobRecord): Search card with a job_id
+        delay (float): Delay before the fetch
+
+    Returns:
+        dict: A "job" frame, with "collapsed_into" for a repost or near duplicate
+    """
+    return await finish_card(job_metadata, lambda card: fetch_job_description(card["job_id"], delay=delay))
+
+
+async def scrape_jobs_with_descriptions(keyword: str, location: str, pages: int = 1, delay_between: float = 2.0, filters: dict = None):
     """
     Two-step process:
     1. Scrape job metadata (company, title, location, job_id) from search results
     2. Fetch full descriptions for each job using job IDs
 
+    Cards rejected by `filters` are dropped between the two steps, so their
+    descriptions are never fetched. Reposts are still emitted, marked with
+    "collapsed_into" and the cluster_id they joined: by title + company of a
+    known duplicate cluster before the fetch (no description), or by a
+    near-identical description after it.
+
     Args:
         keyword (str): Job search keyword
         location (str): Job location
         pages (int): Number of pages to scrape
         delay_between (float): Delay between description fetches (default 2 seconds)
+        filters (dict): Optional pre-fetch filters, see `JobFilter.from_dict`
 
     Yields:
         dict: Progress updates and complete job data (metadata + description)
@@ -27,7 +50,9 @@ async def scrape_jobs_with_descriptions(keyword: str, location: str, pages: int
         "message": f"🔍 Step 1/2: Searching for '{keyword}' in '{location}'"
     }
 
+    job_filter = JobFilter.from_dict(filters)
     job_metadata_list = []
+    skipped_fetches = 0
 
     async for result in scrape_linkedin_jobs_test(keyword, location, pages):
         # Pass through progress messages from bulk scraper
@@ -40,6 +65,15 @@ async def scrape_jobs_with_descriptions(keyword: str, location: str, pages: int
             job_id = job_data.get("job_id")
 
             if job_id:
+                reject_reason = job_filter.check(job_data)
+                if reject_reason:
+                    skipped_fetches += 1
+                    yield {
+                        "status": "progress",
+                        "message": f"⏭️ Skipped: {job_data.get('title')} at {job_data.get('company')} ({reject_reason})"
+                    }
+                    continue
+
                 job_metadata_list.append(job_data)
 
                 # Notify user we found a job
@@ -53,7 +87,9 @@ async def scrape_jobs_with_descriptions(keyword: str, location: str, pages: int
     if total_jobs == 0:
         yield {
             "status": "complete",
-            "message": "No jobs found for this search."
+            "message": "No jobs found for this search." if not skipped_fetches
+            else f"No jobs left after filtering ({skipped_fetches} skipped).",
+            "skipped_fetches": skipped_fetches,
         }
         return
 
@@ -61,39 +97,30 @@ async def scrape_jobs_with_descriptions(keyword: str, location: str, pages: int
     yield {
         "status": "progress",
         "message": f"📄 Step 2/2: Fetching full descriptions for {total_jobs} jobs..."
+        + (f" (filters skipped {skipped_fetches})" if skipped_fetches else "")
     }
 
+    collapsed = 0
     for index, job_metadata in enumerate(job_metadata_list, 1):
-        job_id = job_metadata.get("job_id")
-
         yield {
             "status": "progress",
             "message": f"Fetching description {index}/{total_jobs}: {job_metadata.get('title')}"
         }
 
-        # Fetch full description
-        description_result = await fetch_job_description(
-            job_id,
-            delay=delay_between if index > 1 else 0  # No delay for first request
-        )
-
-        # Combine metadata from step 1 with description from step 2
-        combined_data = {
-            **job_metadata,  # All metadata from bulk scraper
-            "description": description_result.get("description"),
-            "description_status": description_result.get("status"),
-        }
-
-        # Send complete job data
-        yield {
-            "status": "job",
-            "data": combined_data,
-            "progress": f"{index}/{total_jobs}"
-        }
+        # Repost check, description fetch (no delay for the first request), clustering, skills
+        frame = await describe_card(job_metadata, delay=delay_between if index > 1 else 0)
+        frame["progress"] = f"{index}/{total_jobs}"
+        if frame.get("collapsed_into"):
+            collapsed += 1
+        yield frame
 
     yield {
         "status": "complete",
         "message": f"✅ Complete! Found {total_jobs} jobs with full descriptions."
+        + (f" Filters avoided {skipped_fetches} description fetches." if skipped_fetches else "")
+        + (f" Collapsed {collapsed} duplicate postings." if collapsed else ""),
+        "skipped_fetches": skipped_fetches,
+        "duplicates_collapsed": collapsed,
     }
 
 
@@ -3,8 +3,29 @@ LinkedIn Job Description Fetcher
 Fetches full job descriptions from LinkedIn guest API endpoints using job IDs.
 """
 import asyncio
+import sqlite3
 import httpx
 from bs4 import BeautifulSoup
+from platforms.linkedin.parsers.selector_pass import SelectorPass, element_text
+from platforms.linkedin.utils.endpoints import JOB_POSTING_URL
+from shared.utils.coordination import parsed_cache
+from shared.utils.fetch_scheduler import FAILURE_STATUSES, fetch_scheduler
+from shared.utils.html_text import element_to_text
+
+DESCRIPTION_SELECTORS = SelectorPass(fields={
+    "title": ["h1, h2.top-card-layout__title, .topcard__title"],
+    "company": ["a.topcard__org-name-link, .topcard__flavor, h4"],
+    "location": ["span.topcard__flavor--bullet, .job-details-jobs-unified-top-card__bullet"],
+    # Description - try multiple selectors
+    "description": [
+        "div.description__text",
+        "div.show-more-less-html__markup",
+        "section.description",
+        "div.description",
+        "article.job-description",
+    ],
+    "main_content": ["main", "body"],
+})
 
 
 async def fetch_job_description(job_id: str, delay: float = 2.0):
@@ -16,13 +37,23 @@ async def fetch_job_description(job_id: str, delay: float = 2.0):
         delay (float): Delay before fetching (to avoid rate limiting)
 
     Returns:
-        dict: Job data with description or error message
+        dict: Job data with description or error message; successful results
+            are cached across worker processes (coordination.parsed_cache)
     """
+    cache_key = f"description:{job_id}"
+    try:
+        cached = parsed_cache.get(cache_key)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Parsed-result cache unavailable: {e}")
+        cached = None
+    if cached is not None:
+        return cached
+
     # Add delay to avoid rate limiting
     if delay > 0:
         await asyncio.sleep(delay)
 
-    guest_api_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+    guest_api_url = JOB_POSTING_URL.format(job_id=job_id)
 
     headers = {
         "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
@@ -36,52 +67,27 @@ async def fetch_job_description(job_id: str, delay: float = 2.0):
 
     try:
         async with httpx.AsyncClient(timeout=15.0) as client:
-            response = await client.get(guest_api_url, headers=headers, follow_redirects=True)
+            response = await fetch_scheduler.get(client, guest_api_url, headers=headers, follow_redirects=True)
             response.raise_for_status()
 
             # Parse with BeautifulSoup
             soup = BeautifulSoup(response.text, "html.parser")
 
-            # Extract title
-            title = None
-            title_elem = soup.select_one("h1, h2.top-card-layout__title, .topcard__title")
-            if title_elem:
-                title = title_elem.get_text(strip=True)
-
-            # Extract company
-            company = None
-            company_elem = soup.select_one("a.topcard__org-name-link, .topcard__flavor, h4")
-            if company_elem:
-                company = company_elem.get_text(strip=True)
-
-            # Extract location
-            location = None
-            location_elem = soup.select_one("span.topcard__flavor--bullet, .job-details-jobs-unified-top-card__bullet")
-            if location_elem:
-                location = location_elem.get_text(strip=True)
-
-            # Extract description - try multiple selectors
-            description = None
-            desc_selectors = [
-                "div.description__text",
-                "div.show-more-less-html__markup",
-                "section.description",
-                "div.description",
-                "article.job-description",
-            ]
-            for selector in desc_selectors:
-                desc_elem = soup.select_one(selector)
-                if desc_elem:
-                    description = desc_elem.get_text(separator="\n", strip=True)
-                    break
+            # Extract title, company, location and description in one walk
+            fields, _ = DESCRIPTION_SELECTORS.run(soup)
+
+            title = element_text(fields.get("title"), strip=True)
+            company = element_text(fields.get("company"), strip=True)
+            location = element_text(fields.get("location"), strip=True)
+
+            description = fields.get("description")
+            description = element_to_text(description.element) if description else None
 
             # If no description found with specific selectors, get all text from main content
-            if not description:
-                main_content = soup.select_one("main") or soup.select_one("body")
-                if main_content:
-                    description = main_content.get_text(separator="\n", strip=True)
+            if not description and "main_content" in fields:
+                description = element_to_text(fields["main_content"].element)
 
-            return {
+            result = {
                 "job_id": job_id,
                 "guest_api_url": guest_api_url,
                 "title": title or "N/A",
@@ -90,14 +96,22 @@ async def fetch_job_description(job_id: str, delay: float = 2.0):
                 "description": description or "No description available",
                 "status": "success"
             }
+            try:
+                parsed_cache.set(cache_key, result)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Parsed-result cache unavailable: {e}")
+            return result
 
     except httpx.HTTPStatusError as e:
+        status_code = e.response.status_code
         return {
             "job_id": job_id,
             "guest_api_url": guest_api_url,
             "status": "error",
-            "error": f"HTTP {e.response.status_code}",
-            "description": None
+            "error": f"HTTP {status_code}",
+            "description": None,
+            # Throttled or a server error: worth retrying; a 404 (removed posting) is not
+            "retryable": status_code in FAILURE_STATUSES or status_code >= 500,
         }
     except Exception as e:
         return {
@@ -105,7 +119,8 @@ async def fetch_job_description(job_id: str, delay: float = 2.0):
             "guest_api_url": guest_api_url,
             "status": "error",
             "error": str(e),
-            "description": None
+            "description": None,
+            "retryable": isinstance(e, httpx.TransportError),  # Timeouts, connection errors
         }
 
 
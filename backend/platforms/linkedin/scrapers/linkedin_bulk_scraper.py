@@ -3,6 +3,29 @@ import httpx
 from bs4 import BeautifulSoup
 import random
 import re
+import sqlite3
+from platforms.linkedin.parsers.card_parser import extract_search_cards
+from platforms.linkedin.parsers.selector_stats import selector_stats
+from platforms.linkedin.utils.endpoints import JOB_POSTING_URL, SEARCH_URL
+from shared.types.job_record import JobRecord
+from shared.utils.coordination import parsed_cache
+from shared.utils.fetch_scheduler import fetch_scheduler
+from shared.utils.html_text import element_to_text
+from shared.utils.near_duplicates import duplicate_index
+from shared.utils.normalize import normalize_job
+from shared.utils.skills import tag_job
+
+# Description fallbacks, reordered by hit rate as LinkedIn markup drifts: each
+# is a separate select_one() scan, so trying the likely hit first saves scans
+DESCRIPTION_CHAIN = selector_stats.chain("bulk_scraper.description", [
+    "div.description__text",
+    "div.show-more-less-html__markup",
+    "section.description",
+    "div.description",
+    "article.job-description",
+    "div[class*='description']",
+    "section[class*='description']",
+])
 
 def extract_job_id(url: str) -> str:
     """
@@ -36,6 +59,7 @@ def extract_job_id(url: str) -> str:
 async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, parse_description: bool = True, retry_count: int = 0) -> dict:
     """
     Fetch full job description using LinkedIn's jobs-guest API with retry logic.
+    Results are cached across worker processes (coordination.parsed_cache).
 
     Args:
         job_id (str): LinkedIn job posting ID
@@ -46,11 +70,30 @@ async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, par
     Returns:
         dict: Job description data or None if failed
     """
+    cache_key = f"full_description:{job_id}:{int(parse_description)}"
+    try:
+        cached = parsed_cache.get(cache_key)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Parsed-result cache unavailable: {e}")
+        cached = None
+    if cached is not None:
+        print(f"♻️ Cached description for job {job_id}")
+        return cached
+
+    result = await _fetch_full_job_description(job_id, client, parse_description, retry_count)
+    if result:
+        try:
+            parsed_cache.set(cache_key, result)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Parsed-result cache unavailable: {e}")
+    return result
+
+async def _fetch_full_job_description(job_id: str, client: httpx.AsyncClient, parse_description: bool, retry_count: int) -> dict:
     max_retries = 3
     base_delay = 5  # Start with 5 second delay
 
     try:
-        url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+        url = JOB_POSTING_URL.format(job_id=job_id)
         headers = {
             "accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
             "accept-language": "en-US,en;q=0.9",
@@ -72,7 +115,7 @@ async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, par
         }
 
         print(f"🔍 Fetching job description from: {url}")
-        response = await client.get(url, headers=headers, timeout=15.0, follow_redirects=True)
+        response = await fetch_scheduler.get(client, url, headers=headers, timeout=15.0, follow_redirects=True)
         response.raise_for_status()
         print(f"✅ Got response, status: {response.status_code}, length: {len(response.content)} bytes")
 
@@ -104,26 +147,25 @@ async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, par
 
         soup = BeautifulSoup(response.content, "html.parser")
 
-        # Try multiple selectors in order of preference
-        selectors = [
-            "div.description__text",
-            "div.show-more-less-html__markup",
-            "section.description",
-            "div.description",
-            "article.job-description",
-            "div[class*='description']",
-            "section[class*='description']"
-        ]
-
-        for selector in selectors:
-            description_element = soup.select_one(selector)
-            if description_element:
-                description_text = description_element.get_text(separator="\n", strip=True)
-                print(f"✅ Found description using selector '{selector}' - {len(description_text)} chars")
-                return {
-                    "description": description_text,
-                    "description_html": str(description_element)
-                }
+        # Try selectors in order of observed hit rate; exploring documents try all
+        # of them for the stats, but the first hit in that order still wins
+        explore = DESCRIPTION_CHAIN.explore()
+        tried, hits, found = [], [], None
+        for selector in DESCRIPTION_CHAIN.ordered():
+            tried.append(selector)
+            element = soup.select_one(selector)
+            if element:
+                hits.append(selector)
+                if found is None:
+                    found = (selector, element)
+                if not explore:
+                    break
+        DESCRIPTION_CHAIN.record(tried, found[0] if found else None, hits)
+        if found:
+            selector, description_element = found
+            description_text = element_to_text(description_element)
+            print(f"✅ Found description using selector '{selector}' - {len(description_text)} chars")
+            return {"description": description_text}
 
         # If no specific description element found, look for any substantial text
         print(f"⚠️ No description found with standard selectors, trying fallback...")
@@ -131,13 +173,10 @@ async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, par
         # Try to find the main content area
         main_content = soup.select_one("main") or soup.select_one("body")
         if main_content:
-            all_text = main_content.get_text(separator="\n", strip=True)
+            all_text = element_to_text(main_content, max_chars=5000)  # Limit to first 5000 chars
             if len(all_text) > 200:  # If we found substantial content
                 print(f"✅ Using fallback content - {len(all_text)} chars")
-                return {
-                    "description": all_text[:5000],  # Limit to first 5000 chars
-                    "description_html": str(main_content)
-                }
+                return {"description": all_text}
 
         print(f"❌ No description content found for job {job_id}")
         return None
@@ -149,7 +188,7 @@ async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, par
                 wait_time = base_delay * (2 ** retry_count) + random.uniform(0, 2)
                 print(f"⏳ Rate limited (429). Waiting {wait_time:.1f}s before retry {retry_count + 1}/{max_retries}...")
                 await asyncio.sleep(wait_time)
-                return await fetch_full_job_description(job_id, client, parse_description, retry_count + 1)
+                return await _fetch_full_job_description(job_id, client, parse_description, retry_count + 1)
             else:
                 print(f"❌ Max retries reached for job {job_id} after rate limiting")
                 return None
@@ -162,17 +201,27 @@ async def fetch_full_job_description(job_id: str, client: httpx.AsyncClient, par
         traceback.print_exc()
         return None
 
-async def scrape_linkedin_jobs(keyword: str, location: str, pages: int = 3, fetch_full_description: bool = False):
+async def scrape_linkedin_jobs(keyword: str, location: str, pages: int = 3, fetch_full_description: bool = False,
+                               posted_within: int = None, seen_job_ids=None):
     """
     Scrape LinkedIn job postings - EXACT implementation from Apify blog.
+
+    Args:
+        posted_within (int): Only postings from the last N seconds, newest first
+            (LinkedIn's f_TPR=r<seconds> and sortBy=DD)
+        seen_job_ids (Container[str]): Stop at the first card whose job ID is in
+            here; with posted_within this fetches only postings newer than the last poll
     """
-    url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+    url = SEARCH_URL
     params = {
         "keywords": keyword,
         "location": location,
         "trk": "public_jobs_jobs-search-bar_search-submit",
         "start": "0"
     }
+    if posted_within:
+        params["f_TPR"] = f"r{int(posted_within)}"
+        params["sortBy"] = "DD"
     headers = {
         "accept": "*/*",
         "accept-language": "en-US,en;q=0.9",
@@ -194,40 +243,47 @@ async def scrape_linkedin_jobs(keyword: str, location: str, pages: int = 3, fetc
             params["start"] = str(page * 10)
 
             # Perform a GET HTTP request to the target API
-            response = await client.get(url, headers=headers, params=params)
+            response = await fetch_scheduler.get(client, url, headers=headers, params=params)
 
-        # Parse the HTML content returned by API
-        soup = BeautifulSoup(response.content, "html.parser")
+        # A throttled (429/999) or failed page has no cards but is not the end of the results
+        if response.status_code != 200:
+            yield {"status": "error", "message": f"Search page {page + 1} returned HTTP {response.status_code}"}
+            return
 
-        # Select all <li> job posting elements
-        job_li_elements = soup.select("li")
+        # Extract all job cards returned by the API in one pass
+        cards = extract_search_cards(response.text)
 
-        if not job_li_elements:
+        if not cards:
             yield {"status": "progress", "message": "No listings found on this page."}
             continue
 
-        # Iterate over them and scrape data from each of them
-        for job_li_element in job_li_elements:
-            # Scraping logic - EXACT from Apify blog
-            link_element = job_li_element.select_one('a[data-tracking-control-name="public_jobs_jserp-result_search-card"]')
-            link = link_element["href"] if link_element else None
-
-            title_element = job_li_element.select_one("h3.base-search-card__title")
-            title = title_element.text.strip() if title_element else None
+        for card in cards:
+            link = card["job_url"]
 
-            company_element = job_li_element.select_one("h4.base-search-card__subtitle")
-            company = company_element.text.strip() if company_element else None
-
-            publication_date_element = job_li_element.select_one("time.job-search-card__listdate")
-            publication_date = publication_date_element["datetime"] if publication_date_element else None
+            if seen_job_ids is not None and card["job_id"] in seen_job_ids:
+                yield {"status": "progress", "message": f"⏹️ Reached already-seen job {card['job_id']}, stopping"}
+                return
 
             # Populate a new job posting with the scraped data
-            job_posting = {
-                "url": link,
-                "title": title,
-                "company": company,
-                "publication_date": publication_date
-            }
+            job_posting = JobRecord(
+                url=link,
+                title=card["title"],
+                company=card["company"],
+                publication_date=card["publication_date"],
+            )
+
+            # Reposts of a known duplicate cluster skip the page fetch
+            repost_of = None
+            if fetch_full_description and link:
+                try:
+                    repost_of = duplicate_index.card_cluster(job_posting)
+                    if repost_of:
+                        duplicate_index.add_card(job_posting, repost_of)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"⚠️ Duplicate index unavailable: {e}")
+            if repost_of:
+                yield {"status": "progress", "message": f"🔁 Repost of {repost_of}: {card['title']} at {card['company']} (fetch skipped)"}
+                continue
 
             # If fetch_full_description is True, fetch the job page directly
             if fetch_full_description and link:
@@ -241,7 +297,8 @@ async def scrape_linkedin_jobs(keyword: str, location: str, pages: int = 3, fetc
                     }
 
                     async with httpx.AsyncClient() as job_client:
-                        response = await job_client.get(link, headers=headers, timeout=15.0, follow_redirects=True)
+                        response = await fetch_scheduler.get(job_client, link, headers=headers, timeout=15.0,
+                                                             follow_redirects=True)
                         response.raise_for_status()
 
                     print(f"✅ Got job page, parsing with LinkedIn parser...")
@@ -268,10 +325,24 @@ async def scrape_linkedin_jobs(keyword: str, location: str, pages: int = 3, fetc
                 except Exception as e:
                     print(f"❌ Error fetching job page {link}: {e}")
 
+            frame = {"status": "job", "data": job_posting}
+            if job_posting.get("description"):
+                try:
+                    cluster = duplicate_index.add(job_posting)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"⚠️ Duplicate index unavailable: {e}")
+                    cluster = link
+                if cluster != link:
+                    # Still emitted (and stored), marked as a member of the earlier cluster
+                    frame["message"] = f"🔁 Duplicate of {cluster}: {card['title']} at {card['company']}"
+                    frame["collapsed_into"] = cluster
+                job_posting["cluster_id"] = cluster
+
+            # Typed posted_at/salary columns from the card date or page fields
+            normalize_job(job_posting)
+            tag_job(job_posting)
+
             # Yield the job
-            yield {
-                "status": "job",
-                "data": job_posting
-            }
+            yield frame
 
-        yield {"status": "progress", "message": f"Found {len(job_li_elements)} listings on page {page + 1}"}
+        yield {"status": "progress", "message": f"Found {len(cards)} listings on page {page + 1}"}
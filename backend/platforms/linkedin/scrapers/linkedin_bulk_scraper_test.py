@@ -5,13 +5,59 @@ No individual job page fetching - just what's in the search results.
 """
 import asyncio
 import httpx
-from bs4 import BeautifulSoup
+from platforms.linkedin.parsers.card_parser import extract_search_cards
+from platforms.linkedin.utils.endpoints import SEARCH_URL
+from shared.utils.fetch_scheduler import fetch_scheduler
+
+SEARCH_HEADERS = {
+    "accept": "*/*",
+    "accept-language": "en-US,en;q=0.9",
+    "user-agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    ),
+    "sec-fetch-mode": "cors",
+    "sec-fetch-site": "same-origin",
+}
+PAGE_SIZE = 10
+
+
+async def fetch_search_page(keyword: str, location: str, page: int, client: httpx.AsyncClient = None) -> list:
+    """
+    Fetch one page of guest search results and parse its cards.
+
+    Args:
+        keyword (str): Job search keyword
+        location (str): Job location
+        page (int): Zero-based page number
+        client (httpx.AsyncClient): Client to reuse; a new one is opened if None
+
+    Returns:
+        list[JobRecord]: Cards of the page, see `extract_search_cards`
+
+    Raises:
+        httpx.HTTPError: When the request fails or returns an error status
+    """
+    params = {
+        "keywords": keyword,
+        "location": location,
+        "trk": "public_jobs_jobs-search-bar_search-submit",
+        "start": str(page * PAGE_SIZE),
+    }
+    if client is None:
+        async with httpx.AsyncClient() as client:
+            response = await fetch_scheduler.get(client, SEARCH_URL, headers=SEARCH_HEADERS, params=params)
+    else:
+        response = await fetch_scheduler.get(client, SEARCH_URL, headers=SEARCH_HEADERS, params=params)
+    response.raise_for_status()
+    return extract_search_cards(response.text)
 
 
 async def scrape_linkedin_jobs_test(keyword: str, location: str, pages: int = 1):
     """
     Test scraper - EXACT Apify blog approach.
-    Gets job listings from search and extracts structured fields using BeautifulSoup.
+    Gets job listings from search and extracts structured fields with the single-pass card parser.
 
     Args:
         keyword (str): Job search keyword
@@ -28,25 +74,6 @@ async def scrape_linkedin_jobs_test(keyword: str, location: str, pages: int = 1)
             - job_url: Direct URL to job posting
             - actively_hiring: "Actively Hiring" status (if present)
     """
-    url = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
-    params = {
-        "keywords": keyword,
-        "location": location,
-        "trk": "public_jobs_jobs-search-bar_search-submit",
-        "start": "0"
-    }
-    headers = {
-        "accept": "*/*",
-        "accept-language": "en-US,en;q=0.9",
-        "user-agent": (
-            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        ),
-        "sec-fetch-mode": "cors",
-        "sec-fetch-site": "same-origin",
-    }
-
     job_count = 0
 
     # Iterate over each pagination page
@@ -54,109 +81,44 @@ async def scrape_linkedin_jobs_test(keyword: str, location: str, pages: int = 1)
         yield {"status": "progress", "message": f"Scraping page {page + 1}/{pages}"}
 
         try:
-            async with httpx.AsyncClient() as client:
-                # Set pagination
-                params["start"] = str(page * 10)
-
-                # Get job list - EXACTLY like Apify blog
-                print(f"\n{'='*60}")
-                print(f"📋 Fetching job list - Page {page + 1}")
-                print(f"{'='*60}")
-                response = await client.get(url, headers=headers, params=params)
-                response.raise_for_status()
-                print(f"✅ Got job list: {response.status_code}")
-
-            # Parse job list with BeautifulSoup
-            soup = BeautifulSoup(response.content, "html.parser")
-            job_li_elements = soup.select("li")
-
-            if not job_li_elements:
+            # Get job list - EXACTLY like Apify blog
+            print(f"\n{'='*60}")
+            print(f"📋 Fetching job list - Page {page + 1}")
+            print(f"{'='*60}")
+
+            # Extract every card from the job list in one pass
+            cards = await fetch_search_page(keyword, location, page)
+            print("✅ Got job list")
+
+            if not cards:
                 yield {"status": "progress", "message": "No listings found on this page."}
                 continue
 
-            print(f"Found {len(job_li_elements)} job listings on page {page + 1}")
-
-            # Process each job listing - Extract structured fields from DOM
-            for job_li_element in job_li_elements:
-                # Extract job URL
-                link_element = job_li_element.select_one('a.base-card__full-link')
-                if not link_element:
-                    link_element = job_li_element.select_one('a[data-tracking-control-name="public_jobs_jserp-result_search-card"]')
-                job_url = link_element["href"] if link_element else None
-
-                # Extract job ID from URL and build guest API URL
-                job_id = None
-                guest_api_url = None
-                if job_url:
-                    # URL format: https://www.linkedin.com/jobs/view/...-4307024582?position=...
-                    # Extract the job ID (last number before query params)
-                    import re
-                    match = re.search(r'-(\d+)\?', job_url)
-                    if not match:
-                        # Try without query params (e.g., ending with just the ID)
-                        match = re.search(r'-(\d+)$', job_url.split('?')[0])
-
-                    if match:
-                        job_id = match.group(1)
-                        guest_api_url = f"https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
-
-                # Extract title
-                title_element = job_li_element.select_one("h3.base-search-card__title")
-                title = title_element.text.strip() if title_element else None
-
-                # Extract company
-                company_element = job_li_element.select_one("h4.base-search-card__subtitle > a")
-                if not company_element:
-                    company_element = job_li_element.select_one("h4.base-search-card__subtitle")
-                company = company_element.text.strip() if company_element else None
-
-                # Extract location
-                location_element = job_li_element.select_one("span.job-search-card__location")
-                location = location_element.text.strip() if location_element else None
-
-                # Extract posted date
-                time_element = job_li_element.select_one("time.job-search-card__listdate")
-                date_posted = time_element.text.strip() if time_element else None
-                publication_date = time_element["datetime"] if time_element and time_element.has_attr("datetime") else None
-
-                # Extract "Actively Hiring" status
-                actively_hiring_element = job_li_element.select_one("span.job-posting-benefits__text")
-                actively_hiring = actively_hiring_element.text.strip() if actively_hiring_element else None
+            print(f"Found {len(cards)} job listings on page {page + 1}")
 
+            # Process each job listing
+            for job_data in cards:
                 # Skip if no title or job ID
-                if not title or not job_id:
+                if not job_data["title"] or not job_data["job_id"]:
                     continue
 
-                # Create structured job data
-                job_data = {
-                    "company": company,
-                    "title": title,
-                    "location": location,
-                    "date_posted": date_posted,
-                    "publication_date": publication_date,
-                    "job_id": job_id,
-                    "job_url": job_url,
-                    "guest_api_url": guest_api_url,
-                    "actively_hiring": actively_hiring,
-                }
-
                 job_count += 1
 
                 print(f"\n✅ Job {job_count}:")
-                print(f"   - Title: {title}")
-                print(f"   - Company: {company}")
-                print(f"   - Location: {location}")
-                print(f"   - Posted: {date_posted}")
-                print(f"   - Actively Hiring: {actively_hiring}")
-                print(f"   - Job ID: {job_id}")
-                print(f"   - Guest API URL: {guest_api_url}")
+                print(f"   - Title: {job_data['title']}")
+                print(f"   - Company: {job_data['company']}")
+                print(f"   - Location: {job_data['location']}")
+                print(f"   - Posted: {job_data['date_posted']}")
+                print(f"   - Actively Hiring: {job_data['actively_hiring']}")
+                print(f"   - Job ID: {job_data['job_id']}")
+                print(f"   - Guest API URL: {job_data['guest_api_url']}")
 
                 yield {
                     "status": "job",
                     "data": job_data
                 }
 
-            yield {"status": "progress", "message": f"Completed page {page + 1} - Found {len(job_li_elements)} listings"}
+            yield {"status": "progress", "message": f"Completed page {page + 1} - Found {len(cards)} listings"}
 
         except Exception as e:
             print(f"❌ Error on page {page + 1}: {e}")
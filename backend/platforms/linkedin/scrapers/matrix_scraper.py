@@ -0,0 +1,228 @@
+"""
+Keyword x location matrix scrapes.
+
+Every keyword/location combination is expanded into page-level tasks,
+ordered round-robin (page 1 of every combination, then page 2, ...), and run
+by one pool of `concurrency` workers; every request also draws from the
+shared rate budget. Job IDs are deduplicated across combinations once all
+search pages are in, so a job found by several combinations has its
+description fetched once and lists every combination that found it.
+"""
+import asyncio
+from collections import deque
+
+import httpx
+
+from .bulk_with_descriptions import describe_card
+from .linkedin_bulk_scraper_test import fetch_search_page
+from shared.utils.job_filters import JobFilter
+
+MAX_COMBINATIONS = 100
+MAX_CONCURRENCY = 8
+
+
+def _terms(value) -> list:
+    """Comma-separated string or list -> unique non-empty terms, in order."""
+    if isinstance(value, str):
+        value = value.split(",")
+    return list(dict.fromkeys(term.strip() for term in value or [] if term and term.strip()))
+
+
+def validate_matrix(keywords, locations, pages: int = 1, concurrency: int = 4, filters: dict = None) -> tuple:
+    """
+    Check a matrix scrape request before anything is fetched.
+
+    Returns:
+        tuple: (keywords, locations, pages, concurrency, JobFilter)
+
+    Raises:
+        ValueError: On an empty or oversized matrix, non-numeric pages or
+            concurrency, or invalid filters
+    """
+    try:
+        keywords, locations = _terms(keywords), _terms(locations)
+        pages = max(1, int(pages))
+        concurrency = max(1, min(int(concurrency), MAX_CONCURRENCY))
+    except (TypeError, AttributeError) as e:  # e.g. a number for keywords, a list for pages
+        raise ValueError(f"Invalid value: {e}")
+    if not keywords or not locations:
+        raise ValueError("At least one keyword and one location are required")
+    if len(keywords) * len(locations) > MAX_COMBINATIONS:
+        raise ValueError(f"At most {MAX_COMBINATIONS} combinations per matrix scrape")
+    return keywords, locations, pages, concurrency, JobFilter.from_dict(filters)
+
+
+class _Combination:
+    def __init__(self, keyword: str, location: str, pages: int):
+        self.keyword = keyword
+        self.location = location
+        self.pages = pages
+        self.pages_fetched = 0
+        self.cards = 0
+        self.new_jobs = 0  # Cards not already found by an earlier combination
+        self.exhausted = False  # An empty page ends the combination
+
+    def label(self) -> dict:
+        return {"keyword": self.keyword, "location": self.location}
+
+    def summary(self) -> dict:
+        return {**self.label(), "pages_fetched": self.pages_fetched, "cards": self.cards,
+                "new_jobs": self.new_jobs, "shared_jobs": self.cards - self.new_jobs}
+
+
+async def _run_pool(tasks: deque, concurrency: int, frames: asyncio.Queue):
+    """Run `tasks` (async callables taking `frames`) on `concurrency` workers, then put None on `frames`."""
+    async def worker():
+        while tasks:
+            await tasks.popleft()(frames)
+
+    try:
+        await asyncio.gather(*(worker() for _ in range(max(1, min(concurrency, len(tasks))))))
+    finally:
+        frames.put_nowait(None)
+
+
+async def _drain(tasks: deque, concurrency: int):
+    """Yield the frames `tasks` produce while the pool runs them."""
+    frames = asyncio.Queue()
+    pool = asyncio.ensure_future(_run_pool(tasks, concurrency, frames))
+    try:
+        while True:
+            frame = await frames.get()
+            if frame is None:
+                break
+            yield frame
+        await pool  # Re-raises a worker's exception
+    finally:
+        if not pool.done():
+            pool.cancel()
+
+
+async def scrape_matrix(keywords, locations, pages: int = 1, concurrency: int = 4,
+                        fetch_descriptions: bool = True, filters: dict = None):
+    """
+    Scrape every keyword x location combination under one concurrency limit.
+
+    Args:
+        keywords (list[str] | str): Search keywords, or one comma-separated string
+        locations (list[str] | str): Locations, or one comma-separated string
+        pages (int): Pages per combination
+        concurrency (int): Requests in flight at once, across all combinations
+        fetch_descriptions (bool): Fetch each unique job's description
+        filters (dict): Optional pre-fetch card filters, see `JobFilter.from_dict`
+
+    Yields:
+        dict: Progress frames carrying "combination" and its page counts; job
+            frames carrying "combinations" (every combination that found the
+            job); a final complete frame with per-combination totals
+
+    Raises:
+        ValueError: On the first iteration, see `validate_matrix`
+    """
+    keywords, locations, pages, concurrency, job_filter = validate_matrix(
+        keywords, locations, pages, concurrency, filters
+    )
+
+    combinations = [_Combination(keyword, location, pages) for keyword in keywords for location in locations]
+    found = {}  # job ID -> card, in discovery order
+    found_by = {}  # job ID -> [combination labels]
+    skipped_fetches = 0
+
+    yield {
+        "status": "progress",
+        "message": f"🔍 Matrix scrape: {len(keywords)} keywords x {len(locations)} locations "
+                   f"= {len(combinations)} combinations, {len(combinations) * pages} pages",
+    }
+
+    def page_task(combination: _Combination, page: int, client: httpx.AsyncClient):
+        async def run(frames: asyncio.Queue):
+            nonlocal skipped_fetches
+            if combination.exhausted:
+                return
+            try:
+                cards = await fetch_search_page(combination.keyword, combination.location, page, client)
+            except Exception as e:
+                frames.put_nowait({
+                    "status": "error",
+                    "combination": combination.label(),
+                    "message": f"Failed to load page {page + 1} of '{combination.keyword}' in "
+                               f"'{combination.location}': {e}",
+                })
+                return
+            combination.pages_fetched += 1
+            if not cards:
+                combination.exhausted = True
+            new = 0
+            for card in cards:
+                job_id = card["job_id"]
+                if not card["title"] or not job_id:
+                    continue
+                combination.cards += 1
+                if job_id in found_by:
+                    found_by[job_id].append(combination.label())
+                    continue
+                found_by[job_id] = [combination.label()]
+                reject_reason = job_filter.check(card)
+                if reject_reason:
+                    skipped_fetches += 1
+                    continue
+                found[job_id] = card
+                combination.new_jobs += 1
+                new += 1
+            frames.put_nowait({
+                "status": "progress",
+                "combination": combination.label(),
+                "page": page + 1,
+                "pages": combination.pages,
+                "message": f"'{combination.keyword}' in '{combination.location}': page {page + 1}/{pages}, "
+                           f"{len(cards)} cards, {new} new",
+            })
+        return run
+
+    # Round-robin: page 1 of every combination, then page 2, ...
+    async with httpx.AsyncClient() as client:
+        tasks = deque(page_task(c, page, client) for page in range(pages) for c in combinations)
+        async for frame in _drain(tasks, concurrency):
+            yield frame
+
+    shared = sum(len(labels) - 1 for labels in found_by.values())
+    yield {
+        "status": "progress",
+        "message": f"📄 {len(found)} unique jobs across {len(combinations)} combinations "
+                   f"({shared} cross-combination duplicates dropped before fetching descriptions)",
+    }
+
+    collapsed = 0
+    emitted = 0
+
+    def description_task(job_id: str, card):
+        async def run(frames: asyncio.Queue):
+            nonlocal collapsed, emitted
+            frame = await describe_card(card)  # No delay: paced by the fetch scheduler
+            if frame.get("collapsed_into"):
+                collapsed += 1
+            emitted += 1
+            frames.put_nowait({**frame, "combinations": found_by[job_id], "progress": f"{emitted}/{len(found)}"})
+        return run
+
+    if fetch_descriptions:
+        tasks = deque(description_task(job_id, card) for job_id, card in found.items())
+        async for frame in _drain(tasks, concurrency):
+            yield frame
+    else:
+        for job_id, card in found.items():
+            emitted += 1
+            yield {"status": "job", "data": card, "combinations": found_by[job_id],
+                   "progress": f"{emitted}/{len(found)}"}
+
+    yield {
+        "status": "complete",
+        "message": f"✅ Matrix scrape complete! {emitted} jobs from {len(combinations)} combinations."
+        + (f" Filters avoided {skipped_fetches} description fetches." if skipped_fetches else "")
+        + (f" Collapsed {collapsed} duplicate postings." if collapsed else ""),
+        "combinations": [c.summary() for c in combinations],
+        "unique_jobs": len(found),
+        "cross_combination_duplicates": shared,
+        "skipped_fetches": skipped_fetches,
+        "duplicates_collapsed": collapsed,
+    }
@@ -0,0 +1,170 @@
+"""
+LinkedIn scrapes on the work queue (shared.utils.work_queue).
+
+A queued bulk scrape is one "search_page" task per page; each page task
+parses its cards, drops the ones the filters reject and enqueues one
+"description" task per remaining card, deduplicated by job_id across the
+run. Workers (backend/worker.py) execute the tasks and save the finished
+jobs to the job store; the API process only enqueues the pages and streams
+the run's frames with `scrape_via_queue`.
+"""
+import asyncio
+import json
+import sqlite3
+import time
+
+from .description_fetcher import fetch_job_description
+from .linkedin_bulk_scraper_test import fetch_search_page
+from platforms.base import finish_card
+from shared.types.job_record import JobRecord
+from shared.utils.coordination import parsed_cache
+from shared.utils.job_filters import JobFilter
+from shared.utils.job_store import job_store
+from shared.utils.work_queue import work_queue
+
+RESULT_POLL = 0.25  # Seconds between result reads while a run is open
+WORKER_WAIT = 10  # Seconds without progress before the client is told no worker seems to run
+
+
+def save(job):
+    """Upsert a finished job; storage errors are only logged."""
+    try:
+        job_store.save_job(job)
+    except (sqlite3.Error, OSError) as e:
+        print(f"⚠️ Could not persist job {job.get('job_id')}: {e}")
+
+
+async def run_search_page(payload: dict):
+    """
+    Fetch and filter one page of search results.
+
+    Returns:
+        tuple: (frames, follow-up description tasks)
+    """
+    keyword, location, page = payload["keyword"], payload["location"], payload["page"]
+    cards = await fetch_search_page(keyword, location, page)
+    job_filter = JobFilter.from_dict(payload.get("filters"))
+    frames = [{"status": "progress", "message": f"📄 Page {page + 1}: {len(cards)} jobs for '{keyword}' in '{location}'"}]
+    follow_ups = []
+    for card in cards:
+        job_id = card.get("job_id")
+        if not job_id:
+            continue
+        reject_reason = job_filter.check(card)
+        if reject_reason:
+            frames.append({
+                "status": "progress",
+                "message": f"⏭️ Skipped: {card.get('title')} at {card.get('company')} ({reject_reason})",
+            })
+        elif payload.get("fetch_descriptions", True):
+            follow_ups.append(("description", {"card": card.to_dict(), "fresh": payload.get("fresh", False)}, job_id))
+        else:
+            save(card)
+            frames.append({"status": "job", "data": card})
+    return frames, follow_ups
+
+
+class DescriptionUnavailable(Exception):
+    """The description fetch failed for good (e.g. HTTP 404 for a removed posting)."""
+
+
+async def fetch_or_raise(card) -> dict:
+    """
+    `fetch_job_description` without a delay (the fetch scheduler paces requests).
+    A retryable failure (429/999/5xx, timeout) raises so the work queue retries
+    the task; any other failure raises DescriptionUnavailable.
+    """
+    result = await fetch_job_description(card["job_id"], delay=0)
+    if result.get("status") == "error":
+        if result.get("retryable"):
+            raise RuntimeError(f"Description of {card['job_id']} not fetched: {result.get('error')}")
+        raise DescriptionUnavailable(result.get("error"))
+    return result
+
+
+async def run_description(payload: dict):
+    """Fetch one card's description; the finished job is saved before its frame is stored."""
+    card = JobRecord.from_dict(payload["card"])
+    try:
+        with parsed_cache.bypass(payload.get("fresh", False)):
+            frame = await finish_card(card, fetch_or_raise)
+    except DescriptionUnavailable as e:
+        return [{
+            "status": "error",
+            "message": f"Failed to fetch job {card.get('job_id')}: {e}",
+            "job_id": card.get("job_id"),
+        }], []
+    if frame["status"] == "job":
+        save(frame["data"])
+    return [frame], []
+
+
+HANDLERS = {
+    "search_page": run_search_page,
+    "description": run_description,
+}
+
+
+async def scrape_via_queue(keyword: str, location: str, pages: int = 1, filters: dict = None,
+                           fetch_descriptions: bool = True, fresh: bool = False):
+    """
+    Enqueue a bulk scrape and stream its frames as the workers produce them.
+    Closing the generator (client gone) cancels the run's queued tasks.
+
+    Args:
+        keyword (str): Job search keyword
+        location (str): Job location
+        pages (int): Number of pages to scrape
+        filters (dict): Optional pre-fetch filters, see `JobFilter.from_dict`
+        fetch_descriptions (bool): Queue a description task per card (default True)
+        fresh (bool): Workers skip the parsed-result cache (changes_only scrapes)
+
+    Yields:
+        dict: Progress and job frames in completion order, then a "complete" frame
+
+    Raises:
+        ValueError: On invalid filters, before anything is enqueued
+    """
+    JobFilter.from_dict(filters)  # Validate here: a worker would only fail the task
+    tasks = [
+        ("search_page", {"keyword": keyword, "location": location, "page": page, "filters": filters,
+                         "fetch_descriptions": fetch_descriptions, "fresh": fresh}, f"page:{page}")
+        for page in range(pages)
+    ]
+    run_id = work_queue.create_run(tasks, meta={"keyword": keyword, "location": location, "pages": pages})
+    yield {"status": "progress", "message": f"📥 Queued {pages} pages for '{keyword}' in '{location}' (run {run_id[:8]})"}
+
+    last_id = 0
+    jobs = 0
+    last_progress = time.monotonic()
+    warned = False
+    finished = False
+    try:
+        while True:
+            # Read the status first: frames stored before the run closed are all visible after it
+            status = work_queue.run_status(run_id)
+            rows = work_queue.results(run_id, last_id)
+            for last_id, raw in rows:
+                frame = json.loads(raw)
+                jobs += frame.get("status") == "job"
+                yield frame
+            if rows:
+                last_progress = time.monotonic()
+                continue  # Drain before checking again
+            if not status["open"]:
+                break
+            if not warned and time.monotonic() - last_progress > WORKER_WAIT and not status.get("leased"):
+                warned = True
+                yield {"status": "progress", "message": "⏳ Waiting for a worker (start one with `python worker.py`)"}
+            await asyncio.sleep(RESULT_POLL)
+        finished = True
+    finally:
+        work_queue.close_run(run_id, cancelled=not finished)
+
+    failed = status.get("failed", 0)
+    yield {
+        "status": "complete",
+        "message": f"Scraped {jobs} jobs" + (f" ({failed} tasks failed)" if failed else ""),
+        "run_id": run_id,
+        "tasks": {k: v for k, v in status.items() if k != "open"},
+    }
@@ -0,0 +1,435 @@
+"""
+Scheduled incremental crawling of saved LinkedIn searches.
+
+A saved search (keyword, location, interval) lives in the saved_searches
+table of storage/jobs.db together with the job IDs its polls have seen. Each
+poll asks only for postings since the previous successful poll, newest first,
+and stops at the first job ID it has already seen, so it usually fetches one
+page. A poll that fails (an exception, or an error such as a throttled search
+page) leaves that window and the seen IDs alone and is retried sooner, with
+backoff; jobs it already published are remembered so the retry does not
+publish them again, but are not stop markers until a poll completes.
+Polls run one at a time, at their interval +/- JITTER, and their requests go
+through the fetch scheduler as background work, behind interactive and bulk
+requests.
+New jobs are written to the job store and published to subscribers.
+
+With several worker processes only the holder of the scheduler lease (in
+storage/coordination.db) polls; the others stand by and take over when it
+stops renewing. Frames go through the saved_search_events table, which every
+process with subscribers tails, so a /ws/saved-searches client gets them
+whichever worker it is connected to.
+"""
+import asyncio
+import json
+import random
+import sqlite3
+import threading
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+from platforms.linkedin.parsers.card_parser import extract_job_id
+from platforms.linkedin.scrapers.linkedin_bulk_scraper import scrape_linkedin_jobs
+from shared.types.job_record import dumps_frame
+from shared.utils.coordination import Lease, coordination, parsed_cache
+from shared.utils.fetch_scheduler import fetch_context
+from shared.utils.job_store import JOBS_DB, job_store
+
+MIN_INTERVAL_MINUTES = 5
+JITTER = 0.2  # Polls run at interval * (1 +/- JITTER)
+FIRST_POLL_WINDOW = 24 * 3600  # Seconds of history a new search starts with
+MAX_POLL_WINDOW = 7 * 24 * 3600
+WINDOW_MARGIN = 1.5  # Recency window = time since last poll * margin, as LinkedIn dates are coarse
+MAX_SEEN_IDS = 500  # Newest job IDs kept per search
+IDLE_CHECK_SECONDS = 30
+RETRY_MINUTES = 2  # First retry after a failed poll, doubling up to the interval
+SUBSCRIBER_QUEUE_SIZE = 1000
+EVENT_POLL = 0.5  # Seconds between reads of the shared event table while someone is subscribed
+EVENT_RETENTION = 3600  # Seconds published frames are kept for the other processes
+LEASE_SECONDS = 300  # Renewed before every poll; a dead holder is replaced after this
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_searches (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    keyword TEXT NOT NULL,
+    location TEXT NOT NULL,
+    interval_minutes REAL NOT NULL,
+    pages INTEGER NOT NULL,
+    fetch_descriptions INTEGER NOT NULL,
+    created_at TEXT NOT NULL,
+    last_run_at REAL,
+    next_run_at REAL NOT NULL,
+    seen_job_ids TEXT NOT NULL DEFAULT '[]',
+    runs INTEGER NOT NULL DEFAULT 0,
+    last_new_jobs INTEGER,
+    pending_job_ids TEXT NOT NULL DEFAULT '[]',
+    failures INTEGER NOT NULL DEFAULT 0
+)
+"""
+COLUMNS = ("id", "keyword", "location", "interval_minutes", "pages", "fetch_descriptions", "created_at",
+           "last_run_at", "next_run_at", "seen_job_ids", "runs", "last_new_jobs", "pending_job_ids", "failures")
+EVENTS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS saved_search_events (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created REAL NOT NULL,
+    frame TEXT NOT NULL
+)
+"""
+# Columns added after the table was first released, with their definitions
+ADDED_COLUMNS = {
+    "pending_job_ids": "TEXT NOT NULL DEFAULT '[]'",
+    "failures": "INTEGER NOT NULL DEFAULT 0",
+}
+
+
+def _next_run(interval_minutes: float, now: float) -> float:
+    return now + interval_minutes * 60 * random.uniform(1 - JITTER, 1 + JITTER)
+
+
+def _iso(timestamp):
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, timezone.utc).replace(microsecond=0).isoformat()
+
+
+class SavedSearches:
+    """CRUD for saved searches; thread-safe, connection opened lazily."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+            self._conn.execute(EVENTS_SCHEMA)
+            existing = {row[1] for row in self._conn.execute("PRAGMA table_info(saved_searches)")}
+            for column, definition in ADDED_COLUMNS.items():
+                if column not in existing:
+                    self._conn.execute(f"ALTER TABLE saved_searches ADD COLUMN {column} {definition}")
+            self._conn.commit()
+        return self._conn
+
+    def _rows(self, where: str = "", params: tuple = ()) -> list:
+        with self._lock:
+            rows = self._connect().execute(f"SELECT {', '.join(COLUMNS)} FROM saved_searches {where}", params)
+            searches = [dict(zip(COLUMNS, row)) for row in rows]
+        for search in searches:
+            search["seen_job_ids"] = json.loads(search["seen_job_ids"])
+            search["pending_job_ids"] = json.loads(search["pending_job_ids"])
+            search["fetch_descriptions"] = bool(search["fetch_descriptions"])
+        return searches
+
+    def create(self, keyword: str, location: str, interval_minutes: float = 60, pages: int = 1,
+               fetch_descriptions: bool = False) -> dict:
+        """Save a search; its first poll is spread over the first JITTER share of the interval."""
+        if not keyword or not location:
+            raise ValueError("keyword and location are required")
+        if interval_minutes < MIN_INTERVAL_MINUTES:
+            raise ValueError(f"interval_minutes must be at least {MIN_INTERVAL_MINUTES}")
+        if pages < 1:
+            raise ValueError("pages must be at least 1")
+        now = time.time()
+        first_run = now + random.uniform(0, interval_minutes * 60 * JITTER)
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                cursor = conn.execute(
+                    "INSERT INTO saved_searches (keyword, location, interval_minutes, pages, fetch_descriptions, "
+                    "created_at, next_run_at) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (keyword, location, interval_minutes, pages, int(fetch_descriptions), _iso(now), first_run),
+                )
+            return self.get(cursor.lastrowid)
+
+    def get(self, search_id: int):
+        found = self._rows("WHERE id = ?", (search_id,))
+        return found[0] if found else None
+
+    def all(self) -> list:
+        return self._rows("ORDER BY id")
+
+    def due(self, now: float) -> list:
+        return self._rows("WHERE next_run_at <= ? ORDER BY next_run_at", (now,))
+
+    def next_due_at(self):
+        with self._lock:
+            return self._connect().execute("SELECT MIN(next_run_at) FROM saved_searches").fetchone()[0]
+
+    def run_now(self, search_id: int) -> bool:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute(
+                    "UPDATE saved_searches SET next_run_at = ? WHERE id = ?", (time.time(), search_id)
+                ).rowcount > 0
+
+    def delete(self, search_id: int) -> bool:
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                return conn.execute("DELETE FROM saved_searches WHERE id = ?", (search_id,)).rowcount > 0
+
+    def record_run(self, search: dict, new_job_ids: list, ran_at: float, next_run_at: float):
+        """
+        Store a completed poll: its start becomes the next poll's window anchor and
+        its IDs (plus those failed polls published) become stop markers, newest
+        first, capped at MAX_SEEN_IDS.
+        """
+        seen = list(dict.fromkeys(new_job_ids + search["pending_job_ids"] + search["seen_job_ids"]))[:MAX_SEEN_IDS]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE saved_searches SET last_run_at = ?, next_run_at = ?, seen_job_ids = ?, "
+                    "runs = runs + 1, last_new_jobs = ?, pending_job_ids = '[]', failures = 0 WHERE id = ?",
+                    (ran_at, next_run_at, json.dumps(seen), len(new_job_ids), search["id"]),
+                )
+
+    def record_failure(self, search: dict, published_job_ids: list, next_run_at: float):
+        """
+        Store a failed poll: last_run_at and the stop markers stay as they were,
+        so the retry covers the same window; the IDs it published are kept apart
+        so the retry does not publish them again.
+        """
+        pending = list(dict.fromkeys(published_job_ids + search["pending_job_ids"]))[:MAX_SEEN_IDS]
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute(
+                    "UPDATE saved_searches SET next_run_at = ?, pending_job_ids = ?, failures = failures + 1 "
+                    "WHERE id = ?",
+                    (next_run_at, json.dumps(pending), search["id"]),
+                )
+
+    def append_event(self, frame: dict):
+        """Store a published frame for the subscribers of every process; old frames are purged."""
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            with conn:
+                conn.execute("INSERT INTO saved_search_events (created, frame) VALUES (?, ?)",
+                             (now, dumps_frame(frame)))
+                conn.execute("DELETE FROM saved_search_events WHERE created < ?", (now - EVENT_RETENTION,))
+
+    def events_after(self, last_id: int) -> list:
+        """[(id, frame JSON)] published after event `last_id`, oldest first."""
+        with self._lock:
+            return self._connect().execute(
+                "SELECT id, frame FROM saved_search_events WHERE id > ? ORDER BY id", (last_id,)
+            ).fetchall()
+
+    def last_event_id(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COALESCE(MAX(id), 0) FROM saved_search_events").fetchone()[0]
+
+    def snapshot(self, search: dict) -> dict:
+        """API view: timestamps as ISO strings, seen IDs only counted."""
+        view = {k: v for k, v in search.items() if k not in ("seen_job_ids", "pending_job_ids")}
+        view["last_run_at"] = _iso(search["last_run_at"])
+        view["next_run_at"] = _iso(search["next_run_at"])
+        view["seen_jobs"] = len(search["seen_job_ids"])
+        return view
+
+
+class SavedSearchScheduler:
+    """Background task polling due saved searches and notifying subscribers."""
+
+    def __init__(self, searches: SavedSearches, lease: Lease = None):
+        self.searches = searches
+        self.lease = lease
+        self._task = None
+        self._wake = None
+        self._subscribers = set()
+        self._relay_task = None
+
+    def subscribe(self) -> asyncio.Queue:
+        """Queue of every published frame, from whichever process polls."""
+        queue = asyncio.Queue(maxsize=SUBSCRIBER_QUEUE_SIZE)
+        self._subscribers.add(queue)
+        if self._relay_task is None or self._relay_task.done():
+            self._relay_task = asyncio.create_task(self._relay())
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        self._subscribers.discard(queue)
+
+    def publish(self, frame: dict):
+        """Store `frame` for the subscribers of every process (delivered by their `_relay`)."""
+        try:
+            self.searches.append_event(frame)
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Saved-search events unavailable, notifying this process only: {e}")
+            self._deliver(frame)
+
+    def _deliver(self, frame: dict):
+        for queue in list(self._subscribers):
+            try:
+                queue.put_nowait(frame)
+            except asyncio.QueueFull:
+                print(f"⚠️ Saved-search subscriber is not keeping up, dropped a {frame.get('status')} frame")
+
+    async def _relay(self):
+        """Tail the shared event table while this process has subscribers."""
+        last_id = None
+        while self._subscribers:
+            try:
+                if last_id is None:  # Start at the present: subscribers get new frames only
+                    last_id = self.searches.last_event_id()
+                for last_id, raw in self.searches.events_after(last_id):
+                    self._deliver(json.loads(raw))
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Saved-search events unavailable: {e}")
+            await asyncio.sleep(EVENT_POLL)
+
+    def start(self):
+        if self._task is None or self._task.done():
+            self._wake = asyncio.Event()
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._relay_task is not None:
+            self._relay_task.cancel()
+            self._relay_task = None
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self.lease is not None:
+            try:
+                self.lease.release()
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Could not release the saved-search scheduler lease: {e}")
+
+    def _leader(self) -> bool:
+        """True when this process may poll (holds the lease, or runs alone)."""
+        return self.lease is None or self.lease.acquire()
+
+    def wake(self):
+        """Re-check due searches now (after one was added or changed)."""
+        if self._wake is not None:
+            self._wake.set()
+
+    async def _run(self):
+        while True:
+            try:
+                for search in self.searches.due(time.time()):
+                    if not self._leader():  # Another worker process polls
+                        break
+                    # A cached description would hide edits from the poll
+                    with fetch_context("background", f"saved-search-{search['id']}"), parsed_cache.bypass():
+                        await self._leased_poll(search)
+                next_due = self.searches.next_due_at()
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Saved-search scheduler storage error: {e}")
+                next_due = None
+            timeout = IDLE_CHECK_SECONDS if next_due is None else min(IDLE_CHECK_SECONDS, max(0, next_due - time.time()))
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _keep_lease(self):
+        """Renew the lease every third of its TTL; returns once another process took it."""
+        while True:
+            await asyncio.sleep(LEASE_SECONDS / 3)
+            try:
+                if not self._leader():
+                    return
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Could not renew the saved-search scheduler lease: {e}")
+
+    async def _leased_poll(self, search: dict):
+        """
+        `poll` with the lease renewed while it runs: background requests wait
+        behind every interactive and bulk one, so a poll can outlast the TTL.
+        A poll whose lease was lost anyway is cancelled; the new holder redoes it.
+        """
+        if self.lease is None:
+            return await self.poll(search)
+        poll = asyncio.create_task(self.poll(search))
+        keeper = asyncio.create_task(self._keep_lease())
+        try:
+            await asyncio.wait({poll, keeper}, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            keeper.cancel()
+            if not poll.done():
+                poll.cancel()
+                print(f"⚠️ Lost the saved-search scheduler lease, poll of search {search['id']} abandoned")
+        if poll.done() and not poll.cancelled():
+            return poll.result()
+        return None
+
+    async def poll(self, search: dict) -> list:
+        """
+        Fetch the postings of `search` that are newer than its last poll.
+
+        Returns:
+            list: New jobs, newest first
+        """
+        started = time.time()
+        if search["last_run_at"] is None:
+            window = FIRST_POLL_WINDOW
+        else:
+            window = min(MAX_POLL_WINDOW, max(3600, (started - search["last_run_at"]) * WINDOW_MARGIN))
+        seen = set(search["seen_job_ids"])  # Stop markers
+        published = set(search["pending_job_ids"])  # Published by failed polls: skipped, not stopped at
+        new_jobs, new_ids = [], []
+        error = None
+        self.publish({"status": "progress", "search_id": search["id"],
+                      "message": f"🔄 Polling '{search['keyword']}' in '{search['location']}'"})
+        try:
+            async for result in scrape_linkedin_jobs(
+                search["keyword"], search["location"], search["pages"],
+                fetch_full_description=search["fetch_descriptions"],
+                posted_within=window, seen_job_ids=seen,
+            ):
+                if result.get("status") == "error":
+                    error = result.get("message")
+                    continue
+                if result.get("status") != "job":
+                    continue
+                job = result["data"]
+                job_id = extract_job_id(job.get("url"))
+                if job_id in seen or job_id in published:
+                    continue
+                if job_id:
+                    published.add(job_id)
+                    new_ids.append(job_id)
+                new_jobs.append(job)
+                try:
+                    job_store.save_job(job)
+                except (sqlite3.Error, OSError) as e:
+                    print(f"⚠️ Could not persist job: {e}")
+                self.publish({"status": "job", "search_id": search["id"], "data": job})
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+
+        if error is not None:
+            retry_minutes = min(search["interval_minutes"], RETRY_MINUTES * 2 ** search["failures"])
+            print(f"❌ Saved search {search['id']} poll failed, retrying in ~{retry_minutes:.0f} min: {error}")
+            self.searches.record_failure(search, new_ids, _next_run(retry_minutes, time.time()))
+            self.publish({"status": "error", "search_id": search["id"], "new_jobs": len(new_jobs), "message": error})
+            return new_jobs
+
+        self.searches.record_run(search, new_ids, started, _next_run(search["interval_minutes"], time.time()))
+        self.publish({
+            "status": "complete",
+            "search_id": search["id"],
+            "new_jobs": len(new_jobs),
+            "message": f"✅ {len(new_jobs)} new jobs for '{search['keyword']}' in '{search['location']}'",
+        })
+        return new_jobs
+
+
+# Singleton
+saved_searches = SavedSearches(JOBS_DB)
+scheduler = SavedSearchScheduler(saved_searches, Lease(coordination, "saved-search-scheduler", LEASE_SECONDS))
@@ -2,20 +2,39 @@
 Simple URL scraper using Playwright to fetch LinkedIn job HTML.
 """
 import logging
-from playwright.async_api import async_playwright  # type: ignore
+from playwright.async_api import Error as PlaywrightError, async_playwright  # type: ignore
 from platforms.linkedin.utils.linkedin_login import linkedin_login
 from platforms.linkedin.utils.session_manager import session_manager
+from shared.utils.fetch_scheduler import FAILURE_STATUSES, fetch_scheduler
 
 logger = logging.getLogger(__name__)
 
-# Use a default session ID for single-user scraping
-DEFAULT_SESSION_ID = "default_session"
+CONTEXT_OPTIONS = {
+    "viewport": {"width": 1280, "height": 720},
+    "user_agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
+}
+BLOCKED_PATHS = ("/checkpoint/", "/authwall")  # Where LinkedIn sends identities it distrusts
+
+
+async def goto(page, url: str):
+    """Navigate once granted by the fetch scheduler and report the outcome to it."""
+    await fetch_scheduler.acquire()
+    try:
+        response = await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+    except PlaywrightError:  # Includes navigation timeouts
+        fetch_scheduler.record(None)
+        raise
+    if response is not None:
+        fetch_scheduler.record(response.status)
+    return response
 
 
 async def fetch_job_html(url: str) -> str:
     """
     Fetch HTML content from a LinkedIn job URL using Playwright.
-    Handles LinkedIn authentication with cookie persistence.
+    Handles LinkedIn authentication with cookie persistence, on an identity
+    borrowed from the session pool and in that identity's browser profile.
+    Rate limits, blocked pages and failed logins count against the identity.
 
     Args:
         url: LinkedIn job posting URL
@@ -25,25 +44,38 @@ async def fetch_job_html(url: str) -> str:
     """
     logger.info(f"🌐 Fetching URL: {url}")
 
-    async with async_playwright() as p:
+    async with session_manager.session() as session, async_playwright() as p:
+        logger.info(f"🪪 Using session {session.session_id}")
         # Use Firefox instead of Chromium due to macOS crash issues
-        browser = await p.firefox.launch(headless=False)
-        context = await browser.new_context(
-            viewport={"width": 1280, "height": 720},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        )
+        browser = None
+        try:
+            context = await p.firefox.launch_persistent_context(
+                session_manager.get_browser_profile_dir(session.session_id), headless=False, **CONTEXT_OPTIONS
+            )
+        except PlaywrightError as e:
+            # A profile is open in one browser at a time (another fetch on this identity)
+            logger.warning(f"⚠️ Profile of {session.session_id} unavailable, using a fresh context: {e}")
+            browser = await p.firefox.launch(headless=False)
+            context = await browser.new_context(**CONTEXT_OPTIONS)
 
         # Load existing session cookies if available
-        has_valid_session = await session_manager.validate_session(DEFAULT_SESSION_ID)
+        has_valid_session = await session_manager.validate_session(session.session_id)
         if has_valid_session:
             logger.info("🔄 Loading existing session...")
-            await session_manager.load_cookies(context, DEFAULT_SESSION_ID)
+            await session_manager.load_cookies(context, session.session_id)
 
         page = await context.new_page()
 
         try:
             # Navigate to job posting
-            await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+            response = await goto(page, url)
+            if response is not None and response.status in FAILURE_STATUSES:
+                # Rate limited or blocked: cool this identity down, the page is unusable
+                session_manager.record_failure(session, f"HTTP {response.status}")
+                raise Exception(f"LinkedIn answered {response.status} for session {session.session_id}")
+            if any(path in page.url for path in BLOCKED_PATHS):
+                session_manager.record_failure(session, f"Blocked: {page.url}")
+                raise Exception(f"LinkedIn blocked session {session.session_id} ({page.url})")
             logger.info("✅ Page loaded")
 
             # Check if login is required
@@ -53,15 +85,22 @@ async def fetch_job_html(url: str) -> str:
                 # If no valid session, perform login
                 if not has_valid_session:
                     try:
-                        await linkedin_login.perform_login(page, context, DEFAULT_SESSION_ID)
-                        logger.info("✅ Login successful, cookies saved")
-
-                        # Navigate back to job URL
-                        await page.goto(url, wait_until="domcontentloaded", timeout=30000)
+                        async with session_manager.login_lock(session.session_id):
+                            # Another request may have logged this identity in while we waited
+                            if await session_manager.validate_session(session.session_id):
+                                await session_manager.load_cookies(context, session.session_id)
+                                logger.info("✅ Reusing cookies from a concurrent login")
+                            else:
+                                await linkedin_login.perform_login(page, context, session)
+                                logger.info("✅ Login successful, cookies saved")
                     except Exception as e:
                         logger.error(f"❌ Login failed: {e}")
+                        session_manager.record_failure(session, f"Login failed: {e}")
                         raise
 
+                    # Navigate back to job URL
+                    await goto(page, url)
+
             # Wait for job content
             try:
                 await page.wait_for_selector(
@@ -93,4 +132,5 @@ async def fetch_job_html(url: str) -> str:
             raise
         finally:
             await context.close()
-            await browser.close()
+            if browser is not None:
+                await browser.close()
@@ -42,9 +42,7 @@ class BrowserUtils:
         """Create browser context with session persistence"""
         print(f"🔧 DEBUG: create_browser_context called with session_id: {session_id}")
         
-        # Run cleanup on startup
-        await session_manager.cleanup_old_sessions()
-        
+        # Expired sessions are removed by session_manager's background janitor
         p = await async_playwright().start()
         
         if session_id:
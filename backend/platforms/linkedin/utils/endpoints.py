@@ -0,0 +1,17 @@
+"""
+Where the guest-API scrapers send their requests.
+
+LINKEDIN_BASE_URL (default https://www.linkedin.com) points them at another
+host, e.g. the stand-in server (python -m standin) for load tests:
+    LINKEDIN_BASE_URL=http://127.0.0.1:8010/linkedin
+Job URLs found on search cards are fetched as they are, so they follow the
+host that served the cards. Another host gets its own rate budget and
+circuit breaker (see shared.utils.coordination); set STORAGE_DIR as well to
+keep its jobs out of the production stores (see shared.utils.storage).
+"""
+import os
+
+DEFAULT_LINKEDIN_BASE_URL = "https://www.linkedin.com"
+LINKEDIN_BASE_URL = os.getenv("LINKEDIN_BASE_URL", DEFAULT_LINKEDIN_BASE_URL).rstrip("/")
+SEARCH_URL = f"{LINKEDIN_BASE_URL}/jobs-guest/jobs/api/seeMoreJobPostings/search"
+JOB_POSTING_URL = LINKEDIN_BASE_URL + "/jobs-guest/jobs/api/jobPosting/{job_id}"
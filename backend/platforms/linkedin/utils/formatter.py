@@ -1,16 +1,11 @@
-import re
+from shared.utils.html_text import html_to_text
 
 def clean_html(value: str) -> str:
     """Remove leftover tags and normalize spacing (but preserve newlines)."""
     if not value:
         return ""
-    # Remove SVGs, scripts, etc.
-    value = re.sub(r"<(svg|script|style)[^>]*>.*?</\1>", "", value, flags=re.DOTALL)
-    # Remove other HTML tags
-    value = re.sub(r"<[^>]+>", "", value)
-    # Normalize horizontal whitespace only (preserve newlines)
-    value = re.sub(r"[ \t]+", " ", value)
-    return value.strip()
+    # Tag-free values (the common case) take the converter's fast path
+    return html_to_text(value, detect_headers=False)
 
 def format_job_post(data: dict) -> str:
     """Format parsed LinkedIn job post cleanly with line breaks and readable spacing."""
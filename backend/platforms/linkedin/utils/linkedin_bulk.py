@@ -1,11 +1,11 @@
 from fastapi import APIRouter, Query, WebSocket
 import asyncio
 import json
-from platforms.linkedin.scrapers.linkedin_bulk_scraper import scrape_linkedin_jobs
+from shared.types.job_record import dumps_frame
 
 router = APIRouter(prefix="", tags=["LinkedIn Bulk"])
 
-async def linkedin_bulk_search(keyword: str, location: str, pages: int, websocket: WebSocket, fetch_full_description: bool = True):
+async def linkedin_bulk_search(keyword: str, location: str, pages: int, websocket: WebSocket, fetch_full_description: bool = True, changes_only: bool = False):
     """
     Performs a bulk search for LinkedIn jobs and sends progress over a WebSocket.
 
@@ -15,11 +15,19 @@ async def linkedin_bulk_search(keyword: str, location: str, pages: int, websocke
         pages (int): Number of pages to scrape.
         websocket (WebSocket): The WebSocket to send progress updates to.
         fetch_full_description (bool): Whether to fetch full job descriptions (default: True)
+        changes_only (bool): Only send jobs that are new or changed since the last scrape (default: False)
     """
+    # Imported on first use, so registering the router doesn't load the scraper
+    from platforms.linkedin.scrapers.linkedin_bulk_scraper import scrape_linkedin_jobs
+    from shared.utils.change_detection import only_changes
+
     try:
         job_count = 0
-        async for result in scrape_linkedin_jobs(keyword, location, pages, fetch_full_description=fetch_full_description):
-            await websocket.send_text(json.dumps(result))
+        stream = scrape_linkedin_jobs(keyword, location, pages, fetch_full_description=fetch_full_description)
+        if changes_only:
+            stream = only_changes(stream)
+        async for result in stream:
+            await websocket.send_text(dumps_frame(result))
 
             # Track job count
             if result.get("status") == "job":
@@ -1,19 +1,12 @@
 # utils/linkedin_login.py
-import os
 import json
 import asyncio
 import random
 from playwright.async_api import Page, BrowserContext # type: ignore
-from platforms.linkedin.utils.session_manager import session_manager
+from platforms.linkedin.utils.session_manager import Session, session_manager
 
 class LinkedInLogin:
-    def __init__(self):
-        # For testing - single user credentials from environment
-        self.test_email = os.getenv("LINKEDIN_EMAIL")
-        self.test_password = os.getenv("LINKEDIN_PASSWORD")
-        
-        if not self.test_email or not self.test_password:
-            raise ValueError("❌ LinkedIn credentials not found in environment")
+    """Logs pooled identities in; credentials come from each `Session`."""
 
     async def human_type(self, page, selector, text):
         """Simulate human typing"""
@@ -37,8 +30,8 @@ class LinkedInLogin:
         except:
             return False
 
-    async def perform_login(self, page: Page, context: BrowserContext, session_id: str, websocket=None) -> bool:
-        """Perform the actual LinkedIn login"""
+    async def perform_login(self, page: Page, context: BrowserContext, session: Session, websocket=None) -> bool:
+        """Perform the actual LinkedIn login with the identity's credentials; saves its cookies"""
         async def send_update(msg):
             if websocket:
                 await websocket.send_text(json.dumps({"message": msg}))
@@ -52,18 +45,18 @@ class LinkedInLogin:
         if not sign_in_btn:
             if await self.quick_login_check(page):
                 await send_update("✅ Already logged in")
-                await session_manager.save_cookies(context, session_id)
+                await session_manager.save_cookies(context, session.session_id)
                 return True
             raise Exception("Could not find sign-in button")
 
         await sign_in_btn.click()
         await page.wait_for_selector("input#username", timeout=8000)
 
-        # Enter credentials (using test credentials for now)
-        await send_update("📝 Entering credentials...")
-        await self.human_type(page, "input#username", self.test_email)
+        # Enter credentials
+        await send_update(f"📝 Entering credentials for {session.session_id}...")
+        await self.human_type(page, "input#username", session.email)
         await asyncio.sleep(0.5)
-        await self.human_type(page, "input#password", self.test_password)
+        await self.human_type(page, "input#password", session.password)
         await asyncio.sleep(0.5)
         
         await send_update("🚀 Submitting login...")
@@ -73,7 +66,7 @@ class LinkedInLogin:
         # Verify login success
         if await self.quick_login_check(page):
             await send_update("✅ Login successful")
-            await session_manager.save_cookies(context, session_id)
+            await session_manager.save_cookies(context, session.session_id)
             return True
         else:
             raise Exception("Login failed")
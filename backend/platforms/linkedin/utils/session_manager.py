@@ -1,23 +1,215 @@
 # utils/session_manager.py
+"""
+Pool of LinkedIn identities for authenticated (Playwright) fetches.
+
+Each identity is one account with its own cookie file, browser profile and
+health: a circuit breaker in storage/coordination.db, shared by all worker
+processes, that cools the identity down after repeated failures (429/999,
+blocked pages, failed logins) and lets one probe request through when the
+cooldown ends. Other errors (timeouts, bad URLs, parsing) say nothing about
+the account and do not count. `session()` lends out the healthy identity with
+the fewest requests in flight, so authenticated traffic spreads over every
+account instead of queueing behind one, and gives up after SESSION_MAX_WAIT.
+
+Accounts come from the environment: LINKEDIN_EMAIL / LINKEDIN_PASSWORD is
+the identity "default_session", and LINKEDIN_EMAIL_2 / LINKEDIN_PASSWORD_2,
+_3, ... add "session_2", "session_3"...
+
+Cookies are stored as JSON (cookies/<session_id>.json, replaced atomically)
+and kept in memory until the file's mtime changes, so validating a session
+does no file I/O. `login_lock` makes re-login single-flight per identity. A
+background janitor, started by the first `session()`, removes sessions older
+than SESSION_MAX_AGE_HOURS. Importing this module touches no files.
+"""
+import asyncio
+import contextlib
+import json
 import os
-import pickle
+import sqlite3
 import time
 import shutil
+from collections import deque
 from pathlib import Path
 
+from shared.utils.coordination import CircuitBreaker, coordination
+
 PROJECT_ROOT = Path(__file__).parent.parent
 COOKIE_STORAGE_DIR = PROJECT_ROOT / "storage" / "cookies"
 BROWSER_PROFILES_DIR = PROJECT_ROOT / "storage" / "browser_profiles"
 SESSION_MAX_AGE_HOURS = 336
+DEFAULT_SESSION_ID = "default_session"
+MAX_ACCOUNTS = 50  # LINKEDIN_EMAIL_2 .. LINKEDIN_EMAIL_<n> are read up to this
+SESSION_MAX_IN_FLIGHT = int(os.getenv("LINKEDIN_SESSION_MAX_IN_FLIGHT", 2))  # Per identity and process
+SESSION_FAILURE_THRESHOLD = 2  # Consecutive failures before an identity cools down
+SESSION_COOLDOWN = 300  # Seconds, doubling per consecutive cooldown
+SESSION_MAX_COOLDOWN = 6 * 3600
+SESSION_MAX_WAIT = float(os.getenv("LINKEDIN_SESSION_MAX_WAIT", 60))  # Seconds session() waits for an identity
+THROUGHPUT_WINDOW = 60  # Seconds of request timestamps kept per identity
+JANITOR_INTERVAL = 3600  # Seconds between sweeps for expired sessions
+
+
+class Session:
+    """One LinkedIn identity: credentials, health and this process's usage."""
+
+    def __init__(self, session_id: str, email: str, password: str):
+        self.session_id = session_id
+        self.email = email
+        self.password = password
+        self.health = CircuitBreaker(
+            coordination, f"session:{session_id}", threshold=SESSION_FAILURE_THRESHOLD,
+            cooldown=SESSION_COOLDOWN, max_cooldown=SESSION_MAX_COOLDOWN,
+        )
+        self.in_flight = 0
+        self.requests = 0
+        self.failures = 0
+        self.last_used = 0.0
+        self.last_error = None
+        self.recent = deque()  # monotonic start times within THROUGHPUT_WINDOW
+
+    def requests_per_minute(self) -> float:
+        cutoff = time.monotonic() - THROUGHPUT_WINDOW
+        while self.recent and self.recent[0] < cutoff:
+            self.recent.popleft()
+        return len(self.recent) * 60 / THROUGHPUT_WINDOW
+
+    def snapshot(self) -> dict:
+        try:
+            health = self.health.snapshot()
+        except (sqlite3.Error, OSError) as e:
+            health = {"state": "unknown", "error": str(e)}
+        return {
+            "session_id": self.session_id,
+            "health": health,
+            "in_flight": self.in_flight,
+            "requests": self.requests,
+            "failures": self.failures,
+            "requests_per_minute": round(self.requests_per_minute(), 2),
+            "last_error": self.last_error,
+        }
+
+
+def load_accounts() -> list:
+    """Sessions for the accounts configured in the environment, in order."""
+    sessions = []
+    email, password = os.getenv("LINKEDIN_EMAIL"), os.getenv("LINKEDIN_PASSWORD")
+    if email and password:
+        sessions.append(Session(DEFAULT_SESSION_ID, email, password))
+    for n in range(2, MAX_ACCOUNTS + 1):
+        email, password = os.getenv(f"LINKEDIN_EMAIL_{n}"), os.getenv(f"LINKEDIN_PASSWORD_{n}")
+        if email and password:
+            sessions.append(Session(f"session_{n}", email, password))
+    return sessions
 
-os.makedirs(COOKIE_STORAGE_DIR, exist_ok=True)
-os.makedirs(BROWSER_PROFILES_DIR, exist_ok=True)
 
 class SessionManager:
     def __init__(self):
         self.cookie_storage_dir = COOKIE_STORAGE_DIR
         self.browser_profiles_dir = BROWSER_PROFILES_DIR
-        print(f"🔧 SessionManager initialized")
+        self._sessions = None  # Loaded on first use, after .env is read
+        self._released = None  # Wakes waiters when an identity frees up
+        self._cookies = {}  # session_id -> (cookie file mtime_ns, cookies)
+        self._login_locks = {}
+        self._janitor = None
+
+    @property
+    def sessions(self) -> list:
+        if self._sessions is None:
+            self._sessions = load_accounts()
+        return self._sessions
+
+    def _pick(self):
+        """
+        Healthy identity with the fewest requests in flight, least recently used first.
+
+        Returns:
+            tuple: (Session or None, seconds until one may be free)
+        """
+        wait = None
+        candidates = [s for s in self.sessions if s.in_flight < SESSION_MAX_IN_FLIGHT]
+        for session in sorted(candidates, key=lambda s: (s.in_flight, s.last_used)):
+            try:
+                retry_after = session.health.retry_after()  # Claims the probe slot after a cooldown
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Session health unavailable, using {session.session_id} anyway: {e}")
+                retry_after = 0.0
+            if not retry_after:
+                return session, 0.0
+            wait = retry_after if wait is None else min(wait, retry_after)
+        return None, wait
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        """
+        Borrow an identity for one authenticated fetch; waits while every
+        identity is busy or cooling down, up to SESSION_MAX_WAIT. The fetch
+        counts as a success of the identity when the block completes without
+        calling `record_failure`; an exception in the block counts as neither.
+
+        Raises:
+            ValueError: When no LinkedIn account is configured
+            TimeoutError: When no identity frees up within SESSION_MAX_WAIT
+        """
+        if not self.sessions:
+            raise ValueError("❌ LinkedIn credentials not found in environment")
+        self.start_janitor()
+        if self._released is None:
+            self._released = asyncio.Condition()
+        deadline = time.monotonic() + SESSION_MAX_WAIT
+        while True:
+            session, wait = self._pick()
+            if session is not None:
+                break
+            remaining = deadline - time.monotonic()
+            busy = sum(1 for s in self.sessions if s.in_flight >= SESSION_MAX_IN_FLIGHT)
+            # Fail at the deadline, or now when only a cooldown ending after it could help
+            if remaining <= 0 or (not busy and wait is not None and wait > remaining):
+                raise TimeoutError(
+                    f"❌ No LinkedIn identity available within {SESSION_MAX_WAIT:.0f}s: "
+                    f"{len(self.sessions) - busy} cooling down, {busy} busy"
+                    + (f", next cooldown ends in {wait:.0f}s" if wait is not None else "")
+                )
+            async with self._released:
+                # Busy identities wake us on release; cooling ones when their cooldown ends
+                with contextlib.suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._released.wait(), min(wait, remaining) if wait else remaining)
+
+        session.in_flight += 1
+        session.requests += 1
+        session.last_used = time.monotonic()
+        session.recent.append(session.last_used)
+        failures = session.failures
+        try:
+            yield session
+            # Skipped when the block raises: not the identity's fault unless it recorded a failure
+            if session.failures == failures:  # The block may have recorded a failure itself
+                self.record_success(session)
+        finally:
+            session.in_flight -= 1
+            async with self._released:
+                self._released.notify()
+
+    def record_success(self, session: Session):
+        try:
+            session.health.record_success()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Session health unavailable: {e}")
+
+    def record_failure(self, session: Session, error=None):
+        """Count a failed request (blocked, rate limited, login failed) against the identity."""
+        session.failures += 1
+        session.last_error = str(error) if error is not None else None
+        try:
+            session.health.record_failure()
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Session health unavailable: {e}")
+
+    def snapshot(self) -> dict:
+        sessions = [session.snapshot() for session in self.sessions]
+        return {
+            "sessions": sessions,
+            "healthy": sum(1 for s in sessions if s["health"].get("state") == "closed"),
+            "requests_per_minute": round(sum(s["requests_per_minute"] for s in sessions), 2),
+        }
 
     def get_browser_profile_dir(self, session_id):
         if session_id:
@@ -28,18 +220,59 @@ class SessionManager:
 
     def get_cookie_file(self, session_id):
         if session_id:
-            return self.cookie_storage_dir / f"{session_id}.pkl"
+            return self.cookie_storage_dir / f"{session_id}.json"
         return None
 
+    def login_lock(self, session_id) -> asyncio.Lock:
+        """
+        Single-flight guard for (re-)logging an identity in: the first caller
+        logs in, the others wait and then find fresh cookies.
+        """
+        lock = self._login_locks.get(session_id)
+        if lock is None:
+            lock = self._login_locks[session_id] = asyncio.Lock()
+        return lock
+
+    async def _read_cookies(self, session_id):
+        """
+        Cookies of a session, from memory unless the file changed on disk
+        (another process logged in, or the janitor removed it).
+
+        Returns:
+            list | None: None when there is no readable cookie file
+        """
+        cookie_file = self.get_cookie_file(session_id)
+        try:
+            mtime = cookie_file.stat().st_mtime_ns
+        except (FileNotFoundError, AttributeError):
+            self._cookies.pop(session_id, None)
+            return None
+        cached = self._cookies.get(session_id)
+        if cached and cached[0] == mtime:
+            return cached[1]
+        try:
+            cookies = json.loads(await asyncio.to_thread(cookie_file.read_text, encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"❌ Could not read cookies of session {session_id}: {e}")
+            return None
+        self._cookies[session_id] = (mtime, cookies)
+        return cookies
+
     async def save_cookies(self, context, session_id):
         print(f"💾 Saving cookies for session: {session_id}")
         if session_id:
             cookies = await context.cookies()
             cookie_file = self.get_cookie_file(session_id)
-            
-            with open(str(cookie_file), 'wb') as f:
-                pickle.dump(cookies, f)
-            
+
+            def write():
+                os.makedirs(self.cookie_storage_dir, exist_ok=True)
+                # Write then rename, so readers never see half a file
+                tmp_file = cookie_file.with_suffix(".json.tmp")
+                tmp_file.write_text(json.dumps(cookies), encoding="utf-8")
+                os.replace(tmp_file, cookie_file)
+                return cookie_file.stat().st_mtime_ns
+
+            self._cookies[session_id] = (await asyncio.to_thread(write), cookies)
             print(f"✅ Cookies saved: {len(cookies)} cookies")
             return True
         return False
@@ -47,12 +280,8 @@ class SessionManager:
     async def load_cookies(self, context, session_id):
         print(f"🔄 Loading cookies for session: {session_id}")
         if session_id:
-            cookie_file = self.get_cookie_file(session_id)
-            
-            if cookie_file and os.path.exists(cookie_file):
-                with open(cookie_file, 'rb') as f:
-                    cookies = pickle.load(f)
-                
+            cookies = await self._read_cookies(session_id)
+            if cookies is not None:
                 await context.clear_cookies()
                 await context.add_cookies(cookies)
                 print(f"✅ Cookies loaded: {len(cookies)} cookies")
@@ -61,56 +290,76 @@ class SessionManager:
         return False
 
     async def validate_session(self, session_id):
-        """Check if session has valid LinkedIn cookies"""
+        """Check if session has valid, unexpired LinkedIn cookies (from memory after the first read)"""
         if not session_id:
             return False
-        
-        cookie_file = self.get_cookie_file(session_id)
-        if not cookie_file or not os.path.exists(cookie_file):
+
+        cookies = await self._read_cookies(session_id)
+        if cookies is None:
             print(f"❌ No cookie file for session: {session_id}")
             return False
-        
-        try:
-            with open(cookie_file, 'rb') as f:
-                cookies = pickle.load(f)
-            
-            # Check for LinkedIn authentication cookies
-            linkedin_auth_cookies = [
-                c for c in cookies 
-                if 'linkedin.com' in c.get('domain', '') 
-                and c.get('name') in ['li_at', 'JSESSIONID', 'bcookie']
-            ]
-            
-            has_valid_cookies = len(linkedin_auth_cookies) >= 2
-            print(f"🔍 Session {session_id} has {len(linkedin_auth_cookies)} auth cookies - Valid: {has_valid_cookies}")
-            
-            return has_valid_cookies
-        except Exception as e:
-            print(f"❌ Session validation error: {e}")
-            return False
+
+        # Check for LinkedIn authentication cookies; "expires" is -1 for browser-session cookies
+        now = time.time()
+        linkedin_auth_cookies = [
+            c for c in cookies
+            if 'linkedin.com' in c.get('domain', '')
+            and c.get('name') in ['li_at', 'JSESSIONID', 'bcookie']
+            and not (0 < c.get('expires', -1) < now)
+        ]
+
+        has_valid_cookies = len(linkedin_auth_cookies) >= 2
+        print(f"🔍 Session {session_id} has {len(linkedin_auth_cookies)} auth cookies - Valid: {has_valid_cookies}")
+
+        return has_valid_cookies
 
     async def clear_session_data(self, session_id):
         try:
             print(f"🗑️ Clearing session: {session_id}")
+            self._cookies.pop(session_id, None)
             cookie_file = self.get_cookie_file(session_id)
             if cookie_file and os.path.exists(cookie_file):
                 os.remove(cookie_file)
-            
-            profile_dir = self.get_browser_profile_dir(session_id)
-            if profile_dir and os.path.exists(profile_dir):
-                shutil.rmtree(profile_dir)
+
+            profile_dir = self.browser_profiles_dir / session_id
+            if profile_dir.exists():
+                await asyncio.to_thread(shutil.rmtree, profile_dir)
         except Exception as e:
             print(f"❌ Error clearing session: {e}")
 
     async def cleanup_old_sessions(self):
         current_time = time.time()
         max_age_seconds = SESSION_MAX_AGE_HOURS * 3600
-        
+
         print("🧹 Cleaning up old sessions...")
-        for cookie_file in self.cookie_storage_dir.glob("*.pkl"):
+        for cookie_file in self.cookie_storage_dir.glob("*.json"):
             if (current_time - cookie_file.stat().st_mtime) > max_age_seconds:
                 session_id = cookie_file.stem
                 print(f"🧹 Removing expired session: {session_id}")
                 await self.clear_session_data(session_id)
+        # Cookie files of the former pickle format are never read; only the file goes
+        for legacy_file in self.cookie_storage_dir.glob("*.pkl"):
+            if (current_time - legacy_file.stat().st_mtime) > max_age_seconds:
+                os.remove(legacy_file)
+
+    def start_janitor(self):
+        """Run `cleanup_old_sessions` now and every JANITOR_INTERVAL, off the request path."""
+        if self._janitor is None or self._janitor.done():
+            self._janitor = asyncio.create_task(self._run_janitor())
+
+    async def stop_janitor(self):
+        if self._janitor is not None:
+            self._janitor.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._janitor
+            self._janitor = None
+
+    async def _run_janitor(self):
+        while True:
+            try:
+                await self.cleanup_old_sessions()
+            except OSError as e:
+                print(f"⚠️ Session cleanup failed: {e}")
+            await asyncio.sleep(JANITOR_INTERVAL)
 
-session_manager = SessionManager()
\ No newline at end of file
+session_manager = SessionManager()
@@ -0,0 +1,194 @@
+"""
+Compact representation of one scraped job.
+
+JobRecord keeps every known field in a slot instead of a per-job dict, interns
+the values that repeat across a result set (company, location, work type...),
+shares one normalized-location dict per distinct location, and caches its
+serialized JSON. It supports the read/write mapping API the scrapers already
+use (`get`, `[]`, `update`, `keys`), so code written against card/job dicts
+keeps working.
+
+Frames that carry records are serialized with `dumps_frame`, which splices the
+cached record JSON into the frame instead of rebuilding it.
+"""
+import json
+import sys
+
+try:
+    import msgpack  # type: ignore
+except ImportError:  # Optional: only needed for to_msgpack()
+    msgpack = None
+
+# Serialization order
+FIELDS = (
+    # Identity
+    "job_id", "platform", "url", "job_url", "guest_api_url",
+    # Search card
+    "title", "company", "location", "location_normalized", "date_posted",
+    "publication_date", "actively_hiring",
+    # Job page
+    "company_name", "company_slug", "company_image_url", "posted", "applicants",
+    "applicants_pos", "applicants_detail", "salary", "work_type", "employment_type",
+    "description", "description_status", "parse_incomplete",
+    # Skill tags (shared.utils.skills)
+    "hard_skills", "soft_skills",
+    # Near-duplicate cluster (shared.utils.near_duplicates)
+    "cluster_id",
+    # Typed columns (shared.utils.normalize)
+    "posted_at", "salary_min", "salary_max", "salary_currency", "salary_period",
+    "salary_annual_min", "salary_annual_max",
+)
+FIELD_SET = frozenset(FIELDS)
+
+# Low-cardinality text shared by many records
+INTERNED_FIELDS = frozenset({
+    "platform", "company", "company_name", "company_slug", "location", "date_posted",
+    "actively_hiring", "posted", "work_type", "employment_type", "description_status",
+    "salary_currency", "salary_period",
+})
+
+# Never kept on a record: the text form is all any consumer reads
+DROPPED_FIELDS = frozenset({"description_html"})
+
+_MISSING = object()
+_shared_locations = {}
+MAX_SHARED_LOCATIONS = 10000
+
+
+def _shared_location(location, normalized):
+    """One normalized-location dict per distinct location string."""
+    if not isinstance(location, str) or not isinstance(normalized, dict):
+        return normalized
+    shared = _shared_locations.get(location)
+    if shared is None or shared != normalized:
+        if len(_shared_locations) >= MAX_SHARED_LOCATIONS:
+            _shared_locations.clear()
+        _shared_locations[location] = shared = normalized
+    return shared
+
+
+class JobRecord:
+    """
+    One job, with slots for every known field and a dict only for unknown ones.
+
+    Args:
+        data (dict | JobRecord): Initial fields
+        **fields: More fields (override `data`)
+    """
+    __slots__ = FIELDS + ("_extra", "_json")
+
+    def __init__(self, data=None, **fields):
+        object.__setattr__(self, "_extra", None)
+        object.__setattr__(self, "_json", None)
+        if data:
+            self.update(data)
+        if fields:
+            self.update(fields)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "JobRecord":
+        return data if isinstance(data, cls) else cls(data)
+
+    def __setattr__(self, name, value):
+        if name in INTERNED_FIELDS and type(value) is str:
+            value = sys.intern(value)
+        elif name == "location_normalized":
+            value = _shared_location(getattr(self, "location", None), value)
+        object.__setattr__(self, name, value)
+        object.__setattr__(self, "_json", None)
+
+    # --- mapping API -------------------------------------------
+
+    def __getitem__(self, key):
+        if key in FIELD_SET:
+            value = getattr(self, key, _MISSING)
+            if value is _MISSING:
+                raise KeyError(key)
+            return value
+        if self._extra is None or key not in self._extra:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in FIELD_SET:
+            setattr(self, key, value)
+        elif key not in DROPPED_FIELDS:
+            if self._extra is None:
+                object.__setattr__(self, "_extra", {})
+            self._extra[key] = value
+            object.__setattr__(self, "_json", None)
+
+    def __contains__(self, key):
+        if key in FIELD_SET:
+            return getattr(self, key, _MISSING) is not _MISSING
+        return self._extra is not None and key in self._extra
+
+    def get(self, key, default=None):
+        if key in FIELD_SET:
+            return getattr(self, key, default)
+        return self._extra.get(key, default) if self._extra else default
+
+    def keys(self) -> list:
+        present = [f for f in FIELDS if getattr(self, f, _MISSING) is not _MISSING]
+        return present + list(self._extra) if self._extra else present
+
+    def items(self) -> list:
+        return [(key, self[key]) for key in self.keys()]
+
+    def __iter__(self):
+        return iter(self.keys())
+
+    def __len__(self):
+        return len(self.keys())
+
+    def update(self, other=(), **fields):
+        """dict.update semantics: a mapping, an iterable of pairs, and/or keywords."""
+        pairs = other.items() if hasattr(other, "items") else other
+        for key, value in pairs:
+            self[key] = value
+        for key, value in fields.items():
+            self[key] = value
+
+    def copy(self, **changes) -> "JobRecord":
+        record = JobRecord(self)
+        if changes:
+            record.update(changes)
+        return record
+
+    def __eq__(self, other):
+        if isinstance(other, (JobRecord, dict)):
+            return self.to_dict() == dict(other)
+        return NotImplemented
+
+    def __repr__(self):
+        return f"JobRecord(job_id={self.get('job_id')!r}, title={self.get('title')!r}, company={self.get('company')!r})"
+
+    # --- serialization -----------------------------------------
+
+    def to_dict(self) -> dict:
+        return {key: self[key] for key in self.keys()}
+
+    def to_json(self) -> str:
+        """JSON object, computed once and reused until the record changes."""
+        if self._json is None:
+            object.__setattr__(self, "_json", json.dumps(self.to_dict(), default=str))
+        return self._json
+
+    def to_msgpack(self) -> bytes:
+        if msgpack is None:
+            raise ImportError("to_msgpack() requires the msgpack package")
+        return msgpack.packb(self.to_dict(), default=str)
+
+
+def dumps_frame(frame: dict) -> str:
+    """
+    json.dumps for websocket frames whose "data" may be a JobRecord.
+    The record's cached JSON is spliced in as-is.
+    """
+    record = frame.get("data")
+    if not isinstance(record, JobRecord):
+        return json.dumps(frame)
+    rest = {key: value for key, value in frame.items() if key != "data"}
+    head = json.dumps(rest)
+    separator = ", " if rest else ""
+    return f'{head[:-1]}{separator}"data": {record.to_json()}}}'
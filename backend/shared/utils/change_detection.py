@@ -0,0 +1,187 @@
+"""
+Change detection for re-scraped jobs.
+
+A content fingerprint and a snapshot of the content fields are stored per
+job key (table job_fingerprints in storage/jobs.db). After each fetch the
+job is compared with its snapshot: new and changed jobs are emitted with a
+field-level diff, unchanged ones are only counted. Fields a fetch did not
+observe (e.g. no description on a card-only scrape) keep their stored value
+instead of reading as removed.
+
+Wrap any bulk stream with `only_changes` to get this behaviour.
+"""
+import difflib
+import hashlib
+import json
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from shared.utils.job_store import JOBS_DB, job_key
+
+# Fields whose edits matter; applicant counts, relative dates and derived
+# fields (skills, typed columns) change without the posting changing
+CONTENT_FIELDS = (
+    "title", "company", "company_name", "location", "work_type", "employment_type",
+    "salary", "salary_min", "salary_max", "salary_currency", "salary_period", "description",
+)
+TEXT_DIFF_FIELDS = frozenset({"description"})
+MAX_DIFF_LINES = 20
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_fingerprints (
+    job_key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    fields TEXT NOT NULL,
+    changed_at TEXT NOT NULL
+)
+"""
+
+
+def _content(job: dict) -> dict:
+    content = {}
+    for field in CONTENT_FIELDS:
+        value = job.get(field)
+        if isinstance(value, str):
+            # Long text keeps its lines for diffing; fingerprint() ignores whitespace either way
+            value = value.strip() if field in TEXT_DIFF_FIELDS else " ".join(value.split())
+        if value not in (None, ""):
+            content[field] = value
+    return content
+
+
+def fingerprint(content: dict) -> str:
+    canonical = {k: " ".join(v.split()) if isinstance(v, str) else v for k, v in content.items()}
+    return hashlib.sha1(json.dumps(canonical, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _text_diff(old: str, new: str) -> dict:
+    added, removed = [], []
+    old_lines = [" ".join(line.split()) for line in old.splitlines()]
+    new_lines = [" ".join(line.split()) for line in new.splitlines()]
+    for line in difflib.ndiff(old_lines, new_lines):
+        if line.startswith("+ ") and line[2:].strip():
+            added.append(line[2:])
+        elif line.startswith("- ") and line[2:].strip():
+            removed.append(line[2:])
+    return {
+        "old_length": len(old),
+        "new_length": len(new),
+        "added": added[:MAX_DIFF_LINES],
+        "removed": removed[:MAX_DIFF_LINES],
+    }
+
+
+def field_diff(old: dict, new: dict) -> dict:
+    """{field: {"old", "new"}} for changed fields; text fields get added/removed lines."""
+    diff = {}
+    for field, value in new.items():
+        before = old.get(field)
+        if field in TEXT_DIFF_FIELDS and isinstance(before, str):
+            if " ".join(before.split()) != " ".join(value.split()):
+                diff[field] = _text_diff(before, value)
+        elif before != value:
+            diff[field] = {"old": before, "new": value}
+    return diff
+
+
+class ChangeTracker:
+    """Per-job fingerprints; thread-safe, connection opened lazily."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def check(self, job: dict) -> tuple:
+        """
+        Compare a fetched job with its stored snapshot and store the new one.
+
+        Returns:
+            tuple: ("new" | "changed" | "unchanged", diff dict); jobs without a
+                key are always "new"
+        """
+        key = job_key(job)
+        observed = _content(job)
+        if not key:
+            return "new", {}
+        with self._lock:
+            conn = self._connect()
+            row = conn.execute("SELECT fingerprint, fields FROM job_fingerprints WHERE job_key = ?", (key,)).fetchone()
+            if row is None:
+                status, diff, content = "new", {}, observed
+            else:
+                stored = json.loads(row[1])
+                content = {**stored, **observed}
+                if fingerprint(content) == row[0]:
+                    return "unchanged", {}
+                status, diff = "changed", field_diff(stored, observed)
+                if not diff:  # Only normalization-level differences
+                    status = "unchanged"
+            now = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO job_fingerprints VALUES (?, ?, ?, ?)",
+                    (key, fingerprint(content), json.dumps(content, default=str), now),
+                )
+        return status, diff
+
+
+async def only_changes(stream, tracker: "ChangeTracker" = None):
+    """
+    Pass a bulk scrape stream through change detection.
+
+    Job frames of new or changed jobs are yielded with "change" and "diff"
+    added; unchanged jobs are dropped and reported in one progress frame
+    (before the "complete" frame, or at the end of the stream). Other frames
+    pass through, and the complete frame gains "new", "changed" and
+    "unchanged" counts.
+    """
+    tracker = tracker or change_tracker
+    counts = {"new": 0, "changed": 0, "unchanged": 0}
+    unchanged_keys = []
+
+    def summary():
+        return {
+            "status": "progress",
+            "message": f"♻️ {counts['unchanged']} unchanged jobs not re-sent "
+                       f"({counts['new']} new, {counts['changed']} changed)",
+            "unchanged": counts["unchanged"],
+            "unchanged_job_ids": unchanged_keys,
+        }
+
+    summarized = False
+    async for result in stream:
+        status = result.get("status")
+        if status == "job":
+            try:
+                change, diff = tracker.check(result.get("data") or {})
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Change detection unavailable, sending job as new: {e}")
+                change, diff = "new", {}
+            counts[change] += 1
+            if change == "unchanged":
+                unchanged_keys.append(job_key(result.get("data") or {}))
+                continue
+            result = {**result, "change": change, "diff": diff}
+        elif status == "complete" and not summarized:
+            yield summary()
+            summarized = True
+            result = {**result, **counts}
+        yield result
+    if not summarized:
+        yield summary()
+
+
+# Singleton
+change_tracker = ChangeTracker(JOBS_DB)
@@ -0,0 +1,381 @@
+"""
+State shared by every worker process on one host: outbound rate budgets,
+circuit breakers, the parsed-result cache and leases.
+
+Everything lives in coordination.db in STORAGE_DIR (WAL mode, so readers
+never block the writer). Updates that read-modify-write run in BEGIN IMMEDIATE
+transactions, which take the write lock up front, so N uvicorn workers
+share one request budget instead of each spending its own. Times are
+wall-clock (time.time()) because monotonic clocks differ per process.
+
+A board's budget and breaker are named after it ("linkedin") only for its
+real host; pointed elsewhere (LINKEDIN_BASE_URL at the stand-in), they get
+a name of their own, so injected 429s never trip the production breaker.
+"""
+import asyncio
+import contextlib
+import contextvars
+import json
+import os
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from platforms.linkedin.utils.endpoints import DEFAULT_LINKEDIN_BASE_URL, LINKEDIN_BASE_URL
+from shared.utils.rate_limiter import LINKEDIN_REQUEST_BURST, LINKEDIN_REQUESTS_PER_MINUTE
+from shared.utils.storage import STORAGE_DIR
+
+COORDINATION_DB = STORAGE_DIR / "coordination.db"
+BUSY_TIMEOUT_MS = 5000
+CACHE_PURGE_EVERY = 1000  # Expired cache rows are deleted every N writes
+PARSED_CACHE_TTL = float(os.getenv("PARSED_CACHE_TTL_HOURS", 6)) * 3600
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_buckets (
+    name TEXT PRIMARY KEY,
+    tokens REAL NOT NULL,
+    updated REAL NOT NULL,
+    acquired INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS breakers (
+    name TEXT PRIMARY KEY,
+    state TEXT NOT NULL,
+    failures INTEGER NOT NULL,
+    opened_until REAL NOT NULL,
+    trips INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS cache (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS leases (
+    name TEXT PRIMARY KEY,
+    owner TEXT NOT NULL,
+    expires_at REAL NOT NULL
+);
+"""
+
+
+def upstream_name(name: str, base_url: str, default_url: str) -> str:
+    """Budget/breaker name of a board: `name` for its real host, "name@host/path" for any other."""
+    if base_url.rstrip("/") == default_url.rstrip("/"):
+        return name
+    parts = urlsplit(base_url)
+    return f"{name}@{parts.netloc}{parts.path}".rstrip("/")
+
+
+class Coordination:
+    """One connection per process to coordination.db; thread-safe, opened lazily."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self):
+        # A forked worker must not reuse its parent's connection
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None, timeout=BUSY_TIMEOUT_MS / 1000
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")  # Losing the last ms of limiter state is harmless
+            self._conn.executescript(SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def read(self, sql: str, params: tuple = ()):
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def transaction(self, fn):
+        """Run fn(conn) holding the database write lock; returns its result."""
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return result
+
+
+class SharedRateBudget:
+    """
+    Token bucket stored in coordination.db, shared by all processes.
+    Same interface as rate_limiter.RateBudget, so FetchScheduler takes either.
+    """
+
+    def __init__(self, store: Coordination, name: str, rate: float, burst: float = 1):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.store = store
+        self.name = name
+        self.rate = rate
+        self.burst = burst
+        self.waited = 0.0  # This process only
+
+    def _tokens(self, row, now: float) -> float:
+        if row is None:
+            return self.burst
+        tokens, updated = row
+        return min(self.burst, tokens + max(0.0, now - updated) * self.rate)
+
+    def _row(self, conn):
+        return conn.execute("SELECT tokens, updated FROM rate_buckets WHERE name = ?", (self.name,)).fetchone()
+
+    def delay(self, tokens: float = 1) -> float:
+        """Seconds until `tokens` would be available (another process may take them first)."""
+        rows = self.store.read("SELECT tokens, updated FROM rate_buckets WHERE name = ?", (self.name,))
+        return max(0.0, (tokens - self._tokens(rows[0] if rows else None, time.time())) / self.rate)
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        def take(conn):
+            now = time.time()
+            available = self._tokens(self._row(conn), now)
+            if available < tokens:
+                return False
+            conn.execute(
+                "INSERT INTO rate_buckets (name, tokens, updated, acquired) VALUES (?, ?, ?, 1) "
+                "ON CONFLICT(name) DO UPDATE SET tokens = excluded.tokens, updated = excluded.updated, "
+                "acquired = acquired + 1",
+                (self.name, available - tokens, now),
+            )
+            return True
+        return self.store.transaction(take)
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """Wait until `tokens` are available and take them; returns seconds waited."""
+        if tokens > self.burst:
+            raise ValueError(f"cannot acquire {tokens} tokens from a bucket of {self.burst}")
+        start = time.monotonic()
+        while not self.try_acquire(tokens):
+            await asyncio.sleep(max(self.delay(tokens), 0.01))
+        waited = time.monotonic() - start
+        self.waited += waited
+        return waited
+
+    def snapshot(self) -> dict:
+        rows = self.store.read("SELECT tokens, updated, acquired FROM rate_buckets WHERE name = ?", (self.name,))
+        acquired = rows[0][2] if rows else 0
+        return {
+            "shared": True,
+            "rate_per_minute": round(self.rate * 60, 3),
+            "burst": self.burst,
+            "available": round(self._tokens(rows[0][:2] if rows else None, time.time()), 3),
+            "acquired": acquired,
+            "total_wait_seconds": round(self.waited, 3),
+        }
+
+
+class CircuitBreaker:
+    """
+    Shared breaker: `threshold` consecutive failures open it for `cooldown`
+    seconds (doubling per consecutive trip, up to `max_cooldown`). After the
+    cooldown one probe request is let through; its outcome closes the
+    breaker or opens it again.
+
+    Outcomes carry the time their request was granted: requests still in
+    flight when the breaker opened report after it, and neither their
+    successes nor their failures may decide for the probe.
+    """
+
+    def __init__(self, store: Coordination, name: str, threshold: int = 5, cooldown: float = 60,
+                 max_cooldown: float = 900):
+        self.store = store
+        self.name = name
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+
+    def _row(self, conn):
+        row = conn.execute(
+            "SELECT state, failures, opened_until, trips FROM breakers WHERE name = ?", (self.name,)
+        ).fetchone()
+        return row or ("closed", 0, 0.0, 0)
+
+    def _write(self, conn, state, failures, opened_until, trips):
+        conn.execute(
+            "INSERT OR REPLACE INTO breakers VALUES (?, ?, ?, ?, ?)", (self.name, state, failures, opened_until, trips)
+        )
+
+    def _idle(self) -> bool:
+        """Closed with no failures recorded; a read, without the write lock."""
+        rows = self.store.read("SELECT state, failures FROM breakers WHERE name = ?", (self.name,))
+        return not rows or rows[0] == ("closed", 0)
+
+    def retry_after(self) -> float:
+        """
+        0 when a request may go out now, else seconds until the next probe.
+        Claims the probe slot when the cooldown has just ended.
+        """
+        if self._idle():  # Common case
+            return 0.0
+
+        def check(conn):
+            state, failures, opened_until, trips = self._row(conn)
+            now = time.time()
+            if state == "closed":
+                return 0.0
+            if now < opened_until:
+                return opened_until - now
+            # Cooldown over: this caller is the probe; others wait for its outcome
+            self._write(conn, "half_open", failures, now + self.cooldown, trips)
+            return 0.0
+        return self.store.transaction(check)
+
+    def _is_probe(self, opened_until: float, granted_at: float) -> bool:
+        """Half-open: the probe slot was claimed `cooldown` before `opened_until`."""
+        return granted_at is None or granted_at >= opened_until - self.cooldown
+
+    def record_success(self, granted_at: float = None):
+        """
+        Args:
+            granted_at (float): When the request was let through (time.time());
+                None counts as the probe
+        """
+        if self._idle():
+            return
+
+        def close(conn):
+            state, failures, opened_until, trips = self._row(conn)
+            if state == "closed":
+                if failures:
+                    self._write(conn, "closed", 0, 0.0, 0)
+            elif state == "half_open" and self._is_probe(opened_until, granted_at):
+                self._write(conn, "closed", 0, 0.0, 0)
+        self.store.transaction(close)
+
+    def record_failure(self, granted_at: float = None):
+        """
+        Args:
+            granted_at (float): When the request was let through (time.time());
+                None counts as the probe
+        """
+        def fail(conn):
+            state, failures, opened_until, trips = self._row(conn)
+            if state == "open" or (state == "half_open" and not self._is_probe(opened_until, granted_at)):
+                return  # A request from before the trip: the cooldown already covers it
+            failures += 1
+            if state == "half_open" or failures >= self.threshold:
+                cooldown = min(self.max_cooldown, self.cooldown * 2 ** trips)
+                self._write(conn, "open", failures, time.time() + cooldown, trips + 1)
+                print(f"⛔ Circuit breaker '{self.name}' open for {cooldown:.0f}s after {failures} failures")
+            else:
+                self._write(conn, state, failures, opened_until, trips)
+        self.store.transaction(fail)
+
+    def snapshot(self) -> dict:
+        rows = self.store.read("SELECT state, failures, opened_until, trips FROM breakers WHERE name = ?", (self.name,))
+        state, failures, opened_until, trips = rows[0] if rows else ("closed", 0, 0.0, 0)
+        return {
+            "state": state,
+            "consecutive_failures": failures,
+            "retry_after_seconds": round(max(0.0, opened_until - time.time()), 1) if state != "closed" else 0,
+            "consecutive_trips": trips,
+        }
+
+
+class SharedCache:
+    """JSON values with a TTL, keyed by "<namespace>:<key>"."""
+
+    def __init__(self, store: Coordination, namespace: str, ttl: float):
+        self.store = store
+        self.namespace = namespace
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self._writes = 0
+        self._bypass = contextvars.ContextVar(f"cache_bypass_{namespace}", default=False)
+
+    @contextlib.contextmanager
+    def bypass(self, active: bool = True):
+        """
+        Inside this block (and tasks created in it) `get` misses, so callers
+        fetch fresh values; what they fetch is still stored. For scrapes that
+        look for changes (changes_only, saved-search polls), which a cached
+        value would hide for up to the TTL.
+        """
+        token = self._bypass.set(active or self._bypass.get())
+        try:
+            yield
+        finally:
+            self._bypass.reset(token)
+
+    def get(self, key: str):
+        if self._bypass.get():
+            return None
+        rows = self.store.read(
+            "SELECT value FROM cache WHERE key = ? AND expires_at > ?", (f"{self.namespace}:{key}", time.time())
+        )
+        if not rows:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return json.loads(rows[0][0])
+
+    def set(self, key: str, value, ttl: float = None):
+        expires_at = time.time() + (self.ttl if ttl is None else ttl)
+        payload = json.dumps(value, default=str)
+
+        def write(conn):
+            conn.execute("INSERT OR REPLACE INTO cache VALUES (?, ?, ?)", (f"{self.namespace}:{key}", payload, expires_at))
+            if self._writes % CACHE_PURGE_EVERY == 0:
+                conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+        self._writes += 1
+        self.store.transaction(write)
+
+    def snapshot(self) -> dict:
+        rows = self.store.read(
+            "SELECT COUNT(*) FROM cache WHERE key LIKE ? AND expires_at > ?", (f"{self.namespace}:%", time.time())
+        )
+        return {"entries": rows[0][0], "ttl_seconds": self.ttl, "hits": self.hits, "misses": self.misses}
+
+
+class Lease:
+    """A named lease only one process holds at a time (e.g. the saved-search scheduler)."""
+
+    def __init__(self, store: Coordination, name: str, ttl: float):
+        self.store = store
+        self.name = name
+        self.ttl = ttl
+        self.owner = None
+
+    def acquire(self) -> bool:
+        """Take or renew the lease; False while another live process holds it."""
+        owner = self.owner or f"{os.getpid()}-{id(self)}"
+
+        def take(conn):
+            now = time.time()
+            row = conn.execute("SELECT owner, expires_at FROM leases WHERE name = ?", (self.name,)).fetchone()
+            if row and row[0] != owner and row[1] > now:
+                return False
+            conn.execute("INSERT OR REPLACE INTO leases VALUES (?, ?, ?)", (self.name, owner, now + self.ttl))
+            return True
+        held = self.store.transaction(take)
+        self.owner = owner if held else None
+        return held
+
+    def release(self):
+        if self.owner:
+            owner, self.owner = self.owner, None
+            self.store.transaction(
+                lambda conn: conn.execute("DELETE FROM leases WHERE name = ? AND owner = ?", (self.name, owner))
+            )
+
+
+# Singletons
+coordination = Coordination(COORDINATION_DB)
+LINKEDIN_UPSTREAM = upstream_name("linkedin", LINKEDIN_BASE_URL, DEFAULT_LINKEDIN_BASE_URL)
+linkedin_budget = SharedRateBudget(
+    coordination, LINKEDIN_UPSTREAM, LINKEDIN_REQUESTS_PER_MINUTE / 60, burst=LINKEDIN_REQUEST_BURST
+)
+linkedin_breaker = CircuitBreaker(coordination, LINKEDIN_UPSTREAM)
+parsed_cache = SharedCache(coordination, "parsed", PARSED_CACHE_TTL)
@@ -0,0 +1,238 @@
+"""
+Central scheduler for outbound LinkedIn requests.
+
+Every request awaits `fetch_scheduler.acquire()` before it goes out. Waiting
+requests are granted one rate-budget token at a time:
+
+- between priority classes strictly: interactive, then bulk, then background;
+- within a class by stride scheduling (weighted fair queuing) over client
+  connections, so a client with a 20-page scrape queued gets the same share
+  as one with a single page, not everything ahead of it.
+
+The class and client of a request come from the context set with
+`fetch_context()` (contextvars follow awaits and tasks created inside it),
+so the scrapers themselves don't pass them around.
+
+The budget and circuit breaker live in shared.utils.coordination, shared by
+all worker processes. Callers report each outcome with `record()` (httpx
+requests go through `get()`, which does it); repeated 429/999/5xx responses
+and connection errors open the breaker and hold every grant back until its
+cooldown ends.
+"""
+import asyncio
+import contextlib
+import contextvars
+import sqlite3
+import statistics
+import time
+from collections import deque
+
+import httpx  # type: ignore
+
+from shared.utils.coordination import CircuitBreaker, linkedin_breaker, linkedin_budget
+
+PRIORITIES = ("interactive", "bulk", "background")
+DEFAULT_PRIORITY = "bulk"
+DEFAULT_CLIENT = "anonymous"
+WAIT_SAMPLES = 1000  # Recent waits per class kept for percentiles
+FAILURE_STATUSES = frozenset({429, 999})  # 999: LinkedIn's "request denied"
+CONTENTION_RETRY = 0.01  # Seconds before retrying a token another process took first
+STORAGE_RETRY = 1.0
+
+_priority = contextvars.ContextVar("fetch_priority", default=DEFAULT_PRIORITY)
+_client = contextvars.ContextVar("fetch_client", default=DEFAULT_CLIENT)
+_weight = contextvars.ContextVar("fetch_weight", default=1.0)
+_granted = contextvars.ContextVar("fetch_granted", default=None)  # time.time() of this task's latest grant
+
+
+@contextlib.contextmanager
+def fetch_context(priority: str = DEFAULT_PRIORITY, client: str = DEFAULT_CLIENT, weight: float = 1.0):
+    """
+    Attribute the requests made inside this block to `client` in class `priority`.
+
+    Raises:
+        ValueError: On an unknown priority or a non-positive weight
+    """
+    if priority not in PRIORITIES:
+        raise ValueError(f"Unknown priority {priority!r}, expected one of {PRIORITIES}")
+    if weight <= 0:
+        raise ValueError("weight must be positive")
+    tokens = (_priority.set(priority), _client.set(client), _weight.set(weight))
+    try:
+        yield
+    finally:
+        for var, token in zip((_priority, _client, _weight), tokens):
+            var.reset(token)
+
+
+class _PriorityClass:
+    """Per-client FIFO queues of one priority class, served by stride scheduling."""
+
+    def __init__(self):
+        self.queues = {}  # client -> deque of (future, enqueued at)
+        self.passes = {}  # client -> virtual finish time
+        self.virtual_time = 0.0
+        self.queued = 0
+        self.max_queued = 0
+        self.granted = 0
+        self.cancelled = 0
+        self.waits = deque(maxlen=WAIT_SAMPLES)
+
+    def push(self, client: str, future: asyncio.Future):
+        queue = self.queues.get(client)
+        if queue is None:
+            queue = self.queues[client] = deque()
+            # A client that was idle resumes at the current virtual time, without saved-up credit
+            self.passes[client] = max(self.passes.get(client, 0.0), self.virtual_time)
+        queue.append((future, time.monotonic()))
+        self.queued += 1
+        self.max_queued = max(self.max_queued, self.queued)
+
+    def pop(self, weights: dict):
+        """Next live request of the client with the lowest pass, or None."""
+        while self.queues:
+            client = min(self.queues, key=self.passes.__getitem__)
+            queue = self.queues[client]
+            future, enqueued = queue.popleft()
+            self.queued -= 1
+            if not queue:
+                del self.queues[client]
+            if future.done():  # Cancelled while waiting
+                self.cancelled += 1
+                continue
+            self.virtual_time = self.passes[client]
+            self.passes[client] += 1.0 / weights.get(client, 1.0)
+            self.granted += 1
+            self.waits.append(time.monotonic() - enqueued)
+            return future
+        return None
+
+    def snapshot(self) -> dict:
+        waits = sorted(self.waits)
+
+        def percentile(q):
+            if len(waits) < 2:
+                return round(waits[0], 3) if waits else None
+            return round(statistics.quantiles(waits, n=100, method="inclusive")[q - 1], 3)
+
+        return {
+            "queued": self.queued,
+            "max_queued": self.max_queued,
+            "granted": self.granted,
+            "cancelled": self.cancelled,
+            "clients_waiting": {client: len(queue) for client, queue in self.queues.items()},
+            "wait_seconds": {"p50": percentile(50), "p95": percentile(95), "max": round(waits[-1], 3) if waits else None},
+        }
+
+
+class FetchScheduler:
+    """Grants rate-budget tokens by priority class, then fair share per client."""
+
+    def __init__(self, budget, breaker: CircuitBreaker = None, failure_statuses: frozenset = FAILURE_STATUSES):
+        """
+        Args:
+            budget: RateBudget (one process) or coordination.SharedRateBudget
+            breaker (CircuitBreaker): Optional; grants pause while it is open
+            failure_statuses (frozenset): Statuses besides 5xx that count as
+                the platform pushing back
+        """
+        self.budget = budget
+        self.breaker = breaker
+        self.failure_statuses = failure_statuses
+        self._classes = {priority: _PriorityClass() for priority in PRIORITIES}
+        self._weights = {}  # client -> weight of its latest request
+        self._dispatcher = None
+
+    async def acquire(self, priority: str = None, client: str = None):
+        """
+        Wait for this request's turn and its rate-budget token.
+        Class and client default to the surrounding `fetch_context`.
+        """
+        priority = priority or _priority.get()
+        client = client or _client.get()
+        if priority not in PRIORITIES:
+            raise ValueError(f"Unknown priority {priority!r}, expected one of {PRIORITIES}")
+        self._weights[client] = _weight.get()
+
+        future = asyncio.get_running_loop().create_future()
+        self._classes[priority].push(client, future)
+        if self._dispatcher is None or self._dispatcher.done():
+            self._dispatcher = asyncio.create_task(self._dispatch())
+        await future
+        _granted.set(time.time())
+
+    def _next(self):
+        for priority in PRIORITIES:
+            future = self._classes[priority].pop(self._weights)
+            if future is not None:
+                return future
+        return None
+
+    def _pending(self) -> bool:
+        return any(c.queued for c in self._classes.values())
+
+    async def _dispatch(self):
+        while self._pending():
+            try:
+                # The pick happens only once a token is free, so later interactive requests still go first
+                wait = self.budget.delay()
+                if not wait and self.breaker is not None:
+                    wait = self.breaker.retry_after()
+                if not wait and not self.budget.try_acquire():
+                    wait = CONTENTION_RETRY
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Fetch scheduler storage error, retrying: {e}")
+                wait = STORAGE_RETRY
+            if wait:
+                await asyncio.sleep(wait)
+                continue
+            future = self._next()
+            if future is None:  # Everything left was cancelled; the token goes unused
+                break
+            future.set_result(None)
+
+    async def get(self, client: httpx.AsyncClient, url: str, **kwargs) -> httpx.Response:
+        """
+        `client.get(url, **kwargs)` once granted, reporting its outcome:
+        the status, or a failure when it raises (timeout, connection error).
+        """
+        await self.acquire()
+        try:
+            response = await client.get(url, **kwargs)
+        except httpx.HTTPError:
+            self.record(None)
+            raise
+        self.record(response.status_code)
+        return response
+
+    def record(self, status_code: int = None):
+        """
+        Report the outcome of a granted request to the circuit breaker.
+        Call it from the task that acquired the grant, on every outcome,
+        so the breaker can tell the probe from requests granted before a trip.
+
+        Args:
+            status_code (int): HTTP status, or None when the request failed
+                without a response (timeout, connection error)
+        """
+        if self.breaker is None:
+            return
+        failed = status_code is None or status_code in self.failure_statuses or status_code >= 500
+        try:
+            if failed:
+                self.breaker.record_failure(_granted.get())
+            else:
+                self.breaker.record_success(_granted.get())
+        except (sqlite3.Error, OSError) as e:
+            print(f"⚠️ Circuit breaker unavailable: {e}")
+
+    def snapshot(self) -> dict:
+        return {
+            "budget": self.budget.snapshot(),
+            "breaker": self.breaker.snapshot() if self.breaker is not None else None,
+            "classes": {priority: c.snapshot() for priority, c in self._classes.items()},
+        }
+
+
+# Singleton
+fetch_scheduler = FetchScheduler(linkedin_budget, linkedin_breaker)
@@ -0,0 +1,189 @@
+"""
+US location gazetteer: detection and normalization of job locations.
+
+Backed by the bundled shared/data/us_gazetteer.json (states, major cities and
+LinkedIn metro-area names). The data is loaded on first use into exact-match
+dicts plus a word trie, so matching a location string costs one pass over
+its words regardless of how many places the gazetteer knows.
+"""
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+
+GAZETTEER_FILE = Path(__file__).parent.parent / "data" / "us_gazetteer.json"
+
+WORD = re.compile(r"[^\W_]+")
+_END = ""  # Trie key marking a complete place name
+
+
+class Place:
+    """A gazetteer entry: a state, or a city with its state code."""
+    __slots__ = ("kind", "name", "state")
+
+    def __init__(self, kind: str, name: str, state: str):
+        self.kind = kind
+        self.name = name
+        self.state = state
+
+
+def _words(text: str) -> list:
+    return WORD.findall(text.casefold())
+
+
+class Gazetteer:
+    """Compiled lookup tables; build through `get_gazetteer()`."""
+
+    def __init__(self, data: dict):
+        self.states = dict(data["states"])
+        self._countries = {" ".join(_words(c)) for c in data["countries"]}
+        affixes = data["metro_affixes"]
+        self._prefixes = [tuple(_words(p)) for p in affixes["prefixes"]]
+        self._suffixes = sorted((tuple(_words(s)) for s in affixes["suffixes"]), key=len, reverse=True)
+
+        # Later tables win on collisions: state names beat cities ("New York,
+        # United States" is the state), metro aliases beat both. Among cities the
+        # first (most populous) of a repeated name is kept.
+        self._places = {}
+        for city in data["cities"]:
+            self._places.setdefault(" ".join(_words(city["name"])), Place("city", city["name"], city["state"]))
+        for code, name in self.states.items():
+            self._places[" ".join(_words(name))] = Place("state", name, code)
+        for alias, (name, code) in data["metro_aliases"].items():
+            self._places[" ".join(_words(alias))] = Place("city", name, code)
+
+        self._trie = {}
+        for key, place in self._places.items():
+            node = self._trie
+            for word in key.split():
+                node = node.setdefault(word, {})
+            node[_END] = place
+
+    def _strip_affixes(self, words: list) -> list:
+        for prefix in self._prefixes:
+            if tuple(words[:len(prefix)]) == prefix and len(words) > len(prefix):
+                words = words[len(prefix):]
+        for suffix in self._suffixes:
+            if len(words) > len(suffix) and tuple(words[-len(suffix):]) == suffix:
+                return words[:-len(suffix)]
+        return words
+
+    def lookup(self, part: str):
+        """Exact match of one comma-separated part, ignoring metro affixes."""
+        return self._places.get(" ".join(self._strip_affixes(_words(part))))
+
+    def state_code(self, part: str):
+        """'TX' or 'Texas' (or 'Texas Metropolitan Area') -> 'TX', else None."""
+        part = part.strip()
+        if part in self.states:
+            return part
+        place = self.lookup(part)
+        return place.state if place is not None and place.kind == "state" else None
+
+    def scan(self, text: str):
+        """Leftmost-longest known place name anywhere in `text`, or None."""
+        words = _words(text)
+        for i in range(len(words)):
+            node = self._trie
+            found = None
+            for word in words[i:]:
+                node = node.get(word)
+                if node is None:
+                    break
+                found = node.get(_END, found)
+            if found is not None:
+                return found
+        return None
+
+    def is_country(self, part: str) -> bool:
+        return " ".join(_words(part)) in self._countries
+
+    def is_city_state(self, text: str) -> bool:
+        """True for 'City, ST' or 'City, State'."""
+        head, comma, tail = text.rpartition(",")
+        return bool(comma and head.strip() and self.state_code(tail))
+
+    def normalize(self, text: str):
+        """
+        Normalize a free-form location.
+
+        Returns:
+            dict | None: city, state (code), state_name, country, remote and
+                display ("Austin, TX"), or None if the location is not
+                recognizably US or remote.
+        """
+        parts = [p.strip() for p in text.split(",") if p.strip()]
+        remote = "remote" in _words(text)
+        parts = [p for p in parts if _words(p) != ["remote"]]
+
+        country = None
+        while parts and self.is_country(parts[-1]):
+            parts.pop()
+            country = "US"
+
+        city = state = None
+        if len(parts) >= 2:
+            state = self.state_code(parts[-1])
+            if state:
+                place = self.lookup(parts[-2])
+                if place is not None and place.kind == "city" and place.state == state:
+                    city = place.name
+                else:
+                    city = parts[-2]
+        # Free text is only scanned when it can't name a foreign place
+        # ("Cambridge, England" must not become Cambridge, MA)
+        if state is None and (len(parts) <= 1 or country):
+            place = self.scan(", ".join(parts))
+            if place is not None:
+                state = place.state
+                city = place.name if place.kind == "city" else None
+
+        if state is None and country is None and not remote:
+            return None
+        if state:
+            country = "US"
+            display = f"{city}, {state}" if city else self.states[state]
+        else:
+            display = "United States" if country else "Remote"
+        return {
+            "city": city,
+            "state": state,
+            "state_name": self.states.get(state),
+            "country": country,
+            "remote": remote,
+            "display": display,
+        }
+
+
+@lru_cache(maxsize=None)
+def get_gazetteer() -> Gazetteer:
+    """Load and compile the bundled gazetteer (once per process)."""
+    with open(GAZETTEER_FILE, "r", encoding="utf-8") as f:
+        return Gazetteer(json.load(f))
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str):
+    result = get_gazetteer().normalize(text)
+    return tuple(result.items()) if result else None
+
+
+def normalize_location(text: str):
+    """
+    Normalize a location string with the bundled gazetteer.
+
+    Args:
+        text (str): e.g. "Austin, Texas, United States", "Greater Seattle Area", "Remote"
+
+    Returns:
+        dict | None: See `Gazetteer.normalize`
+    """
+    if not text or not text.strip():
+        return None
+    cached = _normalize_cached(text.strip())
+    return dict(cached) if cached else None
+
+
+def is_city_state(text: str) -> bool:
+    """True for 'City, ST' or 'City, State' (any US state or DC/PR)."""
+    return get_gazetteer().is_city_state(text)
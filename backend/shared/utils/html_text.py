@@ -0,0 +1,283 @@
+"""
+HTML-to-text conversion for job descriptions.
+
+One emitter produces the canonical description layout (bullets as "• item",
+blank line between paragraphs, short header-like lines set apart) from either
+raw HTML (streamed through html.parser) or an already-parsed BeautifulSoup
+element. Output can be capped; conversion stops as soon as the cap is reached
+instead of materializing the whole text first. A deadline bounds conversion
+time the same way.
+"""
+import re
+import time
+from html.parser import HTMLParser
+
+HORIZONTAL_WHITESPACE = re.compile(r"[ \t]+")
+
+# Content of these elements is never text
+SKIPPED_TAGS = frozenset({"script", "style", "svg", "noscript", "template", "head", "title"})
+
+# Elements that start and end on their own line
+BLOCK_TAGS = frozenset({
+    "address", "article", "aside", "blockquote", "body", "dd", "div", "dl", "dt",
+    "fieldset", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+    "h5", "h6", "header", "hr", "html", "main", "nav", "ol", "pre", "section",
+    "table", "tbody", "thead", "tfoot", "tr", "ul",
+})
+
+# Closing these drops a bullet no text claimed
+LIST_TAGS = frozenset({"li", "ul", "ol"})
+
+VOID_TAGS = frozenset({
+    "area", "base", "br", "col", "embed", "hr", "img", "input",
+    "link", "meta", "param", "source", "track", "wbr",
+})
+
+BULLET = "• "
+
+DEADLINE_CHECK_EVERY = 256  # Events between clock reads when a deadline is set
+
+
+class _LimitReached(Exception):
+    pass
+
+
+class _TextEmitter:
+    """Accumulates canonical lines from start/end/text events."""
+
+    def __init__(self, max_chars: int = None, detect_headers: bool = True, deadline: float = None):
+        self.max_chars = max_chars
+        self.detect_headers = detect_headers
+        self.deadline = deadline
+        self._events = 0
+        self.lines = []
+        self.length = 0
+        self._current = []
+        self._current_length = 0
+        self._bullet = False
+        self._blank_pending = False
+        self._skip_depth = 0
+        self._br_run = 0
+
+    # --- events -------------------------------------------------
+
+    def start(self, tag: str):
+        if self.deadline is not None:
+            self._check_deadline()
+        if tag in SKIPPED_TAGS:
+            self._skip_depth += 1
+        elif self._skip_depth:
+            return
+        elif tag == "li":
+            self.line_break()
+            self._bullet = True
+        elif tag == "br":
+            # A run of two or more <br> is a paragraph break
+            self._br_run += 1
+            if self._br_run >= 2:
+                self.paragraph_break()
+            else:
+                self.line_break()
+        elif tag == "p":
+            self.paragraph_break()
+        elif tag in BLOCK_TAGS:
+            self.line_break()
+
+    def end(self, tag: str):
+        if tag in SKIPPED_TAGS:
+            if self._skip_depth:
+                self._skip_depth -= 1
+        elif self._skip_depth:
+            return
+        elif tag == "li" or tag in BLOCK_TAGS:
+            self.line_break()
+            if tag in LIST_TAGS:
+                self._bullet = False  # An empty item's bullet ends with it
+        elif tag == "p":
+            self.paragraph_break()
+
+    def text(self, data: str):
+        if self.deadline is not None:
+            self._check_deadline()
+        if self._skip_depth or not data:
+            return
+        # Collapse whitespace runs to one space (str.split beats a regex here)
+        collapsed = " ".join(data.split())
+        if data[-1].isspace() and collapsed:
+            collapsed += " "
+        if data[0].isspace() and self._current and not self._current[-1].endswith(" "):
+            collapsed = " " + collapsed
+        data = collapsed
+        if data:
+            self._br_run = 0
+            self._current.append(data)
+            self._current_length += len(data)
+            self._check_limit()
+
+    def line_break(self):
+        # A pending bullet survives empty breaks, so <li><p>text</p></li> keeps it
+        if self._current:
+            line = "".join(self._current).strip()
+            self._current = []
+            self._current_length = 0
+            self._add_line(line)
+
+    def paragraph_break(self):
+        self.line_break()
+        if self.lines:
+            self._blank_pending = True
+
+    # --- output -------------------------------------------------
+
+    def _add_line(self, line: str):
+        if not line:
+            return
+        bullet, self._bullet = self._bullet, False
+
+        is_header = (
+            self.detect_headers
+            and not bullet
+            and len(line) < 100
+            and not line.endswith(".")
+            and line.count(".") <= 1
+        )
+        # Header-like if short, single-sentence, not ending with a period:
+        # isolate it visually with blank lines
+        if is_header:
+            self._blank_pending = True
+
+        if self._blank_pending and self.lines and self.lines[-1] != "":
+            self._append("")
+        self._blank_pending = is_header
+
+        self._append(BULLET + line if bullet else line)
+
+    def _append(self, line: str):
+        self.lines.append(line)
+        self.length += len(line) + 1
+        self._check_limit()
+
+    def _check_limit(self):
+        if self.max_chars is not None and self.length + self._current_length > self.max_chars:
+            raise _LimitReached()
+
+    def _check_deadline(self):
+        self._events += 1
+        if self._events % DEADLINE_CHECK_EVERY == 0 and time.perf_counter() > self.deadline:
+            raise _LimitReached()
+
+    def result(self) -> str:
+        try:
+            self.line_break()
+        except _LimitReached:
+            pass
+        text = "\n".join(self.lines).strip()
+        if self.max_chars is not None and len(text) > self.max_chars:
+            text = text[:self.max_chars].rstrip()
+        return text
+
+
+class _HTMLTokenizer(HTMLParser):
+    def __init__(self, emitter: _TextEmitter):
+        super().__init__(convert_charrefs=True)
+        self.emitter = emitter
+
+    def handle_starttag(self, tag, attrs):
+        self.emitter.start(tag)
+        if tag in VOID_TAGS:
+            self.emitter.end(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        self.emitter.start(tag)
+        self.emitter.end(tag)
+
+    def handle_endtag(self, tag):
+        if tag not in VOID_TAGS:
+            self.emitter.end(tag)
+
+    def handle_data(self, data):
+        self.emitter.text(data)
+
+
+def trim_unterminated_tag(html: str) -> str:
+    """
+    Drop a tag left open at the end of `html` (e.g. from slicing a window).
+
+    Nothing after the last '>' can complete a tag, so a browser discards a tag
+    opened there. html.parser instead rescans the remainder once per '<' in
+    it, which is quadratic on inputs like '<img class=' * n.
+    """
+    cut = html.find("<", html.rfind(">") + 1)
+    return html if cut == -1 else html[:cut]
+
+
+def plain_text(value: str, max_chars: int = None) -> str:
+    """Fast path for tag-free input: normalize horizontal whitespace, keep newlines."""
+    if max_chars is not None:
+        value = value[:max_chars + 1]
+    value = HORIZONTAL_WHITESPACE.sub(" ", value).strip()
+    return value[:max_chars] if max_chars is not None else value
+
+
+def html_to_text(html: str, max_chars: int = None, detect_headers: bool = True, deadline: float = None) -> str:
+    """
+    Convert description HTML to canonical plain text.
+
+    Args:
+        html (str): HTML fragment or document (plain text is fine too)
+        max_chars (int): Stop converting once the output reaches this length
+        detect_headers (bool): Set short header-like lines apart with blank lines
+        deadline (float): time.perf_counter() value at which to stop converting
+            and return the text produced so far
+
+    Returns:
+        str: Formatted text
+    """
+    if not html:
+        return ""
+    if "<" not in html and "&" not in html:
+        return plain_text(html, max_chars)
+
+    emitter = _TextEmitter(max_chars, detect_headers, deadline)
+    tokenizer = _HTMLTokenizer(emitter)
+    try:
+        tokenizer.feed(trim_unterminated_tag(html))
+        tokenizer.close()
+    except _LimitReached:
+        pass
+    return emitter.result()
+
+
+def element_to_text(element, max_chars: int = None, detect_headers: bool = True) -> str:
+    """
+    Same as `html_to_text`, for an element of an existing BeautifulSoup tree.
+    Walks the tree directly rather than re-serializing and re-parsing it.
+    """
+    if element is None:
+        return ""
+    from bs4 import NavigableString, Tag  # type: ignore
+    from bs4.element import Comment, Declaration, Doctype, ProcessingInstruction  # type: ignore
+
+    non_text = (Comment, Declaration, Doctype, ProcessingInstruction)
+    emitter = _TextEmitter(max_chars, detect_headers)
+    try:
+        # Iterative walk: (tag, remaining children) - deep markup can't hit the recursion limit
+        emitter.start(element.name)
+        stack = [(element, iter(element.contents))]
+        while stack:
+            tag, children = stack[-1]
+            child = next(children, None)
+            if child is None:
+                emitter.end(tag.name)
+                stack.pop()
+            elif isinstance(child, Tag):
+                emitter.start(child.name)
+                if child.name in VOID_TAGS:
+                    emitter.end(child.name)
+                else:
+                    stack.append((child, iter(child.contents)))
+            elif isinstance(child, NavigableString) and not isinstance(child, non_text):
+                emitter.text(str(child))
+    except _LimitReached:
+        pass
+    return emitter.result()
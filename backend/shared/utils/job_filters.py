@@ -0,0 +1,157 @@
+"""
+Declarative pre-fetch filters for search-card results.
+Cards that fail the filters are dropped before their description is fetched.
+"""
+import re
+from datetime import date, datetime, timedelta
+
+MAX_PATTERN_LENGTH = 200  # Title regexes come from clients and run on every scraped card
+
+
+class JobFilter:
+    """
+    Compiled set of card filters.
+
+    Build once with `JobFilter.from_dict(...)` and call `check(card)` for every card.
+    All criteria are optional; an empty filter accepts everything.
+    """
+
+    def __init__(
+        self,
+        include_title: list = None,
+        exclude_title: list = None,
+        allow_companies: list = None,
+        deny_companies: list = None,
+        max_age_days: int = None,
+        locations: list = None,
+    ):
+        self.include_title = _compile_any(include_title)
+        self.exclude_title = _compile_any(exclude_title)
+        self.allow_companies = _casefold_set(allow_companies)
+        self.deny_companies = _casefold_set(deny_companies)
+        self.max_age_days = max_age_days
+        self.locations = _compile_any(locations, escape=True)
+
+    @classmethod
+    def from_dict(cls, filters: dict):
+        """
+        Build a filter from a websocket payload.
+
+        Accepted keys:
+            include_title (list[str]): Regexes, at least one must match the title
+            exclude_title (list[str]): Regexes, none may match the title
+            allow_companies (list[str]): Only these companies (case-insensitive)
+            deny_companies (list[str]): Never these companies (case-insensitive)
+            max_age_days (int): Drop cards published more than N days ago
+            locations (list[str]): Substrings, at least one must appear in the location
+                (raw, or its normalized "City, ST" / state name)
+
+        Raises:
+            ValueError: On unknown keys, invalid regexes or values of the wrong type
+        """
+        filters = filters or {}
+        if not isinstance(filters, dict):
+            raise ValueError(f"filters must be an object, got {type(filters).__name__}")
+        known = {"include_title", "exclude_title", "allow_companies", "deny_companies", "max_age_days", "locations"}
+        unknown = set(filters) - known
+        if unknown:
+            raise ValueError(f"Unknown filter keys: {sorted(unknown)}")
+
+        max_age_days = filters.get("max_age_days")
+        try:
+            if max_age_days is not None:
+                max_age_days = int(max_age_days)
+            return cls(
+                include_title=_as_list(filters.get("include_title")),
+                exclude_title=_as_list(filters.get("exclude_title")),
+                allow_companies=_as_list(filters.get("allow_companies")),
+                deny_companies=_as_list(filters.get("deny_companies")),
+                max_age_days=max_age_days,
+                locations=_as_list(filters.get("locations")),
+            )
+        except (TypeError, AttributeError) as e:  # e.g. a list for max_age_days, numbers for patterns
+            raise ValueError(f"Invalid filter value: {e}")
+
+    def check(self, card: dict, today: date = None):
+        """
+        Apply the filters to a single search card.
+
+        Returns:
+            str | None: Reason the card was rejected, or None if it passes
+        """
+        title = card.get("title") or ""
+        if self.include_title and not self.include_title.search(title):
+            return "title not included"
+        if self.exclude_title and self.exclude_title.search(title):
+            return "title excluded"
+
+        company = (card.get("company") or "").strip().casefold()
+        if self.allow_companies and company not in self.allow_companies:
+            return "company not allowed"
+        if company and company in self.deny_companies:
+            return "company denied"
+
+        if self.max_age_days is not None:
+            published = _parse_date(card.get("publication_date"))
+            if published:
+                today = today or date.today()
+                if published < today - timedelta(days=self.max_age_days):
+                    return "too old"
+
+        if self.locations and not self.locations.search(_location_text(card)):
+            return "location not matched"
+
+        return None
+
+
+def _as_list(value):
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [value]
+    return list(value)
+
+
+def _casefold_set(values):
+    return {v.strip().casefold() for v in values or [] if v and v.strip()}
+
+
+def _compile_any(patterns, escape: bool = False):
+    """
+    Combine several patterns into one case-insensitive alternation.
+
+    Raises:
+        ValueError: On a pattern that is too long or not a regex on its own
+            (e.g. "a)|(b", which would change the meaning of the alternation)
+    """
+    patterns = [p for p in patterns or [] if p]
+    if not patterns:
+        return None
+    for pattern in patterns:
+        if len(pattern) > MAX_PATTERN_LENGTH:
+            raise ValueError(f"Filter pattern longer than {MAX_PATTERN_LENGTH} characters: {pattern[:40]!r}...")
+        if not escape:
+            try:
+                re.compile(pattern)
+            except re.error as e:
+                raise ValueError(f"Invalid filter pattern {pattern!r}: {e}")
+    parts = [re.escape(p) if escape else f"(?:{p})" for p in patterns]
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+def _location_text(card: dict) -> str:
+    """Raw card location plus its normalized form, so "Texas" matches "Austin, TX"."""
+    location = card.get("location") or ""
+    normalized = card.get("location_normalized")
+    if normalized:
+        location = " | ".join(filter(None, (location, normalized["display"], normalized["state_name"])))
+    return location
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value).date()
+    except ValueError:
+        return None
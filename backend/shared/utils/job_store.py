@@ -0,0 +1,386 @@
+"""
+Persistent store for scraped jobs (SQLite, storage/jobs.db).
+
+Every job frame the bulk endpoints send is upserted here, keyed by job_id (or
+URL). The columns dashboards query on are stored typed next to the full JSON
+record, so a JobTable can be loaded with one column SELECT and no JSON decoding.
+
+Title, company, location and description are also indexed in an FTS5 table
+(jobs_fts, rowid = jobs.rowid) that is updated in the same transaction as the
+row, so `search` sees every job as soon as it is saved.
+"""
+import hashlib
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+
+from shared.utils.gazetteer import normalize_location
+from shared.utils.normalize import normalize_job
+from shared.utils.storage import STORAGE_DIR
+
+JOBS_DB = STORAGE_DIR / "jobs.db"
+
+# Typed columns kept alongside the JSON record, in table order
+COLUMNS = (
+    "platform", "job_id", "scraped_at", "company", "title", "location", "state",
+    "work_type", "employment_type", "posted_at",
+    "salary_min", "salary_max", "salary_currency", "salary_period",
+    "salary_annual_min", "salary_annual_max",
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    job_key TEXT PRIMARY KEY,
+    platform TEXT,
+    job_id TEXT,
+    scraped_at TEXT,
+    company TEXT,
+    title TEXT,
+    location TEXT,
+    state TEXT,
+    work_type TEXT,
+    employment_type TEXT,
+    posted_at TEXT,
+    salary_min REAL,
+    salary_max REAL,
+    salary_currency TEXT,
+    salary_period TEXT,
+    salary_annual_min REAL,
+    salary_annual_max REAL,
+    data TEXT NOT NULL,
+    updated INTEGER NOT NULL DEFAULT 0
+)
+"""
+# Write sequence: every upsert stamps its rows with MAX(updated) + 1, taken under the write lock
+UPDATED_INDEX = "CREATE INDEX IF NOT EXISTS jobs_updated ON jobs (updated)"
+
+# Full-text index. Porter stemming so "engineers" finds "Engineer".
+SEARCH_SCHEMA = """
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5(
+    title, company, location, tags, description,
+    tokenize = 'porter unicode61 remove_diacritics 2'
+)
+"""
+SEARCH_FIELDS = ("title", "company", "location", "tags", "description")
+SEARCH_WEIGHTS = (10.0, 6.0, 4.0, 3.0, 1.0)  # bm25 weight per SEARCH_FIELDS column
+SEARCH_INDEX_VERSION = 1  # PRAGMA user_version once jobs_fts covers every row
+SNIPPET_TOKENS = 16
+
+# Filter operators on typed columns: "<column>__<op>" (same names as JobTable.mask)
+FILTER_OPERATORS = {"eq": "=", "gte": ">=", "lte": "<=", "gt": ">", "lt": "<"}
+
+# Search syntax: words, "quoted phrases", field:term, -excluded
+QUERY_TERM = re.compile(r'(-?)(?:(\w+):)?(?:"([^"]*)"?|([^\s"]+))')
+WORD = re.compile(r"\w", re.UNICODE)
+
+SQL_VARIABLE_CHUNK = 500  # Stay under SQLite's bound-parameter limit
+
+
+def job_key(job: dict):
+    """
+    Identity of a job across scrapes: its LinkedIn job_id, else its URL.
+    Pages parsed from pasted HTML have neither and are keyed by their content.
+    """
+    key = job.get("job_id") or job.get("url") or job.get("job_url")
+    if key or not job.get("title"):
+        return key
+    company = job.get("company") or job.get("company_name") or ""
+    content = "\x1f".join((job["title"], company, job.get("location") or ""))
+    return "parsed:" + hashlib.sha1(content.encode()).hexdigest()[:16]
+
+
+def _search_document(job: dict) -> tuple:
+    """Text of one job per SEARCH_FIELDS column."""
+    normalized = job.get("location_normalized") or normalize_location(job.get("location"))
+    location = [job.get("location")]
+    if normalized:
+        location += [normalized.get("display"), normalized.get("state_name")]
+    tags = (job.get("work_type"), job.get("employment_type"), job.get("salary"))
+    return (
+        job.get("title"),
+        job.get("company") or job.get("company_name"),
+        " ".join(dict.fromkeys(part for part in location if part)),
+        " ".join(tag for tag in tags if tag),
+        job.get("description"),
+    )
+
+
+def fts_query(text: str) -> str:
+    """
+    Translate user search text into an FTS5 MATCH expression.
+
+    Every term is quoted, so FTS5 operators and punctuation in user input are
+    literal. Terms are AND-ed; "..." is a phrase, a trailing * a prefix,
+    `title:`/`company:`/`location:`/`description:` restricts a term to one
+    field (other "word:" prefixes are plain text) and a leading - excludes it.
+
+    Raises:
+        ValueError: If the text has no searchable term
+    """
+    include, exclude = [], []
+    for negate, field, phrase, word in QUERY_TERM.findall(text or ""):
+        term = phrase if phrase else word
+        if field and field.lower() not in SEARCH_FIELDS:
+            term, field = f"{field}:{term}", ""  # e.g. a URL, not a field filter
+        prefix = term.endswith("*") and not phrase
+        term = term.rstrip("*")
+        if not WORD.search(term):
+            continue
+        expression = '"' + term.replace('"', '""') + '"' + ("*" if prefix else "")
+        if field:
+            expression = f"{field.lower()} : {expression}"
+        (exclude if negate else include).append(expression)
+    if not include:
+        raise ValueError("Search needs at least one term")
+    return " AND ".join(include) + "".join(f" NOT {term}" for term in exclude)
+
+
+def _filter_sql(filters: dict) -> tuple:
+    """WHERE clauses over the typed jobs columns (alias j) and their parameters."""
+    clauses, params = [], []
+    for key, value in (filters or {}).items():
+        name, _, op = key.partition("__")
+        if name not in COLUMNS:
+            raise ValueError(f"Unknown column: {name}")
+        op = op or ("in" if isinstance(value, (list, tuple)) else "eq")
+        if op == "isnull":
+            clauses.append(f"j.{name} IS {'' if value else 'NOT '}NULL")
+        elif op == "in":
+            values = list(value)
+            if not values:
+                clauses.append("0")
+                continue
+            clauses.append(f"j.{name} IN ({','.join('?' * len(values))})")
+            params.extend(values)
+        elif op in FILTER_OPERATORS:
+            clauses.append(f"j.{name} {FILTER_OPERATORS[op]} ?")
+            params.append(value)
+        else:
+            raise ValueError(f"Unknown operator: {op}")
+    return clauses, params
+
+
+def _row(job: dict, platform: str, scraped_at: str) -> tuple:
+    location = job.get("location")
+    normalized = job.get("location_normalized") or normalize_location(location)
+    values = {
+        "platform": job.get("platform") or platform,
+        "job_id": job.get("job_id"),
+        "scraped_at": scraped_at,
+        "company": job.get("company") or job.get("company_name"),
+        "title": job.get("title"),
+        "location": location,
+        "state": normalized["state"] if normalized else None,
+        "work_type": job.get("work_type"),
+        "employment_type": job.get("employment_type"),
+    }
+    for column in COLUMNS:
+        if column not in values:
+            values[column] = job.get(column)
+    return tuple(values[c] for c in COLUMNS)
+
+
+class JobStore:
+    """Thread-safe upsert/read access to storage/jobs.db."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+        self._writes = 0
+
+    def _connect(self):
+        # Opened lazily so importing the store never touches the disk
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+            self._conn.execute(SEARCH_SCHEMA)
+            if "updated" not in {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}:
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN updated INTEGER NOT NULL DEFAULT 0")
+            self._conn.execute(UPDATED_INDEX)
+            self._conn.commit()
+            if self._conn.execute("PRAGMA user_version").fetchone()[0] < SEARCH_INDEX_VERSION:
+                self._rebuild_search_index()
+        return self._conn
+
+    def _rebuild_search_index(self):
+        """Index every stored job (stores created before jobs_fts existed)."""
+        conn = self._conn
+        with conn:
+            conn.execute("DELETE FROM jobs_fts")
+            cursor = conn.execute("SELECT rowid, data FROM jobs")
+            while True:
+                batch = cursor.fetchmany(SQL_VARIABLE_CHUNK)
+                if not batch:
+                    break
+                conn.executemany(
+                    f"INSERT INTO jobs_fts (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(rowid, *_search_document(json.loads(data))) for rowid, data in batch],
+                )
+            conn.execute(f"PRAGMA user_version = {SEARCH_INDEX_VERSION}")
+
+    def save_jobs(self, jobs: list, platform: str = "linkedin") -> int:
+        """
+        Upsert a batch of job dicts. Fields missing from a newer scrape (e.g. a
+        card without description) keep their stored value.
+
+        Returns:
+            int: Number of jobs written
+        """
+        scraped_at = datetime.now(timezone.utc).replace(microsecond=0).isoformat()
+        jobs = [dict(job) for job in jobs if job_key(job)]  # dicts or JobRecords
+        if not jobs:
+            return 0
+        with self._lock:
+            conn = self._connect()
+            keys = [job_key(job) for job in jobs]
+            existing = self._fetch_data(keys)
+
+            rows, documents = [], {}
+            for key, job in zip(keys, jobs):
+                if "posted_at" not in job:
+                    # Producers normalize at scrape time; relative dates can't be re-anchored later
+                    job = normalize_job(job)
+                if key in existing:
+                    merged = json.loads(existing[key])
+                    merged.update({k: v for k, v in job.items() if v is not None})
+                    job = merged
+                rows.append((key, *_row(job, platform, scraped_at), json.dumps(job, default=str)))
+                documents[key] = _search_document(job)
+
+            # Upsert (not REPLACE) keeps each job's rowid, which keys jobs_fts
+            names = ("job_key",) + COLUMNS + ("data",)
+            placeholders = ",".join("?" * len(names))
+            updates = ", ".join(f"{c} = excluded.{c}" for c in names[1:] + ("updated",))
+            with conn:
+                conn.executemany(
+                    f"INSERT INTO jobs ({', '.join(names)}, updated) "
+                    f"VALUES ({placeholders}, (SELECT COALESCE(MAX(updated), 0) + 1 FROM jobs)) "
+                    f"ON CONFLICT(job_key) DO UPDATE SET {updates}", rows
+                )
+                rowids = self._fetch_rowids(list(documents))
+                conn.executemany(
+                    f"INSERT OR REPLACE INTO jobs_fts (rowid, {', '.join(SEARCH_FIELDS)}) VALUES (?, ?, ?, ?, ?, ?)",
+                    [(rowids[key], *document) for key, document in documents.items()],
+                )
+            self._writes += 1
+        return len(rows)
+
+    def _fetch_rowids(self, keys: list) -> dict:
+        found = {}
+        conn = self._connect()
+        for start in range(0, len(keys), SQL_VARIABLE_CHUNK):
+            chunk = keys[start:start + SQL_VARIABLE_CHUNK]
+            found.update(conn.execute(
+                f"SELECT job_key, rowid FROM jobs WHERE job_key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return found
+
+    def _fetch_data(self, keys: list) -> dict:
+        found = {}
+        conn = self._connect()
+        for start in range(0, len(keys), SQL_VARIABLE_CHUNK):
+            chunk = list(keys[start:start + SQL_VARIABLE_CHUNK])
+            found.update(conn.execute(
+                f"SELECT job_key, data FROM jobs WHERE job_key IN ({','.join('?' * len(chunk))})", chunk
+            ).fetchall())
+        return found
+
+    def save_job(self, job: dict, platform: str = "linkedin") -> int:
+        return self.save_jobs([job], platform)
+
+    def version(self) -> tuple:
+        """Changes whenever the store is written, by this or another process."""
+        with self._lock:
+            data_version = self._connect().execute("PRAGMA data_version").fetchone()[0]
+            return self._writes, data_version
+
+    def columns(self) -> dict:
+        """All typed columns as lists (plus job_key), for JobTable.from_columns."""
+        with self._lock:
+            cursor = self._connect().execute(f"SELECT job_key, {', '.join(COLUMNS)} FROM jobs")
+            rows = cursor.fetchall()
+        names = ("job_key",) + COLUMNS
+        if not rows:
+            return {name: [] for name in names}
+        return dict(zip(names, map(list, zip(*rows))))
+
+    def keys(self) -> list:
+        with self._lock:
+            return [row[0] for row in self._connect().execute("SELECT job_key FROM jobs")]
+
+    def changed_since(self, sequence: int = None) -> tuple:
+        """
+        Keys of the jobs written after write `sequence` (all jobs when None).
+
+        Returns:
+            tuple: (keys, sequence to pass next time)
+        """
+        with self._lock:
+            conn = self._connect()
+            latest = conn.execute("SELECT COALESCE(MAX(updated), 0) FROM jobs").fetchone()[0]
+            if sequence is None:
+                rows = conn.execute("SELECT job_key FROM jobs WHERE updated <= ?", (latest,))
+            else:
+                rows = conn.execute("SELECT job_key FROM jobs WHERE updated > ? AND updated <= ?", (sequence, latest))
+            return [row[0] for row in rows], latest
+
+    def get_jobs(self, keys: list) -> list:
+        """Full JSON records for `keys`, in the same order (None if unknown)."""
+        if not keys:
+            return []
+        with self._lock:
+            found = self._fetch_data(keys)
+        return [json.loads(found[key]) if key in found else None for key in keys]
+
+    def search(self, query: str, filters: dict = None, limit: int = 20, offset: int = 0) -> list:
+        """
+        Ranked full-text search over title, company, location and description.
+
+        Args:
+            query (str): Search text, see `fts_query`
+            filters (dict): Conditions on typed columns, e.g.
+                {"state": ["WA", "OR"], "posted_at__gte": "2026-10-01", "salary_annual_max__gte": 150000}
+            limit (int): Maximum hits
+            offset (int): Hits to skip (paging)
+
+        Returns:
+            list[dict]: Best match first: job_key, score (higher is better),
+                snippet of the description, and the typed columns
+
+        Raises:
+            ValueError: On an empty query or unknown filter columns/operators
+        """
+        match = fts_query(query)
+        clauses, params = _filter_sql(filters)
+        where = "".join(f" AND {clause}" for clause in clauses)
+        weights = ", ".join(map(str, SEARCH_WEIGHTS))
+        description = SEARCH_FIELDS.index("description")
+        sql = (
+            f"SELECT j.job_key, -bm25(jobs_fts, {weights}) AS score, "
+            f"snippet(jobs_fts, {description}, '[', ']', '…', {SNIPPET_TOKENS}), "
+            f"{', '.join('j.' + c for c in COLUMNS)} "
+            f"FROM jobs_fts JOIN jobs j ON j.rowid = jobs_fts.rowid "
+            f"WHERE jobs_fts MATCH ?{where} ORDER BY score DESC LIMIT ? OFFSET ?"
+        )
+        with self._lock:
+            try:
+                rows = self._connect().execute(sql, [match, *params, limit, offset]).fetchall()
+            except sqlite3.OperationalError as e:
+                # Malformed MATCH expressions surface here
+                raise ValueError(f"Invalid search: {e}")
+        names = ("job_key", "score", "snippet") + COLUMNS
+        return [dict(zip(names, row)) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connect().execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+
+# Singleton
+job_store = JobStore(JOBS_DB)
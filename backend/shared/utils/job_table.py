@@ -0,0 +1,281 @@
+"""
+Columnar, NumPy-backed result set for scraped jobs.
+
+Text fields are dictionary-encoded (int32 codes + category list), salaries are
+float64 with NaN for missing, timestamps are datetime64[s] with NaT. Filters
+build one boolean mask, group-by is a bincount over codes and top-k an
+argpartition, so dashboard queries over 100k jobs never touch a Python dict
+per row.
+"""
+import operator
+
+import numpy as np
+
+CATEGORY_COLUMNS = (
+    "platform", "company", "title", "location", "state",
+    "work_type", "employment_type", "salary_currency", "salary_period",
+)
+NUMERIC_COLUMNS = ("salary_min", "salary_max", "salary_annual_min", "salary_annual_max")
+TIME_COLUMNS = ("posted_at", "scraped_at")
+COLUMNS = CATEGORY_COLUMNS + NUMERIC_COLUMNS + TIME_COLUMNS
+
+# Filter operators: "<column>__<op>"
+OPERATORS = ("eq", "in", "contains", "gte", "lte", "gt", "lt", "isnull")
+COMPARISONS = {"gte": operator.ge, "lte": operator.le, "gt": operator.gt, "lt": operator.lt}
+
+
+class Categorical:
+    """Dictionary-encoded text column; code -1 is missing."""
+    __slots__ = ("codes", "categories", "_index")
+
+    def __init__(self, codes: np.ndarray, categories: list):
+        self.codes = codes
+        self.categories = categories
+        self._index = None
+
+    @classmethod
+    def encode(cls, values: list):
+        index = {}
+        codes = np.fromiter(
+            (-1 if v is None or v == "" else index.setdefault(v, len(index)) for v in values),
+            dtype=np.int32, count=len(values),
+        )
+        return cls(codes, list(index))
+
+    def code_of(self, value):
+        if self._index is None:
+            self._index = {v: i for i, v in enumerate(self.categories)}
+        return self._index.get(value, -2)  # -2 never matches a row
+
+    def take(self, indices):
+        return Categorical(self.codes[indices], self.categories)
+
+    def values(self, indices=None) -> list:
+        codes = self.codes if indices is None else self.codes[indices]
+        categories = self.categories
+        return [categories[c] if c >= 0 else None for c in codes.tolist()]
+
+
+def _to_datetime(values: list) -> np.ndarray:
+    # ISO strings with offsets are UTC (see shared.utils.normalize); drop the suffix
+    return np.array([v[:19] if v else "NaT" for v in values], dtype="datetime64[s]")
+
+
+def _check_value(name: str, op: str, value):
+    """Filter values come from JSON: reject shapes an operator can't use, as ValueError."""
+    if op == "isnull":
+        if not isinstance(value, bool):
+            raise ValueError(f"{name}__isnull needs true or false, got {value!r}")
+        return
+    values = value if op == "in" else [value]
+    if op == "in" and not isinstance(value, (list, tuple)):
+        raise ValueError(f"{name}__in needs a list, got {type(value).__name__}")
+    for item in values:
+        if isinstance(item, bool) or not isinstance(item, (str, int, float)):
+            raise ValueError(f"{name}__{op} needs a string or number, got {item!r}")
+
+
+def _parse_datetime(value):
+    try:
+        return np.datetime64(str(value)[:19], "s")
+    except ValueError:
+        raise ValueError(f"Invalid timestamp: {value!r}")
+
+
+class JobTable:
+    """
+    Immutable columnar job set. Every operation returns a new table or plain values.
+
+    Build with `from_columns` (e.g. `job_store.columns()`) or `from_records`.
+    """
+
+    def __init__(self, keys: np.ndarray, columns: dict):
+        self.keys = keys
+        self.columns = columns
+
+    @classmethod
+    def from_columns(cls, columns: dict):
+        keys = np.array(columns.get("job_key", []), dtype=object)
+        built = {}
+        for name in CATEGORY_COLUMNS:
+            built[name] = Categorical.encode(columns.get(name) or [None] * len(keys))
+        for name in NUMERIC_COLUMNS:
+            values = columns.get(name) or [None] * len(keys)
+            built[name] = np.array([np.nan if v is None else v for v in values], dtype=np.float64)
+        for name in TIME_COLUMNS:
+            built[name] = _to_datetime(columns.get(name) or [None] * len(keys))
+        return cls(keys, built)
+
+    @classmethod
+    def from_records(cls, records: list, key: str = "job_id"):
+        columns = {"job_key": [r.get(key) for r in records]}
+        for name in COLUMNS:
+            columns[name] = [r.get(name) for r in records]
+        return cls.from_columns(columns)
+
+    def __len__(self):
+        return len(self.keys)
+
+    def take(self, indices) -> "JobTable":
+        columns = {
+            name: column.take(indices) if isinstance(column, Categorical) else column[indices]
+            for name, column in self.columns.items()
+        }
+        return JobTable(self.keys[indices], columns)
+
+    # --- filtering ---------------------------------------------
+
+    def mask(self, filters: dict) -> np.ndarray:
+        """
+        Boolean row mask for `filters`, all conditions AND-ed.
+
+        Keys are "<column>" (equality, or membership for a list) or
+        "<column>__<op>" with op in OPERATORS. Text columns support eq, in,
+        contains (case-insensitive substring) and isnull; numeric and time
+        columns support gte, lte, gt, lt and isnull.
+
+        Raises:
+            ValueError: On unknown columns/operators or bad values
+        """
+        mask = np.ones(len(self), dtype=bool)
+        for key, value in (filters or {}).items():
+            name, _, op = key.partition("__")
+            if name not in self.columns:
+                raise ValueError(f"Unknown column: {name}")
+            op = op or ("in" if isinstance(value, (list, tuple)) else "eq")
+            if op not in OPERATORS:
+                raise ValueError(f"Unknown operator: {op}")
+            _check_value(name, op, value)
+            mask &= self._condition(self.columns[name], name, op, value)
+        return mask
+
+    def _condition(self, column, name, op, value) -> np.ndarray:
+        if isinstance(column, Categorical):
+            if op == "isnull":
+                return (column.codes < 0) == bool(value)
+            if op == "eq":
+                return column.codes == column.code_of(value)
+            if op == "in":
+                return np.isin(column.codes, [column.code_of(v) for v in value])
+            if op == "contains":
+                # Evaluated once per distinct value, not per row
+                needle = str(value).casefold()
+                wanted = [i for i, c in enumerate(column.categories) if needle in str(c).casefold()]
+                return np.isin(column.codes, wanted)
+            raise ValueError(f"Operator {op} not supported on text column {name}")
+
+        if name in TIME_COLUMNS:
+            missing = np.isnat(column)
+            bound = None if op == "isnull" else _parse_datetime(value)
+        else:
+            missing = np.isnan(column)
+            bound = None if op == "isnull" else float(value)
+        if op == "isnull":
+            return missing == bool(value)
+        if op in ("eq", "in"):
+            raise ValueError(f"Use gte/lte on numeric column {name}")
+        with np.errstate(invalid="ignore"):
+            result = COMPARISONS[op](column, bound)
+        return result & ~missing
+
+    def filter(self, filters: dict) -> "JobTable":
+        return self.take(np.flatnonzero(self.mask(filters)))
+
+    # --- aggregates --------------------------------------------
+
+    def count_by(self, name: str, limit: int = None) -> list:
+        """[(value, count), ...] for a text column, most common first; None counts missing."""
+        column = self.columns.get(name)
+        if not isinstance(column, Categorical):
+            raise ValueError(f"Can only group by text columns: {sorted(CATEGORY_COLUMNS)}")
+        counts = np.bincount(column.codes + 1, minlength=len(column.categories) + 1)
+        present = np.flatnonzero(counts)
+        order = present[np.argsort(-counts[present], kind="stable")]
+        if limit is not None:
+            order = order[:limit]
+        return [(column.categories[i - 1] if i else None, int(counts[i])) for i in order]
+
+    def percentiles(self, name: str, q: list) -> dict:
+        """{q: value} over non-missing values of a numeric column (None if empty)."""
+        column = self.columns.get(name)
+        if name not in NUMERIC_COLUMNS:
+            raise ValueError(f"Percentiles need a numeric column: {sorted(NUMERIC_COLUMNS)}")
+        values = column[~np.isnan(column)]
+        if not len(values):
+            return {p: None for p in q}
+        return dict(zip(q, np.percentile(values, q).tolist()))
+
+    def top_k(self, name: str, k: int, descending: bool = True) -> "JobTable":
+        """The k rows with the largest (or smallest) values; missing values last."""
+        column = self.columns.get(name)
+        if name in TIME_COLUMNS:
+            values = column.astype("int64").astype(np.float64)
+            values[np.isnat(column)] = np.nan
+        elif name in NUMERIC_COLUMNS:
+            values = column
+        else:
+            raise ValueError("top_k needs a numeric or time column")
+
+        keys = -values if descending else values.copy()
+        keys[np.isnan(keys)] = np.inf
+        k = min(k, len(keys))
+        if k <= 0:
+            return self.take(np.array([], dtype=np.intp))
+        candidates = np.argpartition(keys, k - 1)[:k] if k < len(keys) else np.arange(len(keys))
+        return self.take(candidates[np.argsort(keys[candidates], kind="stable")])
+
+    # --- output ------------------------------------------------
+
+    def to_records(self) -> list:
+        """Rows as dicts (typed columns only; full records live in the job store)."""
+        out = {"job_key": self.keys.tolist()}
+        for name, column in self.columns.items():
+            if isinstance(column, Categorical):
+                out[name] = column.values()
+            elif name in TIME_COLUMNS:
+                out[name] = [None if np.isnat(v) else str(v) for v in column]
+            else:
+                out[name] = [None if np.isnan(v) else float(v) for v in column]
+        names = list(out)
+        return [dict(zip(names, row)) for row in zip(*out.values())]
+
+
+def run_query(table: JobTable, filters: dict = None, group_by: list = (), percentiles: dict = None,
+              top: dict = None, limit: int = 50) -> dict:
+    """
+    Dashboard query: filter, then aggregate and pick rows from the matches.
+
+    Args:
+        table (JobTable): Full result set
+        filters (dict): See `JobTable.mask`
+        group_by (list[str]): Text columns to count by
+        percentiles (dict[str, list[float]]): Numeric column -> percentiles (0-100)
+        top (dict): {"by": column, "k": int, "descending": bool} - rows to return;
+            without it the first `limit` matches are returned
+        limit (int): Maximum rows returned
+
+    Returns:
+        dict: total, matched, groups, percentiles, and the selected table as "rows"
+
+    Raises:
+        ValueError: On unknown columns/operators or bad values
+    """
+    matched = table.filter(filters)
+    groups = {name: [{"value": v, "count": c} for v, c in matched.count_by(name)] for name in group_by or ()}
+    stats = {
+        name: {str(q): v for q, v in matched.percentiles(name, list(qs)).items()}
+        for name, qs in (percentiles or {}).items()
+    }
+    if top:
+        if "by" not in top:
+            raise ValueError("top needs a 'by' column")
+        rows = matched.top_k(top["by"], min(int(top.get("k", limit)), limit), top.get("descending", True))
+    else:
+        rows = matched.take(np.arange(min(limit, len(matched))))
+    return {
+        "total": len(table),
+        "matched": len(matched),
+        "groups": groups,
+        "percentiles": stats,
+        "rows": rows,
+    }
@@ -0,0 +1,263 @@
+"""
+Offline resume-to-job match scoring with hashed TF-IDF vectors.
+
+Every job description (plus its title, counted twice) is reduced once to a
+sparse vector of hashed term frequencies and cached per job key, in memory
+and in the job_vectors table of storage/jobs.db, so a restart never
+re-tokenizes. Scoring a resume builds its vector and runs one sparse
+matrix-vector product against all jobs: the matrix is kept column-major
+(one posting list per hashed term, TF-IDF weighted and L2-normalized per
+job), so only the resume's own terms are touched. Scores are cosine
+similarities in [0, 1].
+"""
+import hashlib
+import re
+import sqlite3
+import threading
+import zlib
+from pathlib import Path
+
+import numpy as np
+
+from shared.utils.job_store import JOBS_DB, SQL_VARIABLE_CHUNK, job_key
+
+N_FEATURES = 1 << 18  # Hashed vocabulary size; collisions are rare at this size
+TITLE_REPEAT = 2  # Title words count this many times
+MIN_TOKEN_LENGTH = 2
+# Terms in more than this share of jobs carry no signal but have the longest
+# posting lists; they are left out of the matrix once there are enough jobs
+MAX_DF = 0.5
+MAX_DF_MIN_JOBS = 50
+
+WORD = re.compile(r"[^\W_]+[+#]*")  # "c++", "c#" stay distinct from "c"
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being but by can could did do does
+for from had has have having he her here hers him his how i if in into is it its itself just
+may me more most my no nor not of off on once only or other our ours out over own same she
+should so some such than that the their theirs them then there these they this those through
+to too under until up very was we were what when where which while who whom why will with
+would you your yours yourself including within across etc per via able ability well work
+working job role team company us new years year experience
+""".split())
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_vectors (
+    job_key TEXT PRIMARY KEY,
+    text_hash TEXT NOT NULL,
+    features BLOB NOT NULL,
+    counts BLOB NOT NULL
+)
+"""
+
+_hash_cache = {}
+MAX_HASH_CACHE = 200_000
+
+
+def _feature(token: str) -> int:
+    # crc32, not hash(): vectors are persisted and must hash the same in every process
+    feature = _hash_cache.get(token)
+    if feature is None:
+        if len(_hash_cache) >= MAX_HASH_CACHE:
+            _hash_cache.clear()
+        feature = _hash_cache[token] = zlib.crc32(token.encode()) & (N_FEATURES - 1)
+    return feature
+
+
+def term_vector(text: str, title: str = None) -> tuple:
+    """
+    Hashed term counts of a document.
+
+    Returns:
+        tuple: (features int32[], counts float32[]), features sorted and unique
+    """
+    tokens = WORD.findall((text or "").casefold())
+    if title:
+        tokens += WORD.findall(title.casefold()) * TITLE_REPEAT
+    features = [_feature(t) for t in tokens if len(t) >= MIN_TOKEN_LENGTH and t not in STOP_WORDS]
+    if not features:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    unique, counts = np.unique(np.array(features, dtype=np.int32), return_counts=True)
+    return unique, counts.astype(np.float32)
+
+
+def _text_hash(text: str, title: str) -> str:
+    return hashlib.sha1(f"{title or ''}\x1f{text or ''}".encode()).hexdigest()[:16]
+
+
+class MatchIndex:
+    """
+    Per-job hashed term vectors and the TF-IDF matrix built from them.
+
+    `add_job` is cheap (one tokenization per new or changed description); the
+    matrix is rebuilt lazily by the first `rank` after jobs were added.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+        self._vectors = {}  # job key -> (text hash, features, counts)
+        self._loaded = False
+        self._matrix = None  # Built by _build; None when stale
+        self._synced = None  # Job store write sequence covered by sync
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _load(self):
+        if self._loaded:
+            return
+        rows = self._connect().execute("SELECT job_key, text_hash, features, counts FROM job_vectors").fetchall()
+        for key, text_hash, features, counts in rows:
+            self._vectors[key] = (
+                text_hash, np.frombuffer(features, dtype=np.int32), np.frombuffer(counts, dtype=np.float32)
+            )
+        self._loaded = True
+        self._matrix = None
+
+    def __len__(self):
+        with self._lock:
+            self._load()
+            return len(self._vectors)
+
+    def add_jobs(self, jobs: list) -> int:
+        """
+        Vectorize jobs with a description; unchanged ones are skipped.
+
+        Returns:
+            int: Number of vectors (re)computed
+        """
+        with self._lock:
+            self._load()
+            rows = []
+            for job in jobs:
+                key, description = job_key(job), job.get("description")
+                if not key or not description:
+                    continue
+                text_hash = _text_hash(description, job.get("title"))
+                cached = self._vectors.get(key)
+                if cached is not None and cached[0] == text_hash:
+                    continue
+                features, counts = term_vector(description, job.get("title"))
+                self._vectors[key] = (text_hash, features, counts)
+                rows.append((key, text_hash, features.tobytes(), counts.tobytes()))
+            if rows:
+                self._matrix = None
+                conn = self._connect()
+                with conn:
+                    conn.executemany("INSERT OR REPLACE INTO job_vectors VALUES (?, ?, ?, ?)", rows)
+            return len(rows)
+
+    def add_job(self, job: dict) -> int:
+        return self.add_jobs([job])
+
+    def sync(self, store) -> int:
+        """
+        Vectorize stored jobs written since the last sync: new descriptions get
+        a vector, changed ones a new vector. Jobs without a description are
+        read again only when they are rewritten.
+        """
+        with self._lock:
+            self._load()
+            keys, sequence = store.changed_since(self._synced)
+            added = 0
+            for start in range(0, len(keys), SQL_VARIABLE_CHUNK):
+                jobs = store.get_jobs(keys[start:start + SQL_VARIABLE_CHUNK])
+                added += self.add_jobs([job for job in jobs if job])
+            self._synced = sequence
+            return added
+
+    def _build(self):
+        """CSC matrix: per hashed term, the rows (jobs) containing it and their weights."""
+        keys = list(self._vectors)
+        lengths = np.fromiter((len(self._vectors[k][1]) for k in keys), dtype=np.int64, count=len(keys))
+        if lengths.sum():
+            features = np.concatenate([self._vectors[k][1] for k in keys])
+            counts = np.concatenate([self._vectors[k][2] for k in keys])
+        else:
+            features, counts = np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+        rows = np.repeat(np.arange(len(keys), dtype=np.int32), lengths)
+
+        # Smoothed IDF, sublinear TF, then unit-length rows
+        df = np.bincount(features, minlength=N_FEATURES)
+        idf = (np.log((1 + len(keys)) / (1 + df)) + 1).astype(np.float32)
+        if len(keys) >= MAX_DF_MIN_JOBS:
+            common = df > MAX_DF * len(keys)
+            idf[common] = 0
+            df[common] = 0
+            keep = ~common[features]
+            features, counts, rows = features[keep], counts[keep], rows[keep]
+        weights = (1 + np.log(counts)) * idf[features]
+        norms = np.sqrt(np.bincount(rows, weights=weights * weights, minlength=len(keys)))
+        norms[norms == 0] = 1
+        weights /= norms[rows].astype(np.float32)
+
+        order = np.argsort(features, kind="stable")
+        indptr = np.zeros(N_FEATURES + 1, dtype=np.int64)
+        np.cumsum(df, out=indptr[1:])
+        self._matrix = {
+            "keys": np.array(keys, dtype=object),
+            "idf": idf,
+            "indptr": indptr,
+            "rows": rows[order],
+            "weights": weights[order].astype(np.float32),
+        }
+
+    def rank(self, text: str, limit: int = 20, keys: list = None) -> list:
+        """
+        Jobs most similar to `text` (e.g. a resume), best first.
+
+        Args:
+            text (str): Resume or query text
+            limit (int): Maximum results
+            keys (list): Only rank these job keys
+
+        Returns:
+            list[tuple]: (job key, cosine similarity) pairs with a score above 0
+        """
+        features, counts = term_vector(text)
+        with self._lock:
+            self._load()
+            if self._matrix is None:
+                self._build()
+            matrix = self._matrix
+        job_keys = matrix["keys"]
+        if not len(job_keys) or not len(features):
+            return []
+
+        query = (1 + np.log(counts)) * matrix["idf"][features]
+        norm = np.linalg.norm(query)
+        if not norm:
+            return []
+        query /= norm
+        # Sparse matrix-vector product over the posting lists of the query terms
+        indptr = matrix["indptr"]
+        starts, ends = indptr[features], indptr[features + 1]
+        present = ends > starts
+        starts, ends, query = starts[present], ends[present], query[present]
+        if not len(starts):
+            return []
+        lengths = ends - starts
+        positions = np.arange(lengths.sum()) + np.repeat(starts - (np.cumsum(lengths) - lengths), lengths)
+        contributions = matrix["weights"][positions] * np.repeat(query, lengths)
+        scores = np.bincount(matrix["rows"][positions], weights=contributions, minlength=len(job_keys))
+
+        if keys is not None:
+            allowed = np.isin(job_keys, list(keys))
+            scores = np.where(allowed, scores, 0)
+        limit = min(limit, len(scores))
+        if limit <= 0:
+            return []
+        top = np.argpartition(-scores, limit - 1)[:limit] if limit < len(scores) else np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [(job_keys[i], float(scores[i])) for i in top if scores[i] > 0]
+
+
+# Singleton
+match_index = MatchIndex(JOBS_DB)
@@ -0,0 +1,276 @@
+"""
+Near-duplicate job postings: SimHash fingerprints with an LSH band index.
+
+LinkedIn reposts one role under new job IDs and across locations. Each
+description is fingerprinted with a 64-bit SimHash over word 3-shingles of
+its normalized text; fingerprints within MAX_DISTANCE bits of each other are
+the same posting. The 64 bits are split into BANDS bands, so (pigeonhole)
+any two fingerprints within MAX_DISTANCE share at least one band exactly and
+a lookup only compares against the few fingerprints in matching buckets.
+
+Postings are grouped into clusters named after their first (canonical) job.
+A cluster also remembers the card title + company + location of members whose
+description was fetched, so a new card for the same role can be collapsed
+before its description is fetched: only when the card names a single recent
+cluster that at least MIN_CARD_MEMBERS descriptions already confirmed.
+Clusters persist in the job_clusters table of storage/jobs.db.
+"""
+import hashlib
+import re
+import sqlite3
+import string
+import threading
+import time
+from pathlib import Path
+
+import numpy as np
+
+from shared.utils.job_store import JOBS_DB, job_key
+
+BITS = 64
+BANDS = 8  # BANDS > MAX_DISTANCE guarantees every near duplicate shares a band
+BAND_BITS = BITS // BANDS
+# A repost with a word or two changed (location, dates) moves a 350-word
+# description by 2-7 bits; unrelated descriptions differ by about 32
+MAX_DISTANCE = 6
+SHINGLE_WORDS = 3
+MIN_SHINGLES = 8  # Shorter texts fingerprint too coarsely to compare
+# A card is collapsed without a fetch only into a cluster this many fetched
+# descriptions confirmed, seen with that card within CARD_MAX_AGE
+MIN_CARD_MEMBERS = 2
+CARD_MAX_AGE = 30 * 24 * 3600  # Seconds
+
+WORD = re.compile(r"[^\W_]+")  # Digits kept: "Level 2" and "Level 3" are different roles
+URL = re.compile(r"https?://\S+")
+# Digits and punctuation become spaces: dates, counts and IDs differ between reposts
+SEPARATORS = str.maketrans({c: " " for c in string.punctuation + string.digits + "–—‘’“”•·…"})
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS job_clusters (
+    job_key TEXT PRIMARY KEY,
+    cluster_id TEXT NOT NULL,
+    simhash INTEGER,
+    card_key TEXT,
+    seen_at REAL
+)
+"""
+
+
+_word_hashes = {}
+MAX_WORD_HASHES = 200_000
+# Odd multipliers for combining word hashes into a shingle hash
+_SHINGLE_MULTIPLIERS = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F), np.uint64(1))
+
+
+def _word_hash_list(words: list) -> list:
+    values = list(map(_word_hashes.get, words))  # Cached words cost one C-level lookup
+    if None in values:
+        if len(_word_hashes) >= MAX_WORD_HASHES:
+            _word_hashes.clear()
+        for i, word in enumerate(words):
+            if values[i] is None:
+                value = _word_hashes.get(word)
+                if value is None:
+                    digest = hashlib.blake2b(word.encode(), digest_size=8).digest()
+                    value = _word_hashes[word] = int.from_bytes(digest, "big", signed=True)
+                values[i] = value
+    return values
+
+
+def _mix(z: np.ndarray) -> np.ndarray:
+    """splitmix64 finalizer, so every shingle hash bit depends on all words."""
+    z = z ^ (z >> np.uint64(30))
+    z = z * np.uint64(0xBF58476D1CE4E5B9)
+    z = z ^ (z >> np.uint64(27))
+    z = z * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _shingle_hashes(words: list) -> np.ndarray:
+    """Distinct 64-bit hashes of the SHINGLE_WORDS-word shingles."""
+    # Signed values convert to int64 without Python's big-int path
+    hashes = np.array(_word_hash_list(words), dtype=np.int64).view(np.uint64)
+    count = len(words) - SHINGLE_WORDS + 1
+    combined = np.zeros(count, dtype=np.uint64)
+    for offset, multiplier in enumerate(_SHINGLE_MULTIPLIERS[-SHINGLE_WORDS:]):
+        combined += hashes[offset:offset + count] * multiplier  # Wraps mod 2**64
+    return np.unique(_mix(combined))
+
+
+def _bit_columns(hashes: np.ndarray) -> np.ndarray:
+    """(n, 64) 0/1 matrix, most significant bit first."""
+    return np.unpackbits(hashes.astype(">u8").view(np.uint8).reshape(-1, 8), axis=1)
+
+
+def simhash(text: str):
+    """
+    64-bit SimHash of `text`, or None when it is too short to compare.
+    Case, punctuation, numbers and URLs are ignored.
+    """
+    words = URL.sub(" ", text or "").casefold().translate(SEPARATORS).split()
+    if len(words) < SHINGLE_WORDS:
+        return None
+    hashes = _shingle_hashes(words)
+    if len(hashes) < MIN_SHINGLES:
+        return None
+    # Bit i is set when most shingle hashes have it set
+    majority = _bit_columns(hashes).sum(axis=0, dtype=np.int64) * 2 > len(hashes)
+    return int(np.packbits(majority).view(">u8")[0])
+
+
+def hamming(a: int, b: int) -> int:
+    return (a ^ b).bit_count()
+
+
+def card_key(job: dict):
+    """Normalized "title | company | location" of a card, or None without title and company."""
+    title = job.get("title")
+    company = job.get("company") or job.get("company_name")
+    if not title or not company:
+        return None
+    normalized = job.get("location_normalized") or {}
+    location = normalized.get("display") or job.get("location") or ""
+    return " | ".join(" ".join(WORD.findall(text.casefold())) for text in (title, company, location))
+
+
+def _bands(fingerprint: int) -> list:
+    mask = (1 << BAND_BITS) - 1
+    return [(band, (fingerprint >> (band * BAND_BITS)) & mask) for band in range(BANDS)]
+
+
+def _to_sqlite(fingerprint):
+    # SQLite integers are signed 64-bit
+    if fingerprint is None or fingerprint < 1 << (BITS - 1):
+        return fingerprint
+    return fingerprint - (1 << BITS)
+
+
+def _from_sqlite(value):
+    if value is None or value >= 0:
+        return value
+    return value + (1 << BITS)
+
+
+class DuplicateIndex:
+    """Clusters of near-identical postings; thread-safe, loaded lazily from jobs.db."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+        self._loaded = False
+        self._cluster_of = {}  # job key -> cluster id
+        self._fingerprints = {}  # cluster id -> [fingerprints]
+        self._buckets = {}  # (band, value) -> [cluster ids]
+        self._described = {}  # cluster id -> keys of members with a fingerprint
+        self._cards = {}  # card key -> {cluster id: last time a member with a fingerprint had it}
+
+    def _connect(self):
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(SCHEMA)
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(job_clusters)")]
+            if "seen_at" not in columns:  # Tables created before card entries expired
+                self._conn.execute("ALTER TABLE job_clusters ADD COLUMN seen_at REAL")
+            self._conn.commit()
+        return self._conn
+
+    def _load(self):
+        if self._loaded:
+            return
+        for key, cluster, fingerprint, card, seen_at in self._connect().execute(
+            "SELECT job_key, cluster_id, simhash, card_key, seen_at FROM job_clusters"
+        ):
+            self._remember(key, cluster, _from_sqlite(fingerprint), card, seen_at)
+        self._loaded = True
+
+    def _remember(self, key, cluster, fingerprint, card, seen_at):
+        self._cluster_of[key] = cluster
+        if fingerprint is not None:
+            self._described.setdefault(cluster, set()).add(key)
+            known = self._fingerprints.setdefault(cluster, [])
+            if fingerprint not in known:
+                known.append(fingerprint)
+                for band in _bands(fingerprint):
+                    clusters = self._buckets.setdefault(band, [])
+                    if cluster not in clusters:
+                        clusters.append(cluster)
+        if card and fingerprint is not None and seen_at is not None:
+            seen = self._cards.setdefault(card, {})
+            seen[cluster] = max(seen.get(cluster, 0), seen_at)
+
+    def _save(self, key, cluster, fingerprint, card):
+        seen_at = time.time()
+        self._remember(key, cluster, fingerprint, card, seen_at)
+        conn = self._connect()
+        with conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO job_clusters VALUES (?, ?, ?, ?, ?)",
+                (key, cluster, _to_sqlite(fingerprint), card, seen_at),
+            )
+
+    def _nearest(self, fingerprint: int):
+        best, best_distance = None, MAX_DISTANCE + 1
+        for band in _bands(fingerprint):
+            for cluster in self._buckets.get(band, ()):
+                for known in self._fingerprints[cluster]:
+                    distance = hamming(fingerprint, known)
+                    if distance < best_distance:
+                        best, best_distance = cluster, distance
+        return best
+
+    def card_cluster(self, job: dict):
+        """
+        Cluster this card is a repost of, when its description need not be
+        fetched: the only cluster whose fetched members had this card's title,
+        company and location within CARD_MAX_AGE, confirmed by at least
+        MIN_CARD_MEMBERS descriptions, and not this job's own cluster.
+        """
+        card = card_key(job)
+        if not card:
+            return None
+        with self._lock:
+            self._load()
+            oldest = time.time() - CARD_MAX_AGE
+            recent = [cluster for cluster, seen_at in self._cards.get(card, {}).items() if seen_at >= oldest]
+            if len(recent) != 1:  # Unknown, expired, or ambiguous between postings
+                return None
+            cluster = recent[0]
+            if len(self._described.get(cluster, ())) < MIN_CARD_MEMBERS:
+                return None
+            own = self._cluster_of.get(job_key(job))
+        return cluster if cluster != own else None
+
+    def add_card(self, job: dict, cluster: str):
+        """Record a card collapsed into `cluster` without a description."""
+        key = job_key(job)
+        if key:
+            with self._lock:
+                self._load()
+                self._save(key, cluster, None, card_key(job))
+
+    def add(self, job: dict):
+        """
+        File a job with a description into its cluster.
+
+        Returns:
+            str: Cluster id, which is the job's own key when it starts a new
+                cluster (or has no usable description)
+        """
+        key = job_key(job)
+        if not key:
+            return None
+        fingerprint = simhash(job.get("description"))
+        with self._lock:
+            self._load()
+            cluster = self._cluster_of.get(key)
+            if cluster is None and fingerprint is not None:
+                cluster = self._nearest(fingerprint)
+            self._save(key, cluster or key, fingerprint, card_key(job))
+            return cluster or key
+
+
+# Singleton
+duplicate_index = DuplicateIndex(JOBS_DB)
@@ -0,0 +1,197 @@
+"""
+Typed columns for the free-text posting fields.
+
+`posted` / `date_posted` ("Reposted 3 weeks ago") and `publication_date` become
+one absolute `posted_at` timestamp; `salary` ("$120K/yr - $150K/yr") becomes
+numeric min/max, currency, period and annualized min/max. Consumers can then
+sort and filter on plain values instead of re-parsing strings.
+
+Normalization runs over whole batches: every distinct string is parsed once
+(and cached across batches), so a page of cards or a result set of thousands
+of jobs only pays for lookups and one timedelta subtraction per job.
+"""
+import re
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+
+POSTED_COLUMNS = ("posted_at",)
+SALARY_COLUMNS = (
+    "salary_min", "salary_max", "salary_currency", "salary_period",
+    "salary_annual_min", "salary_annual_max",
+)
+TYPED_COLUMNS = POSTED_COLUMNS + SALARY_COLUMNS
+
+RELATIVE_AGE = re.compile(
+    r'\b(\d{1,4}|an?|one)\+?\s{1,3}(second|minute|hour|day|week|month|year)s?\s{1,3}ago\b',
+    re.IGNORECASE,
+)
+AGE_UNITS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+    "month": timedelta(days=30),
+    "year": timedelta(days=365),
+}
+
+# "120,000", "60.000" (a "." followed by exactly three digits groups thousands), "45"; cents; K/M
+AMOUNT = (
+    r'(?P<number>\d{1,3}(?:,\d{3})+|\d{1,3}(?:\.\d{3})+(?!\d)|\d{1,9})(?:\.(?P<fraction>\d{1,2}))?'
+    r'\s?(?P<multiplier>[kKmM](?![a-zA-Z]))?'
+)
+SALARY_AMOUNT = re.compile(r'(?P<currency>[$€£₹])\s?' + AMOUNT)
+# Upper end of a range right after its first amount; its currency sign is optional ("$80K - 90K")
+RANGE_END = re.compile(r'\s?(?:/\s?[a-zA-Z]+\s?)?(?:-|–|—|to)\s?(?P<currency>[$€£₹])?\s?' + AMOUNT)
+SALARY_PERIOD = re.compile(
+    r'/\s?(yr|year|hr|hour|mo|month|wk|week|day)\b'
+    r'|\b(?:a|an|per)\s(year|hour|month|week|day)\b'
+    r'|\b(annually|yearly|hourly|monthly|weekly|daily)\b',
+    re.IGNORECASE,
+)
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+CURRENCIES = {"$": "USD", "€": "EUR", "£": "GBP", "₹": "INR"}
+PERIODS = {
+    "yr": "year", "year": "year", "annually": "year", "yearly": "year",
+    "hr": "hour", "hour": "hour", "hourly": "hour",
+    "mo": "month", "month": "month", "monthly": "month",
+    "wk": "week", "week": "week", "weekly": "week",
+    "day": "day", "daily": "day",
+}
+# Working periods per year, for comparing hourly and yearly pay
+PERIODS_PER_YEAR = {"year": 1, "month": 12, "week": 52, "day": 260, "hour": 2080}
+HOURLY_CEILING = 500  # Unlabelled amounts below this are taken as hourly
+
+EMPTY_SALARY = dict.fromkeys(SALARY_COLUMNS)
+
+
+@lru_cache(maxsize=4096)
+def parse_age(text: str):
+    """
+    Age described by a relative date.
+
+    Args:
+        text (str): e.g. "Reposted 3 weeks ago", "1 hour ago", "30+ days ago", "Just now"
+
+    Returns:
+        timedelta | None: None if the text holds no relative date
+    """
+    if not text:
+        return None
+    match = RELATIVE_AGE.search(text)
+    if match:
+        count, unit = match.groups()
+        count = int(count) if count.isdigit() else 1
+        return AGE_UNITS[unit.lower()] * count
+    lowered = text.lower()
+    if "just now" in lowered or "just posted" in lowered or "today" in lowered:
+        return timedelta(0)
+    if "yesterday" in lowered:
+        return timedelta(days=1)
+    return None
+
+
+def _amount(match) -> float:
+    value = float(match.group("number").replace(",", "").replace(".", ""))
+    if match.group("fraction"):
+        value += float("0." + match.group("fraction"))
+    multiplier = match.group("multiplier")
+    return value * MULTIPLIERS[multiplier.lower()] if multiplier else value
+
+
+@lru_cache(maxsize=4096)
+def _parse_salary_cached(text: str) -> tuple:
+    amounts = [match for _, match in zip(range(2), SALARY_AMOUNT.finditer(text))]
+    if not amounts:
+        return tuple(EMPTY_SALARY.items())
+    range_end = RANGE_END.match(text, amounts[0].end())
+    if range_end:
+        amounts[1:] = [range_end]
+
+    low = _amount(amounts[0])
+    high = _amount(amounts[1]) if len(amounts) > 1 else low
+    if len(amounts) > 1 and amounts[1].group("multiplier") and not amounts[0].group("multiplier") and low < high / 100:
+        # "$80 - 90K": the multiplier is written once for the whole range
+        low *= MULTIPLIERS[amounts[1].group("multiplier").lower()]
+    if len(amounts) == 1 and "up to" in text.lower():
+        low = None
+
+    period_match = SALARY_PERIOD.search(text)
+    if period_match:
+        period = PERIODS[next(g for g in period_match.groups() if g).lower()]
+    else:
+        period = "hour" if high < HOURLY_CEILING else "year"
+    per_year = PERIODS_PER_YEAR[period]
+
+    return (
+        ("salary_min", low),
+        ("salary_max", high),
+        ("salary_currency", CURRENCIES[amounts[0].group("currency")]),
+        ("salary_period", period),
+        ("salary_annual_min", low * per_year if low is not None else None),
+        ("salary_annual_max", high * per_year),
+    )
+
+
+def parse_salary(text: str) -> dict:
+    """
+    Split a salary string into typed columns.
+
+    Args:
+        text (str): e.g. "$120,900.00/yr - $258,000.00/yr", "$45/hr", "Up to $200K",
+            "$80K - 90K" (the range end takes the first amount's currency), "€60.000"
+
+    Returns:
+        dict: SALARY_COLUMNS, all None if no amount is found
+    """
+    if not text:
+        return dict(EMPTY_SALARY)
+    return dict(_parse_salary_cached(text))
+
+
+def _publication_datetime(value):
+    if not value:
+        return None
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def normalize_jobs(jobs: list, now: datetime = None) -> list:
+    """
+    Add TYPED_COLUMNS to every job dict of a batch, in place.
+
+    posted_at (ISO 8601, UTC) comes from the relative `posted` / `date_posted`
+    text measured from `now` (scrape time), unless the card's day-precision
+    `publication_date` disagrees with it, in which case the date wins.
+
+    Args:
+        jobs (list[dict]): Parsed postings or search cards
+        now (datetime): Reference time for relative dates (default: now, UTC)
+
+    Returns:
+        list[dict]: The same list
+    """
+    now = (now or datetime.now(timezone.utc)).replace(microsecond=0)
+    posted_cache = {}
+    for job in jobs:
+        publication_date = job.get("publication_date")
+        relative = job.get("posted") or job.get("date_posted")
+        key = (publication_date, relative)
+        if key not in posted_cache:
+            posted_at = _publication_datetime(publication_date)
+            age = parse_age(relative)
+            if age is not None and (posted_at is None or (now - age).date() == posted_at.date()):
+                posted_at = now - age
+            posted_cache[key] = posted_at.isoformat() if posted_at else None
+        job["posted_at"] = posted_cache[key]
+        job.update(_parse_salary_cached(job.get("salary") or ""))
+    return jobs
+
+
+def normalize_job(job: dict, now: datetime = None) -> dict:
+    """`normalize_jobs` for a single posting."""
+    normalize_jobs([job], now)
+    return job
@@ -0,0 +1,87 @@
+"""
+Async token-bucket rate budget for outbound requests.
+
+RateBudget is the in-process bucket. The LinkedIn budget every worker
+process shares is the SQLite-backed `linkedin_budget` of
+shared.utils.coordination, configured by LINKEDIN_REQUESTS_PER_MINUTE
+(default 30) and LINKEDIN_REQUEST_BURST (default 10); requests reach it
+through shared.utils.fetch_scheduler, which decides who goes next.
+"""
+import asyncio
+import os
+import time
+
+LINKEDIN_REQUESTS_PER_MINUTE = float(os.getenv("LINKEDIN_REQUESTS_PER_MINUTE", 30))
+LINKEDIN_REQUEST_BURST = float(os.getenv("LINKEDIN_REQUEST_BURST", 10))
+
+
+class RateBudget:
+    """
+    Token bucket: `rate` tokens per second, holding at most `burst`.
+
+    Waiters are served in arrival order; a waiter that is cancelled gives
+    its place up without consuming tokens.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = rate
+        self.burst = burst
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._lock = None  # Created on first use, inside the running loop
+        self.waited = 0.0  # Total seconds callers spent waiting, for diagnostics
+        self.acquired = 0
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def delay(self, tokens: float = 1) -> float:
+        """Seconds until `tokens` would be available (0 when they are now)."""
+        self._refill()
+        return max(0.0, (tokens - self._tokens) / self.rate)
+
+    def try_acquire(self, tokens: float = 1) -> bool:
+        """Take `tokens` if they are available now, without waiting."""
+        if self.delay(tokens):
+            return False
+        self._tokens -= tokens
+        self.acquired += 1
+        return True
+
+    async def acquire(self, tokens: float = 1) -> float:
+        """
+        Wait until `tokens` are available and take them.
+
+        Returns:
+            float: Seconds spent waiting
+        """
+        if tokens > self.burst:
+            raise ValueError(f"cannot acquire {tokens} tokens from a bucket of {self.burst}")
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        start = time.monotonic()
+        async with self._lock:  # FIFO: later callers queue behind the current waiter
+            while True:
+                wait = self.delay(tokens)
+                if not wait:
+                    break
+                await asyncio.sleep(wait)
+            self._tokens -= tokens
+        waited = time.monotonic() - start
+        self.waited += waited
+        self.acquired += 1
+        return waited
+
+    def snapshot(self) -> dict:
+        self._refill()
+        return {
+            "rate_per_minute": round(self.rate * 60, 3),
+            "burst": self.burst,
+            "available": round(self._tokens, 3),
+            "acquired": self.acquired,
+            "total_wait_seconds": round(self.waited, 3),
+        }
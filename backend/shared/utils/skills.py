@@ -0,0 +1,196 @@
+"""
+Hard/soft skill extraction from job descriptions.
+
+Backed by the bundled shared/data/skills.json (canonical skill -> synonyms).
+All synonyms are compiled once into a word-level Aho-Corasick automaton, so
+tagging a description is one pass over its words no matter how many skills
+the dictionary holds, and a synonym never matches inside a longer word
+("java" does not hit "javascript").
+
+Matching ignores case, which would make skills named after everyday words
+("go above and beyond", "R&D", "Spring internship") hit everywhere. Such a
+skill is written as {"aliases": [...], "case_sensitive": [...]}: its name is
+not a synonym by itself, "aliases" match in any case and "case_sensitive"
+only as written ("Go" but not "go"). The result feeds
+data_formatter.format_jobscan_result through `jobscan_input`.
+"""
+import json
+import os
+import re
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+SKILLS_FILE = Path(__file__).parent.parent / "data" / "skills.json"
+
+# Words, keeping the punctuation skill names are made of: "c++", "c#", ".net", "node.js"
+TOKEN = re.compile(r"\.?[^\W_]+(?:\.[^\W_]+)*[+#]*")
+
+KINDS = ("hard", "soft")
+POOL_MIN_JOBS = 200  # Smaller batches are tagged inline; a process pool costs more to start
+POOL_CHUNK = 64
+
+
+def _tokens(text: str) -> list:
+    return TOKEN.findall(text.casefold())
+
+
+class SkillAutomaton:
+    """
+    Aho-Corasick automaton over word tokens; build through `get_skill_automaton()`.
+
+    State 0 is the root. Each state has a goto table (token -> state), a
+    failure link and the skills whose synonyms end there, including those
+    reached through failure links, so matching never walks the links twice.
+    """
+
+    def __init__(self, data: dict):
+        self.skills = []  # skill id -> (kind, name)
+        self._goto = [{}]
+        self._outputs = [()]
+        for kind in KINDS:
+            for name, synonyms in data[kind].items():
+                skill_id = len(self.skills)
+                self.skills.append((kind, name))
+                if isinstance(synonyms, dict):  # Ambiguous name: explicit aliases only
+                    for alias in synonyms.get("case_sensitive", ()):
+                        self._add(_tokens(alias), (skill_id, tuple(TOKEN.findall(alias))))
+                    synonyms = synonyms.get("aliases", ())
+                else:
+                    synonyms = {name, *synonyms}
+                for synonym in synonyms:
+                    self._add(_tokens(synonym), skill_id)
+        self._fail = [0] * len(self._goto)
+        self._link()
+
+    def _add(self, tokens: list, output):
+        """Add a synonym; `output` is a skill id, or (skill id, tokens as written) for a case-sensitive one."""
+        if not tokens:
+            return
+        state = 0
+        for token in tokens:
+            following = self._goto[state].get(token)
+            if following is None:
+                following = len(self._goto)
+                self._goto[state][token] = following
+                self._goto.append({})
+                self._outputs.append(())
+            state = following
+        if output not in self._outputs[state]:
+            self._outputs[state] += (output,)
+
+    def _link(self):
+        # Breadth-first, so a state's failure target is final before its children use it
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for token, child in self._goto[state].items():
+                queue.append(child)
+                fallback = self._fail[state]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                target = self._goto[fallback].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                extra = [s for s in self._outputs[self._fail[child]] if s not in self._outputs[child]]
+                if extra:
+                    self._outputs[child] += tuple(extra)
+
+    def match(self, text: str) -> dict:
+        """{skill id: [occurrences, first token position]} for every skill in `text`."""
+        goto, fail, outputs = self._goto, self._fail, self._outputs
+        found = {}
+        state = 0
+        tokens = _tokens(text)
+        written = None  # Tokens as written, split only when a case-sensitive synonym matches
+        for position, token in enumerate(tokens):
+            while state and token not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(token, 0)
+            for skill_id in outputs[state]:
+                if skill_id.__class__ is tuple:
+                    skill_id, exact = skill_id
+                    if written is None:
+                        written = TOKEN.findall(text)
+                        if len(written) != len(tokens):  # Case folding changed the words; skip
+                            written = []
+                    if tuple(written[position - len(exact) + 1:position + 1]) != exact:
+                        continue
+                hit = found.get(skill_id)
+                if hit is None:
+                    found[skill_id] = [1, position]
+                else:
+                    hit[0] += 1
+        return found
+
+    def extract(self, text: str) -> dict:
+        """
+        Skills mentioned in `text`, most mentioned first (ties in order of appearance).
+
+        Returns:
+            dict: {"hard_skills": [name, ...], "soft_skills": [name, ...]}
+        """
+        result = {"hard_skills": [], "soft_skills": []}
+        if not text:
+            return result
+        found = self.match(text)
+        for skill_id in sorted(found, key=lambda s: (-found[s][0], found[s][1])):
+            kind, name = self.skills[skill_id]
+            result[f"{kind}_skills"].append(name)
+        return result
+
+
+@lru_cache(maxsize=1)
+def get_skill_automaton() -> SkillAutomaton:
+    """The bundled dictionary, compiled on first use (once per process)."""
+    with open(SKILLS_FILE, encoding="utf-8") as f:
+        return SkillAutomaton(json.load(f))
+
+
+def extract_skills(text: str) -> dict:
+    """{"hard_skills": [...], "soft_skills": [...]} for one description."""
+    return get_skill_automaton().extract(text)
+
+
+def _extract_chunk(texts: list) -> list:
+    automaton = get_skill_automaton()
+    return [automaton.extract(text) for text in texts]
+
+
+def extract_skills_batch(texts: list, workers: int = None) -> list:
+    """
+    `extract_skills` for many descriptions, in input order.
+
+    Batches of POOL_MIN_JOBS or more are spread over a process pool (each
+    worker compiles the automaton once); smaller ones run inline.
+    """
+    texts = list(texts)
+    workers = workers or os.cpu_count() or 1
+    if len(texts) < POOL_MIN_JOBS or workers < 2:
+        return _extract_chunk(texts)
+    chunks = [texts[i:i + POOL_CHUNK] for i in range(0, len(texts), POOL_CHUNK)]
+    with ProcessPoolExecutor(max_workers=min(workers, len(chunks))) as pool:
+        return [result for chunk in pool.map(_extract_chunk, chunks) for result in chunk]
+
+
+def tag_job(job) -> dict:
+    """Set hard_skills/soft_skills on a job (dict or JobRecord) from its description."""
+    if job.get("description"):
+        job.update(extract_skills(job["description"]))
+    return job
+
+
+def tag_jobs(jobs: list, workers: int = None) -> list:
+    """`tag_job` for a batch, extracting in a process pool when the batch is large."""
+    described = [job for job in jobs if job.get("description")]
+    for job, skills in zip(described, extract_skills_batch([job["description"] for job in described], workers)):
+        job.update(skills)
+    return jobs
+
+
+def jobscan_input(skills: dict) -> dict:
+    """
+    Skill lists as the text fields data_formatter.format_jobscan_result reads.
+    Empty kinds are left out so the formatter's "No ... skills found." applies.
+    """
+    return {key: ", ".join(skills[key]) for key in ("hard_skills", "soft_skills") if skills.get(key)}
@@ -0,0 +1,14 @@
+"""
+Where the stores keep their files.
+
+STORAGE_DIR (default backend/storage) moves every database at once: the job
+store and the indexes sharing jobs.db, coordination.db (rate budgets,
+breakers, parsed-result cache, leases) and the work queue. Point it at a
+scratch directory for runs against the stand-in boards, so fake postings
+and injected 429s never reach the production stores:
+    STORAGE_DIR=/tmp/standin-storage LINKEDIN_BASE_URL=http://127.0.0.1:8010/linkedin uvicorn main:app
+"""
+import os
+from pathlib import Path
+
+STORAGE_DIR = Path(os.getenv("STORAGE_DIR", Path(__file__).parent.parent.parent / "storage"))
@@ -0,0 +1,370 @@
+"""
+Durable work queue for scrape tasks (SQLite, storage/work_queue.db).
+
+The API creates a run, enqueues its first tasks (search pages) and streams
+the run's result frames; worker processes (backend/worker.py) claim tasks
+under a lease, execute them and complete them. Completing a task stores its
+result frames and enqueues its follow-up tasks (descriptions of the cards a
+page found) in the same transaction, so a run is finished exactly when it
+has no queued or leased task left.
+
+A worker that dies loses its lease after LEASE_SECONDS and the task is
+claimed again by another worker, up to MAX_ATTEMPTS claims. Follow-up tasks
+carry a dedupe key (the job_id), unique per run, so a card found on two
+pages, or re-produced by a retried page, is only described once.
+
+WORK_QUEUE_DB moves the database, e.g. onto a disk other nodes mount.
+WAL mode needs every process on one host; set WORK_QUEUE_WAL=0 for a
+rollback journal on a network filesystem with working locks.
+"""
+import asyncio
+import json
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections import namedtuple
+from pathlib import Path
+
+from shared.utils.storage import STORAGE_DIR
+
+WORK_QUEUE_DB = Path(os.getenv("WORK_QUEUE_DB", STORAGE_DIR / "work_queue.db"))
+USE_WAL = os.getenv("WORK_QUEUE_WAL", "1") != "0"
+BUSY_TIMEOUT_MS = 10000
+LEASE_SECONDS = 60.0
+MAX_ATTEMPTS = 3
+IDLE_POLL = 0.5  # Seconds a worker slot sleeps when the queue is empty
+RUN_RETENTION = 24 * 3600  # Runs, their tasks and frames are purged this long after creation
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    meta TEXT,
+    created REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tasks (
+    id INTEGER PRIMARY KEY,
+    run_id TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    dedupe_key TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    lease_owner TEXT,
+    lease_expires REAL,
+    error TEXT,
+    UNIQUE (run_id, dedupe_key)
+);
+CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id);
+CREATE INDEX IF NOT EXISTS tasks_run ON tasks (run_id, status);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    run_id TEXT NOT NULL,
+    frame TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS results_run ON results (run_id, id);
+"""
+
+OPEN_STATUSES = ("queued", "leased")
+
+Task = namedtuple("Task", "id run_id kind payload attempts")
+
+
+def _dumps(value) -> str:
+    # Frames may hold JobRecords; to_dict() makes them plain JSON
+    return json.dumps(value, default=lambda o: o.to_dict() if hasattr(o, "to_dict") else str(o))
+
+
+class WorkQueue:
+    """Tasks, leases and result frames of scrape runs; thread-safe, opened lazily."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.RLock()
+        self._conn = None
+        self._pid = None
+
+    def _connect(self):
+        # A forked worker must not reuse its parent's connection
+        if self._conn is None or self._pid != os.getpid():
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(
+                str(self.path), check_same_thread=False, isolation_level=None, timeout=BUSY_TIMEOUT_MS / 1000
+            )
+            if USE_WAL:
+                self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(SCHEMA)
+            self._pid = os.getpid()
+        return self._conn
+
+    def _read(self, sql: str, params: tuple = ()):
+        with self._lock:
+            return self._connect().execute(sql, params).fetchall()
+
+    def _transaction(self, fn):
+        with self._lock:
+            conn = self._connect()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                result = fn(conn)
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+            conn.execute("COMMIT")
+            return result
+
+    @staticmethod
+    def _insert_tasks(conn, run_id: str, tasks) -> int:
+        """Insert (kind, payload, dedupe_key) tuples; duplicates of the run are ignored."""
+        inserted = 0
+        for kind, payload, dedupe_key in tasks:
+            cursor = conn.execute(
+                "INSERT OR IGNORE INTO tasks (run_id, kind, payload, dedupe_key, status) VALUES (?, ?, ?, ?, 'queued')",
+                (run_id, kind, _dumps(payload), dedupe_key),
+            )
+            inserted += cursor.rowcount
+        return inserted
+
+    def create_run(self, tasks, meta: dict = None) -> str:
+        """
+        Start a run with its first tasks.
+
+        Args:
+            tasks (list[tuple]): (kind, payload, dedupe_key) per task
+            meta (dict): Request parameters, for diagnostics
+
+        Returns:
+            str: The run id
+        """
+        run_id = uuid.uuid4().hex
+
+        def create(conn):
+            now = time.time()
+            conn.execute("INSERT INTO runs VALUES (?, 'running', ?, ?)", (run_id, _dumps(meta or {}), now))
+            self._insert_tasks(conn, run_id, tasks)
+            # Purge old runs while holding the lock anyway
+            old = [row[0] for row in conn.execute("SELECT id FROM runs WHERE created < ?", (now - RUN_RETENTION,))]
+            for old_id in old:
+                conn.execute("DELETE FROM tasks WHERE run_id = ?", (old_id,))
+                conn.execute("DELETE FROM results WHERE run_id = ?", (old_id,))
+                conn.execute("DELETE FROM runs WHERE id = ?", (old_id,))
+        self._transaction(create)
+        return run_id
+
+    def claim(self, owner: str, lease: float = LEASE_SECONDS):
+        """
+        Lease a runnable task: queued, or leased by a worker whose lease expired.
+        Runs take turns: the oldest runnable task of the run with the fewest
+        live leases goes first, so one large run cannot fill every worker slot.
+
+        Returns:
+            Task | None: None when nothing is runnable
+        """
+        def take(conn):
+            now = time.time()
+            # Abandoned tasks that used up their attempts fail instead of looping forever
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', error = 'lease expired' "
+                "WHERE status = 'leased' AND lease_expires < ? AND attempts >= ?",
+                (now, MAX_ATTEMPTS),
+            )
+            row = conn.execute(
+                "WITH runnable AS ("
+                "  SELECT run_id, MIN(id) AS first FROM tasks "
+                "  WHERE status = 'queued' OR (status = 'leased' AND lease_expires < ?) GROUP BY run_id"
+                "), busy AS ("
+                "  SELECT run_id, COUNT(*) AS leases FROM tasks "
+                "  WHERE status = 'leased' AND lease_expires >= ? GROUP BY run_id"
+                ") "
+                "SELECT t.id, t.run_id, t.kind, t.payload, t.attempts FROM runnable r "
+                "JOIN tasks t ON t.id = r.first LEFT JOIN busy b ON b.run_id = r.run_id "
+                "ORDER BY COALESCE(b.leases, 0), r.first LIMIT 1",
+                (now, now),
+            ).fetchone()
+            if row is None:
+                return None
+            conn.execute(
+                "UPDATE tasks SET status = 'leased', attempts = attempts + 1, lease_owner = ?, lease_expires = ? "
+                "WHERE id = ?",
+                (owner, now + lease, row[0]),
+            )
+            return Task(row[0], row[1], row[2], json.loads(row[3]), row[4] + 1)
+        return self._transaction(take)
+
+    def heartbeat(self, task_id: int, owner: str, lease: float = LEASE_SECONDS) -> bool:
+        """Extend a lease; False when the task is no longer this owner's."""
+        def extend(conn):
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires = ? WHERE id = ? AND lease_owner = ? AND status = 'leased'",
+                (time.time() + lease, task_id, owner),
+            )
+            return cursor.rowcount == 1
+        return self._transaction(extend)
+
+    def complete(self, task: Task, owner: str, frames=(), follow_ups=()) -> bool:
+        """
+        Finish a task: store its result frames and enqueue its follow-up tasks atomically.
+
+        Returns:
+            bool: False when the lease was lost (the task is someone else's now); nothing is stored
+        """
+        def finish(conn):
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', lease_owner = NULL WHERE id = ? AND lease_owner = ? "
+                "AND status = 'leased'",
+                (task.id, owner),
+            )
+            if cursor.rowcount != 1:
+                return False
+            conn.executemany(
+                "INSERT INTO results (run_id, frame) VALUES (?, ?)", [(task.run_id, _dumps(f)) for f in frames]
+            )
+            if conn.execute("SELECT status FROM runs WHERE id = ?", (task.run_id,)).fetchone() == ("running",):
+                self._insert_tasks(conn, task.run_id, follow_ups)
+            return True
+        return self._transaction(finish)
+
+    def fail(self, task: Task, owner: str, error: str, frame: dict = None) -> bool:
+        """
+        Give a task back after an error: queued again while it has attempts left, else failed.
+
+        Args:
+            frame (dict): Result frame to store when the task fails for good
+
+        Returns:
+            bool: True when the task will be retried
+        """
+        retry = task.attempts < MAX_ATTEMPTS
+
+        def give_back(conn):
+            cursor = conn.execute(
+                "UPDATE tasks SET status = ?, error = ?, lease_owner = NULL WHERE id = ? AND lease_owner = ? "
+                "AND status = 'leased'",
+                ("queued" if retry else "failed", error, task.id, owner),
+            )
+            if cursor.rowcount == 1 and not retry and frame is not None:
+                conn.execute("INSERT INTO results (run_id, frame) VALUES (?, ?)", (task.run_id, _dumps(frame)))
+        self._transaction(give_back)
+        return retry
+
+    def close_run(self, run_id: str, cancelled: bool = False):
+        """
+        Mark a run finished once its stream has ended. A cancelled run drops its
+        queued tasks; leased ones finish but enqueue nothing new.
+        """
+        def close(conn):
+            conn.execute(
+                "UPDATE runs SET status = ? WHERE id = ? AND status = 'running'",
+                ("cancelled" if cancelled else "finished", run_id),
+            )
+            if cancelled:
+                conn.execute("UPDATE tasks SET status = 'cancelled' WHERE run_id = ? AND status = 'queued'", (run_id,))
+        self._transaction(close)
+
+    def results(self, run_id: str, after_id: int = 0, limit: int = 500) -> list:
+        """(result id, frame JSON) of a run after `after_id`, in completion order."""
+        return self._read(
+            "SELECT id, frame FROM results WHERE run_id = ? AND id > ? ORDER BY id LIMIT ?", (run_id, after_id, limit)
+        )
+
+    def run_status(self, run_id: str) -> dict:
+        """Task counts of a run by status, plus "open": queued or leased tasks left."""
+        counts = dict(self._read("SELECT status, COUNT(*) FROM tasks WHERE run_id = ? GROUP BY status", (run_id,)))
+        counts["open"] = sum(counts.get(status, 0) for status in OPEN_STATUSES)
+        return counts
+
+    def snapshot(self) -> dict:
+        now = time.time()
+        tasks = {}
+        for kind, status, count in self._read("SELECT kind, status, COUNT(*) FROM tasks GROUP BY kind, status"):
+            tasks.setdefault(kind, {})[status] = count
+        workers = self._read(
+            "SELECT DISTINCT lease_owner FROM tasks WHERE status = 'leased' AND lease_expires > ?", (now,)
+        )
+        runs = dict(self._read("SELECT status, COUNT(*) FROM runs GROUP BY status"))
+        return {"tasks": tasks, "runs": runs, "busy_workers": sorted(row[0] for row in workers)}
+
+
+async def consume(queue: WorkQueue, handlers: dict, concurrency: int = 1, stop: asyncio.Event = None,
+                  wrap=None) -> int:
+    """
+    Worker loop: `concurrency` slots claim and execute tasks until `stop` is set.
+
+    Args:
+        queue (WorkQueue): Queue to consume
+        handlers (dict): kind -> async fn(payload) returning (frames, follow_ups)
+        concurrency (int): Tasks executed at once by this process
+        stop (asyncio.Event): Set to finish the tasks in hand and return; None runs forever
+        wrap: Optional fn(task) returning a context manager each task runs in
+
+    Returns:
+        int: Tasks completed
+    """
+    stop = stop or asyncio.Event()
+    host = f"{socket.gethostname()}-{os.getpid()}"
+    completed = 0
+
+    async def keep_lease(task: Task, owner: str):
+        while True:
+            await asyncio.sleep(LEASE_SECONDS / 3)
+            try:
+                if not queue.heartbeat(task.id, owner):
+                    return
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Could not renew lease of task {task.id}: {e}")
+
+    async def execute(task: Task, owner: str):
+        handler = handlers.get(task.kind)
+        if handler is None:
+            queue.fail(task, owner, f"no handler for {task.kind!r}")
+            return False
+        heartbeat = asyncio.create_task(keep_lease(task, owner))
+        try:
+            if wrap is not None:
+                with wrap(task):
+                    frames, follow_ups = await handler(task.payload)
+            else:
+                frames, follow_ups = await handler(task.payload)
+        except Exception as e:
+            retry = queue.fail(task, owner, repr(e), frame={
+                "status": "progress",
+                "message": f"⚠️ {task.kind} task failed after {task.attempts} attempts: {e}",
+            })
+            print(f"⚠️ Task {task.id} ({task.kind}) failed{', will retry' if retry else ''}: {e}")
+            return False
+        finally:
+            heartbeat.cancel()
+        return queue.complete(task, owner, frames, follow_ups)
+
+    async def slot(index: int):
+        nonlocal completed
+        owner = f"{host}-{index}"
+        while not stop.is_set():
+            try:
+                task = queue.claim(owner)
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Work queue unavailable: {e}")
+                task = None
+            if task is None:
+                # Jitter so idle slots of many workers don't poll in lockstep
+                try:
+                    await asyncio.wait_for(stop.wait(), IDLE_POLL * random.uniform(0.5, 1.5))
+                except asyncio.TimeoutError:
+                    pass
+                continue
+            try:
+                if await execute(task, owner):
+                    completed += 1
+            except (sqlite3.Error, OSError) as e:
+                print(f"⚠️ Work queue unavailable, task {task.id} goes back after its lease: {e}")
+
+    await asyncio.gather(*(slot(i) for i in range(concurrency)))
+    return completed
+
+
+# Singleton
+work_queue = WorkQueue(WORK_QUEUE_DB)
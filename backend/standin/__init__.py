@@ -0,0 +1,9 @@
+"""
+Stand-in job boards for local runs and load tests: a small FastAPI app that
+serves search and job pages with the markup the real boards use, filled with
+deterministic fake postings (see standin.postings), with configurable
+latency and injected 429/999 answers (see standin.faults). Point the
+scrapers at it with their base-URL settings:
+    LINKEDIN_BASE_URL=http://127.0.0.1:8010/linkedin
+    INDEED_BASE_URL=http://127.0.0.1:8010/indeed
+"""
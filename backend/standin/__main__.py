@@ -0,0 +1,19 @@
+"""
+Run the stand-in job boards. From backend/:
+    python -m standin [--port 8010]
+"""
+import argparse
+
+
+def main():
+    import uvicorn  # type: ignore
+
+    arg_parser = argparse.ArgumentParser(description="Serve the stand-in job boards.")
+    arg_parser.add_argument("--host", default="127.0.0.1")
+    arg_parser.add_argument("--port", type=int, default=8010)
+    args = arg_parser.parse_args()
+    uvicorn.run("standin.app:app", host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+The stand-in app: one router per board, mounted under the board's name, and
+the fault-injection controls (see standin.faults).
+"""
+from fastapi import Body, FastAPI, HTTPException
+
+from standin import indeed, linkedin
+from standin.faults import faults
+
+BOARDS = {"indeed": indeed.router, "linkedin": linkedin.router}
+
+app = FastAPI(title="Stand-in job boards")
+for board, router in BOARDS.items():
+    app.include_router(router, prefix=f"/{board}")
+
+
+@app.get("/")
+async def health():
+    return {"status": "ok", "boards": list(BOARDS)}
+
+
+@app.get("/control")
+async def get_control():
+    return {"status": "ok", **faults.snapshot()}
+
+
+@app.put("/control")
+async def put_control(changes: dict = Body(...)):
+    """Change latency, error injection or the rate limit, e.g. {"errors": {"429": 0.1}, "latency_ms": 200}."""
+    try:
+        faults.update(changes)
+    except (TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return {"status": "ok", **faults.snapshot()}
+
+
+@app.get("/stats")
+async def get_stats():
+    """Responses served per board and status since start (or the last reset)."""
+    return {"status": "ok", "boards": faults.stats()}
+
+
+@app.delete("/stats")
+async def reset_stats():
+    faults.counts.clear()
+    return {"status": "ok"}
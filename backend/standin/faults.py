@@ -0,0 +1,133 @@
+"""
+Latency and injected failures of the stand-in boards.
+
+Every board request first goes through `faults.apply(board)`: it waits the
+configured latency plus jitter, then may answer with an injected error
+instead of the page:
+
+- errors: status -> probability per request, e.g. {"429": 0.05, "999": 0.02}
+  (999 is LinkedIn's "request denied", 403 Indeed's bot check);
+- max_rps: a per-board rate limit; requests beyond it get 429, as a real
+  board would answer a client that ignores its budget.
+
+429 answers carry Retry-After: the configured retry_after, or the wait until
+the rate limit has room again. Settings start from the environment
+(STANDIN_LATENCY_MS, STANDIN_JITTER_MS, STANDIN_ERRORS="429:0.05,999:0.02",
+STANDIN_MAX_RPS, STANDIN_RETRY_AFTER) and change at runtime through
+PUT /control; GET /stats counts responses per board and status.
+"""
+import asyncio
+import math
+import os
+import random
+import time
+from collections import Counter, defaultdict
+
+from fastapi.responses import PlainTextResponse
+
+ERROR_BODIES = {
+    403: "Blocked",
+    429: "Too Many Requests",
+    999: "Request denied",
+}
+
+
+def parse_errors(value: str) -> dict:
+    """"429:0.05,999:0.02" -> {429: 0.05, 999: 0.02}"""
+    errors = {}
+    for item in (value or "").split(","):
+        if item.strip():
+            status, _, rate = item.partition(":")
+            errors[int(status)] = float(rate)
+    return errors
+
+
+class Faults:
+    def __init__(self):
+        self.latency_ms = float(os.getenv("STANDIN_LATENCY_MS", 0))
+        self.jitter_ms = float(os.getenv("STANDIN_JITTER_MS", 0))
+        self.errors = parse_errors(os.getenv("STANDIN_ERRORS", ""))
+        self.max_rps = float(os.getenv("STANDIN_MAX_RPS", 0))  # 0: no rate limit
+        self.retry_after = float(os.getenv("STANDIN_RETRY_AFTER", 0))  # 0: until the limit has room
+        self._buckets = {}  # board -> (tokens, updated)
+        self.counts = defaultdict(Counter)  # board -> status -> responses
+
+    def update(self, changes: dict):
+        """
+        Change settings; unknown keys and invalid values raise ValueError.
+        "errors" replaces the whole map; keys are statuses as strings or ints.
+        """
+        settings = {}
+        for key, value in changes.items():
+            if key == "errors":
+                settings[key] = {int(status): float(rate) for status, rate in (value or {}).items()}
+                if any(not 0 <= rate <= 1 for rate in settings[key].values()):
+                    raise ValueError("Error rates must be between 0 and 1")
+            elif key in ("latency_ms", "jitter_ms", "max_rps", "retry_after"):
+                settings[key] = float(value)
+                if settings[key] < 0:
+                    raise ValueError(f"{key} must not be negative")
+            else:
+                raise ValueError(f"Unknown setting {key!r}")
+        for key, value in settings.items():
+            setattr(self, key, value)
+        if "max_rps" in settings:
+            self._buckets.clear()
+
+    def snapshot(self) -> dict:
+        return {
+            "latency_ms": self.latency_ms,
+            "jitter_ms": self.jitter_ms,
+            "errors": {str(status): rate for status, rate in self.errors.items()},
+            "max_rps": self.max_rps,
+            "retry_after": self.retry_after,
+        }
+
+    def stats(self) -> dict:
+        return {board: {str(status): n for status, n in counts.items()} for board, counts in self.counts.items()}
+
+    def _rate_limited(self, board: str) -> float:
+        """0 if the request fits the board's rate limit, else seconds until it would."""
+        if not self.max_rps:
+            return 0
+        now = time.monotonic()
+        burst = max(1.0, self.max_rps)
+        tokens, updated = self._buckets.get(board, (burst, now))
+        tokens = min(burst, tokens + (now - updated) * self.max_rps)
+        if tokens >= 1:
+            self._buckets[board] = (tokens - 1, now)
+            return 0
+        self._buckets[board] = (tokens, now)
+        return (1 - tokens) / self.max_rps
+
+    async def apply(self, board: str):
+        """
+        Delay one request and maybe fail it.
+
+        Returns:
+            Response | None: The injected error response, or None to serve the page
+        """
+        delay = (self.latency_ms + random.uniform(0, self.jitter_ms)) / 1000
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+        status, retry_after = None, self.retry_after
+        wait = self._rate_limited(board)
+        if wait:
+            status, retry_after = 429, self.retry_after or wait
+        else:
+            roll = random.random()
+            for error_status, rate in self.errors.items():
+                if roll < rate:
+                    status = error_status
+                    break
+                roll -= rate
+        self.counts[board][status or 200] += 1
+        if status is None:
+            return None
+        headers = {"Retry-After": str(max(1, math.ceil(retry_after or 1)))} if status == 429 else None
+        return PlainTextResponse(ERROR_BODIES.get(status, "Error"), status_code=status, headers=headers)
+
+
+# Singleton
+faults = Faults()
@@ -0,0 +1,105 @@
+"""
+Stand-in for Indeed: /jobs (search results) and /viewjob (job page), with the
+markup of platforms/indeed/fixtures that the Indeed parsers read.
+"""
+from html import escape
+
+from fastapi import APIRouter, Query
+from fastapi.responses import HTMLResponse
+
+from standin import postings
+from standin.faults import faults
+
+PAGE_SIZE = 10
+
+router = APIRouter()
+
+
+def _location_line(posting: dict) -> str:
+    if posting["mode"] == "Remote":
+        return f"Remote in {posting['location']}"
+    if posting["mode"] == "Hybrid":
+        return f"Hybrid work in {posting['location']}"
+    return posting["location"]
+
+
+def _salary(posting: dict) -> str:
+    low, high = posting["pay"]
+    return f"${low:,} - ${high:,} a year"
+
+
+def _posted(posting: dict) -> str:
+    days = posting["age_days"]
+    if days == 0:
+        return "Just posted"
+    if days > 30:
+        return "Posted 30+ days ago"
+    return f"Posted {days} day{'s' if days > 1 else ''} ago"
+
+
+def render_card(posting: dict) -> str:
+    jk, title = posting["id"], escape(posting["title"])
+    metadata = ""
+    if posting["pay"]:
+        metadata += (
+            '<div class="metadata salary-snippet-container css-5zy3wz eu4oa1w0">'
+            f'<div data-testid="attribute_snippet_testid" class="css-1cvo3fd eu4oa1w0">{_salary(posting)}</div></div>'
+        )
+    metadata += (
+        '<div class="metadata css-5zy3wz eu4oa1w0">'
+        f'<div data-testid="attribute_snippet_testid" class="css-1cvo3fd eu4oa1w0">{posting["schedule"]}</div></div>'
+    )
+    return f"""
+<li class="css-5lfssm eu4oa1w0"><div class="cardOutline tapItem result job_{jk}"><div class="job_seen_beacon">
+<table class="mainContentTable" role="presentation"><tbody><tr><td class="resultContent">
+<h2 class="jobTitle"><a id="job_{jk}" data-jk="{jk}" class="jcs-JobTitle css-1baag51 eu4oa1w0" href="/rc/clk?jk={jk}&amp;vjs=3" role="button"><span title="{title}" id="jobTitle-{jk}">{title}</span></a></h2>
+<div class="company_location"><div><span data-testid="company-name">{escape(posting["company"])}</span>
+<div data-testid="text-location">{escape(_location_line(posting))}</div></div></div>
+<div class="heading6 tapItem-gutter metadataContainer">{metadata}</div>
+</td></tr></tbody></table>
+<table class="jobCardShelfContainer" role="presentation"><tbody><tr class="underShelfFooter"><td><div class="heading6 tapItem-gutter result-footer">
+<span data-testid="myJobsStateDate"><span>{_posted(posting)}</span></span>
+</div></td></tr></tbody></table>
+</div></div></li>"""
+
+
+def render_search_page(cards: list) -> str:
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>Jobs | Indeed.com</title></head>
+<body><main><div id="mosaic-provider-jobcards" class="mosaic mosaic-provider-jobcards"><ul class="css-zu9cdh eu4oa1w0">{"".join(render_card(card) for card in cards)}
+</ul></div></main></body></html>
+"""
+
+
+def render_job_page(posting: dict) -> str:
+    salary = f'<span class="css-19j1a75 eu4oa1w0">{_salary(posting)}</span>' if posting["pay"] else ""
+    paragraphs = "".join(f"<p>{escape(line)}</p>" for line in posting["description"])
+    return f"""<!DOCTYPE html>
+<html lang="en"><head><meta charset="utf-8"><title>{escape(posting["title"])} - Indeed.com</title>
+<link rel="canonical" href="https://www.indeed.com/viewjob?jk={posting["id"]}"></head>
+<body class="jobsearch-ViewJobPage"><div class="jobsearch-JobComponent">
+<h1 class="jobsearch-JobInfoHeader-title" data-testid="jobsearch-JobInfoHeader-title"><span>{escape(posting["title"])}</span><span><span> - job post</span></span></h1>
+<div data-company-name="true" data-testid="inlineHeader-companyName"><span><a href="https://www.indeed.com/cmp/x">{escape(posting["company"])}</a></span></div>
+<div data-testid="inlineHeader-companyLocation"><div>{escape(_location_line(posting))}</div></div>
+<div id="salaryInfoAndJobType">{salary}<span class="css-k5flys eu4oa1w0"> -  {posting["schedule"]}</span></div>
+<div id="jobDescriptionText" class="jobsearch-JobComponent-description"><div>{paragraphs}</div></div>
+<div><span>{_posted(posting)}</span></div>
+</div></body></html>
+"""
+
+
+@router.get("/jobs", response_class=HTMLResponse)
+async def search(q: str = "", l: str = "", start: int = Query(0, ge=0)):
+    fault = await faults.apply("indeed")
+    if fault is not None:
+        return fault
+    listed = postings.search("indeed", q, l)
+    return render_search_page(listed[start:start + PAGE_SIZE])
+
+
+@router.get("/viewjob", response_class=HTMLResponse)
+async def view_job(jk: str):
+    fault = await faults.apply("indeed")
+    if fault is not None:
+        return fault
+    return render_job_page(postings.posting("indeed", jk))
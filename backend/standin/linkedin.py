@@ -0,0 +1,126 @@
+"""
+Stand-in for LinkedIn's guest job API, replaying the recorded pages in
+platforms/linkedin/fixtures with each posting's values in place of the
+recorded job's:
+
+- /jobs-guest/jobs/api/seeMoreJobPostings/search: a fragment of search
+  cards (<li>), empty past the last page, as the real endpoint answers;
+- /jobs-guest/jobs/api/jobPosting/{job_id} and /jobs/view/{slug}-{job_id}:
+  the job page. Card links point back at the stand-in, so scrapers that
+  follow them (bulk-scrape) stay on it.
+"""
+import re
+from datetime import date, timedelta
+from html import escape
+from pathlib import Path
+
+from fastapi import APIRouter, Query, Request
+from fastapi.responses import HTMLResponse
+
+from standin import postings
+from standin.faults import faults
+
+FIXTURES = Path(__file__).parent.parent / "platforms" / "linkedin" / "fixtures"
+PAGE_SIZE = 10
+
+# The recorded job's values, replaced per posting
+RECORDED_ID = "4307024582"
+RECORDED_SLUG = "software-engineer-ii-at-microsoft"
+RECORDED = {
+    "title": "Software Engineer II",
+    "company": "Microsoft",
+    "company_slug": "company/microsoft",
+    "location": "Redmond, WA",
+    "age": "5 days ago",
+    "date": "2026-10-14",
+    "salary": "$120,900.00/yr - $258,000.00/yr",
+    "applicants": "Over 200 applicants",
+    "schedule": ">Full-time<",
+}
+JOB_VIEW_URL = "https://www.linkedin.com/jobs/view/"
+DESCRIPTION_MARKUP = re.compile(r'(<div class="show-more-less-html__markup[^>]*>).*?(\s*</div>)', re.DOTALL)
+COMPENSATION = re.compile(r'\s*<div class="compensation__salary-range">.*?</div>\s*</div>', re.DOTALL)
+SLUG_CHARS = re.compile(r'[^a-z0-9]+')
+
+router = APIRouter()
+_templates = {}
+
+
+def _template(name: str) -> str:
+    """Recorded page: the whole job page, or the first card of the search page."""
+    if name not in _templates:
+        page = (FIXTURES / f"{name}.html").read_text(encoding="utf-8")
+        _templates[name] = page[:page.index("</li>") + len("</li>")] if name == "search_page" else page
+    return _templates[name]
+
+
+def _slug(text: str) -> str:
+    return SLUG_CHARS.sub("-", text.lower()).strip("-")
+
+
+def _age(days: int) -> str:
+    if days == 0:
+        return "12 hours ago"
+    if days < 7:
+        return f"{days} day{'s' if days > 1 else ''} ago"
+    weeks = days // 7
+    return f"{weeks} week{'s' if weeks > 1 else ''} ago"
+
+
+def _fill(template: str, posting: dict, job_view_url: str = JOB_VIEW_URL) -> str:
+    slug = _slug(f"{posting['title']} at {posting['company']}")
+    applicants = posting["applicants"]
+    values = {
+        "title": escape(posting["title"]),
+        "company": escape(posting["company"]),
+        "company_slug": "company/" + _slug(posting["company"]),
+        "location": posting["location"],
+        "age": _age(posting["age_days"]),
+        "date": (date.today() - timedelta(days=posting["age_days"])).isoformat(),
+        "salary": "${:,}.00/yr - ${:,}.00/yr".format(*posting["pay"]) if posting["pay"] else "",
+        "applicants": "Over 200 applicants" if applicants > 200 else f"{applicants} applicants",
+        "schedule": f">{posting['schedule']}<",
+    }
+    page = template.replace(JOB_VIEW_URL + RECORDED_SLUG, job_view_url + slug).replace(RECORDED_ID, posting["id"])
+    for field, recorded in RECORDED.items():
+        page = page.replace(recorded, values[field])
+    return page
+
+
+def render_search_page(listed: list, job_view_url: str) -> str:
+    return "\n".join(_fill(_template("search_page"), posting, job_view_url) for posting in listed)
+
+
+def render_job_page(posting: dict) -> str:
+    page = _template("job_posting")
+    description = "<br><br>".join(escape(line) for line in posting["description"])
+    page = DESCRIPTION_MARKUP.sub(lambda m: m.group(1) + description + m.group(2), page, count=1)
+    if not posting["pay"]:
+        page = COMPENSATION.sub("", page, count=1)
+    return _fill(page, posting)
+
+
+@router.get("/jobs-guest/jobs/api/seeMoreJobPostings/search", response_class=HTMLResponse)
+async def search(request: Request, keywords: str = "", location: str = "", start: int = Query(0, ge=0)):
+    fault = await faults.apply("linkedin")
+    if fault is not None:
+        return fault
+    listed = postings.search("linkedin", keywords, location)
+    base_url = str(request.url).split("/jobs-guest/", 1)[0]
+    return render_search_page(listed[start:start + PAGE_SIZE], f"{base_url}/jobs/view/")
+
+
+@router.get("/jobs-guest/jobs/api/jobPosting/{job_id}", response_class=HTMLResponse)
+async def job_posting(job_id: str):
+    fault = await faults.apply("linkedin")
+    if fault is not None:
+        return fault
+    return render_job_page(postings.posting("linkedin", job_id))
+
+
+@router.get("/jobs/view/{slug}", response_class=HTMLResponse)
+async def job_view(slug: str):
+    fault = await faults.apply("linkedin")
+    if fault is not None:
+        return fault
+    return render_job_page(postings.posting("linkedin", slug.rsplit("-", 1)[-1]))
@@ -0,0 +1,137 @@
+"""
+Deterministic fake postings for the stand-in job boards.
+
+Every (keyword, location) search has one pool of postings, seeded by the
+search itself, so repeated runs see the same jobs. Each board lists its own
+share of the pool in its own order under its own ids, so a cross-platform
+search meets the same job on several boards, as it would for real.
+"""
+import hashlib
+import random
+from collections import OrderedDict
+
+POOL_SIZE = 60
+BOARD_SHARE = 0.7  # Fraction of the pool each board lists
+KNOWN_POSTINGS = 50_000  # Ids remembered for job-page requests
+
+LEVELS = ("", "", "Senior ", "Staff ", "Principal ", "Lead ", "Junior ")
+ROLES = (
+    "Software Engineer", "Backend Engineer", "Full Stack Engineer", "Data Engineer",
+    "Machine Learning Engineer", "Site Reliability Engineer", "Platform Engineer",
+    "Frontend Engineer", "DevOps Engineer", "Security Engineer",
+)
+TEAMS = (
+    "Payments", "Search", "Growth", "Infrastructure", "Identity", "Billing", "Data Platform",
+    "Mobile", "Checkout", "Recommendations", "Observability", "Developer Tools", "Ads",
+    "Messaging", "Storage", "Maps", "Fraud", "Onboarding", "Analytics", "Core Services",
+)
+COMPANIES = (
+    "Northwind Labs", "Contoso", "Fabrikam Health", "Adatum", "Tailspin Toys", "Litware",
+    "Wide World Importers", "Proseware", "Coho Winery", "Woodgrove Bank", "Alpine Ski House",
+    "Blue Yonder Airlines", "Trey Research", "Fourth Coffee", "Lamna Healthcare",
+)
+CITIES = (
+    "Seattle, WA", "Redmond, WA", "Austin, TX", "San Francisco, CA", "New York, NY",
+    "Boston, MA", "Denver, CO", "Chicago, IL", "Atlanta, GA", "Portland, OR",
+)
+SCHEDULES = ("Full-time", "Full-time", "Full-time", "Contract", "Part-time")
+MODES = (None, None, "Remote", "Hybrid")
+SKILLS = (
+    "Python", "Go", "Java", "TypeScript", "React", "PostgreSQL", "Redis", "Kafka",
+    "Kubernetes", "Docker", "AWS", "GCP", "Terraform", "Spark", "PyTorch", "CI/CD",
+)
+SOFT_SKILLS = ("communication", "collaboration", "mentoring", "ownership", "problem solving")
+# Sentence variants; a posting picks one of each, so descriptions are not near duplicates of each other
+SENTENCES = (
+    ("{company} is hiring a {title} for the {team} team.",
+     "Join {company} as a {title} and help the {team} group ship faster.",
+     "The {team} team at {company} is growing and needs a {title}.",
+     "As a {title} on {team} you will shape how {company} serves its customers."),
+    ("You will design, build and operate services written in {s0} and {s1}.",
+     "Most of our code is {s0}; some older services still run on {s1}.",
+     "Day to day you will work in {s0}, with {s1} for the parts that need it.",
+     "Expect to write a lot of {s0} and review plenty of {s1}."),
+    ("Our data lives in {s2}, and we deploy with {s3}.",
+     "We run on {s3} and keep state in {s2}.",
+     "Production traffic flows through {s2} before it reaches services deployed on {s3}.",
+     "{s3} pipelines ship every change, and {s2} holds everything we cannot lose."),
+    ("Experience with {s4} is a plus but not required.",
+     "Bonus points if you have used {s4} in production.",
+     "Knowing {s4} will help you get going in your first month.",
+     "We will teach you {s4} if you have not used it before."),
+    ("We care about {soft0} and {soft1} as much as code.",
+     "The team values {soft0}, {soft1} and honest code review.",
+     "Good {soft0} and steady {soft1} matter more to us than any single technology.",
+     "You will be trusted with {soft0} from day one and expected to show {soft1}."),
+    ("The team ships {n} times a week and keeps on-call quiet.",
+     "We are {n} engineers today and plan to double next year.",
+     "Our roadmap for the next {n} months is public inside the company.",
+     "New hires pair with a mentor for their first {n} weeks."),
+)
+_known = OrderedDict()  # (board, id) -> posting
+
+
+def _rng(*parts) -> random.Random:
+    return random.Random(hashlib.sha256("\x1f".join(map(str, parts)).encode()).digest())
+
+
+def board_id(board: str, key: str) -> str:
+    """Id of a posting on one board: numeric like LinkedIn's, 16 hex digits like Indeed's jk."""
+    digest = hashlib.sha1(f"{board}\x1f{key}".encode()).hexdigest()
+    return str(4_000_000_000 + int(digest[:8], 16) % 1_000_000_000) if board == "linkedin" else digest[:16]
+
+
+def _city(location: str):
+    """The known city a searched location names ("seattle" -> "Seattle, WA"), or None."""
+    wanted = (location or "").casefold().strip()
+    return next((city for city in CITIES if wanted and city.casefold().startswith(wanted)), None)
+
+
+def make_posting(rng: random.Random, key: str, location: str = None) -> dict:
+    role, team = rng.choice(ROLES), rng.choice(TEAMS)
+    title = f"{rng.choice(LEVELS)}{role} - {team}"
+    company = rng.choice(COMPANIES)
+    skills = rng.sample(SKILLS, 5)
+    soft = rng.sample(SOFT_SKILLS, 2)
+    low = rng.randrange(90, 200) * 1000
+    city = _city(location)
+    fields = dict(company=company, title=title, team=team, n=rng.randrange(2, 12),
+                  soft0=soft[0], soft1=soft[1], **{f"s{i}": skill for i, skill in enumerate(skills)})
+    return {
+        "key": key,
+        "title": title,
+        "company": company,
+        "location": city if city and rng.random() < 0.6 else rng.choice(CITIES),
+        "mode": rng.choice(MODES),
+        "schedule": rng.choice(SCHEDULES),
+        "pay": (low, low + rng.randrange(10, 60) * 1000) if rng.random() < 0.6 else None,  # Yearly, USD
+        "age_days": rng.randrange(0, 40),
+        "applicants": rng.randrange(1, 400),
+        "description": [rng.choice(variants).format(**fields) for variants in SENTENCES],
+    }
+
+
+def search(board: str, keyword: str, location: str) -> list:
+    """
+    Postings `board` lists for a search, in the board's order, each with its
+    "id" on that board. Listed postings are remembered for `posting()`.
+    """
+    pool_rng = _rng("pool", keyword.casefold(), location.casefold())
+    pool = [make_posting(pool_rng, f"{keyword}|{location}|{i}", location) for i in range(POOL_SIZE)]
+    board_rng = _rng(board, keyword.casefold(), location.casefold())
+    listed = [dict(p, id=board_id(board, p["key"])) for p in pool if board_rng.random() < BOARD_SHARE]
+    board_rng.shuffle(listed)
+    for posting in listed:
+        _known[(board, posting["id"])] = posting
+        _known.move_to_end((board, posting["id"]))
+    while len(_known) > KNOWN_POSTINGS:
+        _known.popitem(last=False)
+    return listed
+
+
+def posting(board: str, posting_id: str) -> dict:
+    """A posting by its board id; ids never listed get a posting made up from the id."""
+    found = _known.get((board, posting_id))
+    if found is not None:
+        return found
+    return dict(make_posting(_rng(board, posting_id), posting_id), id=posting_id)
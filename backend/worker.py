@@ -0,0 +1,71 @@
+"""
+Scrape worker: executes the tasks the API puts on the work queue.
+
+Run from backend/, on this host or any node that sees the same
+WORK_QUEUE_DB (see shared.utils.work_queue):
+    python worker.py [--processes 4] [--concurrency 2]
+
+Each process claims tasks with --concurrency slots. All processes share the
+LinkedIn rate budget and circuit breaker in storage/coordination.db, and
+each run is one fair-share client of the bulk class, so concurrent runs
+split the budget evenly. Ctrl+C / SIGTERM finishes the tasks in hand; a
+worker killed outright loses its leases and its tasks are retried elsewhere.
+"""
+import argparse
+import asyncio
+import multiprocessing
+import signal
+from pathlib import Path
+
+from dotenv import load_dotenv  # type: ignore
+
+# Load environment variables from .env file
+env_path = Path(__file__).parent.parent / ".env"
+load_dotenv(dotenv_path=env_path)
+
+from platforms.linkedin.scrapers.queue_tasks import HANDLERS
+from shared.utils.fetch_scheduler import fetch_context
+from shared.utils.work_queue import consume, work_queue
+
+
+def run_context(task):
+    """Requests of a task count against its run's fair share of the bulk class."""
+    return fetch_context("bulk", f"run-{task.run_id}")
+
+
+async def serve(concurrency: int):
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+    print(f"👷 Worker ready ({concurrency} slots) on {work_queue.path}")
+    completed = await consume(work_queue, HANDLERS, concurrency, stop=stop, wrap=run_context)
+    print(f"👋 Worker stopped after {completed} tasks")
+
+
+def run_process(concurrency: int):
+    asyncio.run(serve(concurrency))
+
+
+def main():
+    arg_parser = argparse.ArgumentParser(description="Execute queued scrape tasks.")
+    arg_parser.add_argument("--processes", type=int, default=1, help="Worker processes to start")
+    arg_parser.add_argument("--concurrency", type=int, default=2, help="Tasks in flight per process")
+    args = arg_parser.parse_args()
+
+    if args.processes == 1:
+        run_process(args.concurrency)
+        return
+    processes = [multiprocessing.Process(target=run_process, args=(args.concurrency,)) for _ in range(args.processes)]
+    for process in processes:
+        process.start()
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:  # Children got the SIGINT too and are finishing their tasks
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()